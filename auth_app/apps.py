@@ -5,4 +5,8 @@ from django.apps import AppConfig
 class AuthAppConfig(AppConfig):
     """Configuration for auth_app."""
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'auth_app'
\ No newline at end of file
+    name = 'auth_app'
+
+    def ready(self):
+        """Connect signal handlers and register system checks."""
+        from auth_app import checks, signals  # noqa: F401
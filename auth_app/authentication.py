@@ -0,0 +1,135 @@
+"""Token authentication backed by an in-process LRU cache."""
+import copy
+import threading
+import time
+from collections import OrderedDict
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.authentication import TokenAuthentication
+
+SHARED_CACHE_KEY = 'auth:token:{}'
+
+DEFAULTS = {
+    'MAX_SIZE': 10000,
+    'TTL': 5,
+    'SHARED': False,
+}
+
+
+def get_token_cache_settings():
+    """Return token cache settings merged with defaults."""
+    return {**DEFAULTS, **getattr(settings, 'KANMIND_TOKEN_CACHE', {})}
+
+
+class TokenCache:
+    """Thread-safe LRU with TTL mapping token keys to tokens and users."""
+
+    def __init__(self):
+        """Create an empty cache."""
+        self._entries = OrderedDict()
+        self._keys_by_user = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return the cached token for key or None.
+
+        With the shared cache enabled a local hit is only trusted while
+        the shared entry still exists, so evictions made by other
+        processes take effect on their next request.
+        """
+        config = get_token_cache_settings()
+        shared_key = SHARED_CACHE_KEY.format(key)
+        now = time.monotonic()
+        with self._lock:
+            token = None
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, token = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                else:
+                    token = None
+                    self._discard(key)
+        if not config['SHARED']:
+            return token
+        if token is not None:
+            if cache.has_key(shared_key):
+                return token
+            with self._lock:
+                self._discard(key)
+            return None
+        token = cache.get(shared_key)
+        if token is not None:
+            self._store(key, token, config)
+        return token
+
+    def set(self, key, token):
+        """Cache token (with its user loaded) under key."""
+        config = get_token_cache_settings()
+        self._store(key, token, config)
+        if config['SHARED']:
+            cache.set(SHARED_CACHE_KEY.format(key), token, config['TTL'])
+
+    def _store(self, key, token, config):
+        """Insert token into the local LRU, evicting the oldest entry."""
+        with self._lock:
+            self._discard(key)
+            self._entries[key] = (time.monotonic() + config['TTL'], token)
+            self._keys_by_user.setdefault(token.user_id, set()).add(key)
+            while len(self._entries) > config['MAX_SIZE']:
+                self._discard(next(iter(self._entries)))
+
+    def _discard(self, key):
+        """Remove key from the local LRU; caller holds the lock."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        user_id = entry[1].user_id
+        keys = self._keys_by_user.get(user_id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_user[user_id]
+
+    def delete(self, key):
+        """Evict a single token key locally and from the shared cache."""
+        with self._lock:
+            self._discard(key)
+        if get_token_cache_settings()['SHARED']:
+            cache.delete(SHARED_CACHE_KEY.format(key))
+
+    def delete_user(self, user_id, keys=()):
+        """Evict every cached token belonging to user_id."""
+        with self._lock:
+            keys = set(keys) | self._keys_by_user.get(user_id, set())
+            for key in list(keys):
+                self._discard(key)
+        if get_token_cache_settings()['SHARED'] and keys:
+            cache.delete_many([SHARED_CACHE_KEY.format(k) for k in keys])
+
+    def clear(self):
+        """Remove all locally cached tokens."""
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_user.clear()
+
+    def __len__(self):
+        """Return number of locally cached tokens."""
+        return len(self._entries)
+
+
+token_cache = TokenCache()
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """Drop-in TokenAuthentication that skips the DB on cache hits."""
+
+    def authenticate_credentials(self, key):
+        """Return (user, token) from the cache or the database."""
+        token = token_cache.get(key)
+        if token is None:
+            user, token = super().authenticate_credentials(key)
+            token_cache.set(key, token)
+            return user, token
+        token = copy.copy(token)
+        return copy.copy(token.user), token
@@ -0,0 +1,22 @@
+"""System checks for auth_app settings."""
+from django.core.checks import Error, Tags, register
+from auth_app.authentication import get_token_cache_settings
+from core.checks import MAX_LOCAL_TTL, cache_is_shared
+
+
+@register(Tags.caches, Tags.security)
+def check_token_cache(app_configs, **kwargs):
+    """Reject long token cache TTLs that other processes cannot evict."""
+    config = get_token_cache_settings()
+    if config['TTL'] <= MAX_LOCAL_TTL:
+        return []
+    if config['SHARED'] and cache_is_shared():
+        return []
+    return [Error(
+        f'KANMIND_TOKEN_CACHE TTL is longer than {MAX_LOCAL_TTL}s without '
+        'a shared cache, so deleted tokens and deactivated users stay '
+        'authenticated in other processes until it expires.',
+        hint="Set 'SHARED': True with a shared default cache backend "
+             '(e.g. Redis), or lower the TTL.',
+        id='auth_app.E001',
+    )]
@@ -0,0 +1,58 @@
+"""Benchmark stock and cached token authentication."""
+import json
+import time
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+from auth_app.authentication import CachedTokenAuthentication, token_cache
+from auth_app.models import User
+
+
+class Command(BaseCommand):
+    """Compare per-request cost of token authentication backends."""
+
+    help = 'Benchmark TokenAuthentication against CachedTokenAuthentication.'
+
+    def add_arguments(self, parser):
+        """Add iteration count argument."""
+        parser.add_argument('--iterations', type=int, default=2000)
+
+    def handle(self, *args, **options):
+        """Run both backends against a throwaway token and print JSON."""
+        iterations = options['iterations']
+        with transaction.atomic():
+            user = User.objects.create_user(
+                email='bench-auth@kanmind.local',
+                fullname='Bench',
+                password=None
+            )
+            token = Token.objects.create(user=user)
+            token_cache.clear()
+            results = {
+                'iterations': iterations,
+                'stock': self._run(TokenAuthentication(), token.key,
+                                   iterations),
+                'cached': self._run(CachedTokenAuthentication(), token.key,
+                                    iterations),
+            }
+            transaction.set_rollback(True)
+        token_cache.clear()
+        results['speedup'] = round(
+            results['stock']['us_per_call']
+            / max(results['cached']['us_per_call'], 1e-9), 1
+        )
+        self.stdout.write(json.dumps(results, indent=2))
+
+    def _run(self, backend, key, iterations):
+        """Return timing and query count for one backend."""
+        with CaptureQueriesContext(connection) as queries:
+            start = time.perf_counter()
+            for _ in range(iterations):
+                backend.authenticate_credentials(key)
+            elapsed = time.perf_counter() - start
+        return {
+            'us_per_call': round(elapsed / iterations * 1e6, 2),
+            'queries': len(queries),
+        }
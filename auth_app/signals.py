@@ -0,0 +1,24 @@
+"""Signal handlers invalidating cached token authentication."""
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+from auth_app.authentication import token_cache, get_token_cache_settings
+from auth_app.models import User
+
+
+@receiver(post_delete, sender=Token)
+def token_deleted(sender, instance, **kwargs):
+    """Evict a deleted token from the cache."""
+    token_cache.delete(instance.key)
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def user_changed(sender, instance, **kwargs):
+    """Evict tokens of a modified, deactivated or deleted user."""
+    keys = ()
+    if get_token_cache_settings()['SHARED']:
+        keys = Token.objects.filter(
+            user_id=instance.pk
+        ).values_list('key', flat=True)
+    token_cache.delete_user(instance.pk, keys)
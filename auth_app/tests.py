@@ -1,7 +1,11 @@
 """Tests for authentication app."""
-from django.test import TestCase
+from unittest import mock
+from django.test import TestCase, override_settings
 from rest_framework.test import APIClient
 from rest_framework import status
+from rest_framework.authtoken.models import Token
+from auth_app.authentication import TokenCache, token_cache
+from auth_app.checks import check_token_cache
 from auth_app.models import User
 
 
@@ -114,4 +118,72 @@ class UserModelTests(TestCase):
             password='admin123'
         )
         self.assertTrue(user.is_staff)
-        self.assertTrue(user.is_superuser)
\ No newline at end of file
+        self.assertTrue(user.is_superuser)
+
+
+class CachedTokenAuthenticationTests(TestCase):
+    """Test suite for the caching token authentication backend."""
+    
+    def setUp(self):
+        """Set up user with token and client sending it."""
+        token_cache.clear()
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email='test@test.de',
+            fullname='Test User',
+            password='test1234'
+        )
+        self.token = Token.objects.create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+        self.url = '/api/email-check/?email=test@test.de'
+    
+    def test_second_request_skips_token_query(self):
+        """Test repeated requests are authenticated from the cache."""
+        with self.assertNumQueries(2):
+            self.client.get(self.url)
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+    
+    def test_token_delete_invalidates(self):
+        """Test deleted tokens are rejected immediately."""
+        self.client.get(self.url)
+        self.token.delete()
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+    
+    def test_user_deactivation_invalidates(self):
+        """Test deactivated users are rejected immediately."""
+        self.client.get(self.url)
+        self.user.is_active = False
+        self.user.save()
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    @override_settings(KANMIND_TOKEN_CACHE={'SHARED': True})
+    def test_shared_eviction_by_other_process_invalidates(self):
+        """Test a local hit is dropped once another process evicts it."""
+        self.client.get(self.url)
+        with self.assertNumQueries(1):
+            self.client.get(self.url)
+        # Another worker, with its own local cache, deletes the token.
+        with mock.patch('auth_app.signals.token_cache', TokenCache()):
+            self.token.delete()
+        self.assertEqual(len(token_cache), 1)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_long_ttl_requires_shared_cache(self):
+        """Test the system check rejects unshared long-lived entries."""
+        self.assertEqual(check_token_cache(None), [])
+        with override_settings(KANMIND_TOKEN_CACHE={'TTL': 60}):
+            self.assertEqual([error.id for error in check_token_cache(None)],
+                             ['auth_app.E001'])
+        shared = {'TTL': 60, 'SHARED': True}
+        with override_settings(KANMIND_TOKEN_CACHE=shared):
+            self.assertEqual([error.id for error in check_token_cache(None)],
+                             ['auth_app.E001'])
+            with override_settings(CACHES={'default': {
+                'BACKEND': 'django.core.cache.backends.dummy.DummyCache'
+            }}):
+                self.assertEqual(check_token_cache(None), [])
@@ -0,0 +1,15 @@
+"""Helpers for system checks of caches used for authorization."""
+from django.conf import settings
+
+# Longest TTL allowed for an authorization cache other processes cannot
+# invalidate: revocations made elsewhere take effect after at most this.
+MAX_LOCAL_TTL = 5
+PROCESS_LOCAL_BACKENDS = (
+    'django.core.cache.backends.locmem.LocMemCache',
+)
+
+
+def cache_is_shared(alias='default'):
+    """Return True if the cache alias is visible to other processes."""
+    backend = settings.CACHES.get(alias, {}).get('BACKEND', '')
+    return backend not in PROCESS_LOCAL_BACKENDS
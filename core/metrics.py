@@ -0,0 +1,164 @@
+"""Per-request query/latency metrics and in-memory aggregation."""
+import functools
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar
+from django.conf import settings
+
+_current = ContextVar('kanmind_request_metrics', default=None)
+
+
+class RequestMetrics:
+    """Counters collected while handling one request."""
+
+    __slots__ = ('queries', 'db_time', 'serializer_time', '_depth')
+
+    def __init__(self):
+        """Start with zeroed counters."""
+        self.queries = 0
+        self.db_time = 0.0
+        self.serializer_time = 0.0
+        self._depth = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        """Execute wrapper counting queries and their duration."""
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_time += time.perf_counter() - start
+            self.queries += 1
+
+
+def count_query(execute, sql, params, many, context):
+    """Execute wrapper recording a query on the current request, if any.
+
+    Installed on every connection rather than per request, so queries
+    run by ``sync_to_async`` threads under ASGI are counted too: they
+    see the request's metrics through the copied context.
+    """
+    metrics = _current.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    return metrics(execute, sql, params, many, context)
+
+
+def install_query_counter(connection, **kwargs):
+    """Add count_query to a database connection's execute wrappers."""
+    if count_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(count_query)
+
+
+def current():
+    """Return metrics of the request being handled, or None."""
+    return _current.get()
+
+
+def activate(metrics):
+    """Make metrics current; returns a token for deactivate."""
+    return _current.set(metrics)
+
+
+def deactivate(token):
+    """Restore the metrics that were current before activate."""
+    _current.reset(token)
+
+
+class TimedRepresentationMixin:
+    """Serializer mixin attributing to_representation time to a request.
+
+    Only the outermost call is timed so nested serializers are not
+    counted twice. Costs one context variable lookup when disabled.
+    """
+
+    def to_representation(self, instance):
+        """Serialize instance, recording elapsed time."""
+        metrics = _current.get()
+        if metrics is None or metrics._depth:
+            return super().to_representation(instance)
+        metrics._depth += 1
+        start = time.perf_counter()
+        try:
+            return super().to_representation(instance)
+        finally:
+            metrics.serializer_time += time.perf_counter() - start
+            metrics._depth -= 1
+
+
+def timed_representation(func):
+    """Decorate a serialization function like TimedRepresentationMixin."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        metrics = _current.get()
+        if metrics is None or metrics._depth:
+            return func(*args, **kwargs)
+        metrics._depth += 1
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            metrics.serializer_time += time.perf_counter() - start
+            metrics._depth -= 1
+    return wrapper
+
+
+def _percentile(ordered, fraction):
+    """Return the nearest-rank percentile of an ordered list."""
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+class MetricsRegistry:
+    """Thread-safe bounded samples per URL name."""
+
+    def __init__(self):
+        """Create an empty registry."""
+        self._samples = {}
+        self._lock = threading.Lock()
+
+    def record(self, name, wall, metrics):
+        """Store one request sample under name."""
+        size = getattr(settings, 'KANMIND_METRICS_SAMPLES', 1000)
+        sample = (wall, metrics.db_time, metrics.serializer_time,
+                  metrics.queries)
+        with self._lock:
+            samples = self._samples.get(name)
+            if samples is None:
+                samples = self._samples[name] = deque(maxlen=size)
+            samples.append(sample)
+
+    def reset(self):
+        """Drop all samples."""
+        with self._lock:
+            self._samples.clear()
+
+    def snapshot(self):
+        """Return latency percentiles (ms) and query stats per name."""
+        with self._lock:
+            copies = {name: list(s) for name, s in self._samples.items()}
+        result = {}
+        for name, samples in sorted(copies.items()):
+            walls = sorted(sample[0] for sample in samples)
+            queries = [sample[3] for sample in samples]
+            count = len(samples)
+            result[name] = {
+                'count': count,
+                'p50_ms': round(_percentile(walls, 0.50) * 1000, 2),
+                'p95_ms': round(_percentile(walls, 0.95) * 1000, 2),
+                'p99_ms': round(_percentile(walls, 0.99) * 1000, 2),
+                'avg_db_ms': round(
+                    sum(sample[1] for sample in samples) / count * 1000, 2
+                ),
+                'avg_serializer_ms': round(
+                    sum(sample[2] for sample in samples) / count * 1000, 2
+                ),
+                'avg_queries': round(sum(queries) / count, 2),
+                'max_queries': max(queries),
+            }
+        return result
+
+
+registry = MetricsRegistry()
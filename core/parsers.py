@@ -0,0 +1,29 @@
+"""JSON parser using orjson when installed, else DRF's stdlib path."""
+import io
+from rest_framework.parsers import JSONParser
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class FastJSONParser(JSONParser):
+    """JSONParser decoding UTF-8 bodies with orjson.
+
+    Bodies orjson rejects are re-parsed by the stdlib parser so error
+    messages and edge cases (huge integers) match JSONParser.
+    """
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        """Parse the request body as JSON."""
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', 'utf-8')
+        if orjson is None or encoding.lower().replace('_', '-') != 'utf-8':
+            return super().parse(stream, media_type, parser_context)
+        body = stream.read()
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError:
+            return super().parse(io.BytesIO(body), media_type,
+                                 parser_context)
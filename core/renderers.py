@@ -0,0 +1,51 @@
+"""JSON renderer using orjson when installed, else DRF's stdlib path.
+
+Output is equivalent JSON to ``rest_framework.renderers.JSONRenderer``
+under the default UNICODE_JSON/COMPACT_JSON settings, and byte-identical
+for payloads without floats: dates and datetimes are encoded natively
+(UTC as ``Z``), Decimal and other types go through DRF's encoder.
+Floats may be written in another notation (``1e-05`` as ``0.00001``,
+``1e+16`` as ``1e16``) and NaN or infinities render as ``null`` where
+the stdlib renderer raises. Indented output, non-default settings and
+anything orjson rejects (e.g. integers beyond 64 bits) fall back to the
+stdlib renderer.
+"""
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+LINE_SEPARATOR = '\u2028'.encode()
+PARAGRAPH_SEPARATOR = '\u2029'.encode()
+
+
+class FastJSONRenderer(JSONRenderer):
+    """JSONRenderer encoding with orjson where output is equivalent."""
+
+    options = (orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS) if orjson else 0
+    _default = JSONEncoder().default
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """Render data to JSON bytes."""
+        if (orjson is None or data is None or self.ensure_ascii
+                or not self.compact):
+            return super().render(data, accepted_media_type,
+                                  renderer_context)
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type,
+                                  renderer_context)
+        try:
+            ret = orjson.dumps(data, default=self._default,
+                               option=self.options)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type,
+                                  renderer_context)
+        # Keep DRF's escaping so output stays a strict JavaScript subset.
+        if LINE_SEPARATOR in ret or PARAGRAPH_SEPARATOR in ret:
+            ret = ret.replace(LINE_SEPARATOR, b'\\u2028').replace(
+                PARAGRAPH_SEPARATOR, b'\\u2029'
+            )
+        return ret
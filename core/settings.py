@@ -32,6 +32,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'core.middleware.RequestMetricsMiddleware',
 ]
 
 ROOT_URLCONF = 'core.urls'
@@ -73,6 +74,54 @@ TIME_ZONE = 'UTC'
 USE_I18N = True
 USE_TZ = True
 
+CACHES = {
+    # Use a shared backend (e.g. Redis) when running several processes,
+    # otherwise membership invalidations stay local to one process.
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
+# Board access is cached per user. With a process-local cache other
+# workers see revocations only when entries expire, so longer timeouts
+# require a shared cache (system check kanban_app.E001).
+KANMIND_MEMBERSHIP_CACHE_TIMEOUT = 5
+
+KANMIND_BATCH_MAX_OPERATIONS = 500
+
+# Rows per bulk insert and transaction for board imports.
+KANMIND_IMPORT_CHUNK_SIZE = 1000
+
+# Per-request SQL/latency metrics (/api/metrics/; Server-Timing header for
+# staff users, or for everyone while DEBUG is on).
+KANMIND_METRICS_ENABLED = True
+KANMIND_METRICS_SAMPLES = 1000
+
+# Live board updates; swap the broker for a shared one on multi-node setups.
+KANMIND_REALTIME_BROKER = 'kanban_app.realtime.InMemoryBroker'
+KANMIND_REALTIME_HEARTBEAT = 15
+# Lifetime in seconds of the signed tickets that open event streams.
+KANMIND_REALTIME_TICKET_TTL = 60
+
+# Full-text search; the default backend needs SQLite with FTS5.
+KANMIND_SEARCH_BACKEND = 'kanban_app.search.SQLiteFTSBackend'
+KANMIND_SEARCH_MAX_RESULTS = 100
+
+# Open tasks due within this many days count as "due soon".
+KANMIND_DASHBOARD_DUE_SOON_DAYS = 7
+
+# Token lookups are cached per process for TTL seconds, so without
+# SHARED a token deleted or user deactivated in another process stays
+# valid here until then. SHARED also stores them in the default cache
+# and checks local hits against it, so evictions reach every process on
+# their next request; it needs a cache shared between processes (e.g.
+# Redis). TTLs above a few seconds require both (check auth_app.E001).
+KANMIND_TOKEN_CACHE = {
+    'MAX_SIZE': 10000,
+    'TTL': 5,
+    'SHARED': False,
+}
+
 STATIC_URL = 'static/'
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
@@ -80,11 +129,21 @@ AUTH_USER_MODEL = 'auth_app.User'
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework.authentication.TokenAuthentication',
+        'auth_app.authentication.CachedTokenAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
+    # orjson-backed when installed, stdlib json otherwise.
+    'DEFAULT_RENDERER_CLASSES': [
+        'core.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'core.parsers.FastJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
 }
 
 CORS_ALLOW_ALL_ORIGINS = True
\ No newline at end of file
@@ -1,9 +1,11 @@
 """URL configuration for core project."""
 from django.contrib import admin
 from django.urls import path, include
+from core.views import MetricsView
 
 urlpatterns = [
     path('admin/', admin.site.urls),
+    path('api/metrics/', MetricsView.as_view(), name='metrics'),
     path('api/', include('auth_app.api.urls')),
     path('api/', include('kanban_app.api.urls')),
 ]
\ No newline at end of file
@@ -0,0 +1,21 @@
+"""Operational API views for the core project."""
+from rest_framework import status
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from core.metrics import registry
+
+
+class MetricsView(APIView):
+    """Staff-only dump of aggregated per-view request metrics."""
+    
+    permission_classes = [IsAdminUser]
+    
+    def get(self, request):
+        """Return latency percentiles and query counts per URL name."""
+        return Response(registry.snapshot())
+    
+    def delete(self, request):
+        """Reset all collected samples."""
+        registry.reset()
+        return Response(status=status.HTTP_204_NO_CONTENT)
@@ -1,21 +1,18 @@
 """Django admin configuration for Kanban models."""
 from django.contrib import admin
 from kanban_app.models import Board, Task, Comment
+from kanban_app.stats import FIELDS as COUNTER_FIELDS
 
 
 @admin.register(Board)
 class BoardAdmin(admin.ModelAdmin):
     """Admin interface for Board model."""
     
-    list_display = ['id', 'title', 'owner', 'member_count']
+    list_display = ['id', 'title', 'owner', 'member_count', 'ticket_count']
     search_fields = ['title', 'owner__email']
     list_filter = ['owner']
     filter_horizontal = ['members']
-    
-    def member_count(self, obj):
-        """Return number of board members."""
-        return obj.members.count()
-    member_count.short_description = 'Members'
+    readonly_fields = ['version', *COUNTER_FIELDS]
 
 
 @admin.register(Task)
@@ -34,6 +31,7 @@ class CommentAdmin(admin.ModelAdmin):
     """Admin interface for Comment model."""
     
     list_display = ['id', 'task', 'author', 'created_at']
+    list_select_related = ['task', 'author']
     search_fields = ['content', 'author__email']
     list_filter = ['created_at', 'author']
     readonly_fields = ['created_at']
\ No newline at end of file
@@ -0,0 +1,238 @@
+"""Batch task create/update/delete applied in one transaction."""
+from django.conf import settings
+from django.db import transaction
+from rest_framework import status
+from auth_app.models import User
+from kanban_app.changes import record_changes, UPSERT, DELETE
+from kanban_app.membership import get_board_access
+from kanban_app.models import Board, Task
+from kanban_app.stats import TaskCounts
+from kanban_app.api.serializers import BatchTaskSerializer, TaskSerializer
+
+OPERATIONS = ('create', 'update', 'delete')
+
+
+def _int_or_none(value):
+    """Return value as int, or None if it is not an integer."""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class TaskBatch:
+    """Validate, authorize and apply a list of task operations."""
+
+    def __init__(self, operations, user):
+        """Store raw operations for user."""
+        self.operations = operations
+        self.user = user
+        self.results = [None] * len(operations)
+        self.creates = []
+        self.updates = []
+        self.deletes = []
+        self.seen = set()
+
+    @property
+    def max_size(self):
+        """Return the maximum number of operations per batch."""
+        return getattr(settings, 'KANMIND_BATCH_MAX_OPERATIONS', 500)
+
+    def fail(self, index, op, code, **detail):
+        """Record a failed item."""
+        self.results[index] = {'index': index, 'op': op, 'status': code,
+                               **detail}
+
+    def run(self):
+        """Validate all operations and apply them if all are valid.
+
+        Returns True when the batch was applied.
+        """
+        self._load()
+        for index, operation in enumerate(self.operations):
+            self._validate(index, operation)
+        if any(result is not None for result in self.results):
+            for index, result in enumerate(self.results):
+                if result is None:
+                    self.results[index] = {
+                        'index': index,
+                        'op': self.operations[index].get('op'),
+                        'status': status.HTTP_424_FAILED_DEPENDENCY
+                    }
+            return False
+        with transaction.atomic():
+            self._apply()
+        return True
+
+    def _load(self):
+        """Load referenced tasks, boards and users in one query each."""
+        task_ids, board_ids, user_ids = set(), set(), set()
+        for operation in self.operations:
+            if not isinstance(operation, dict):
+                continue
+            data = operation.get('data')
+            data = data if isinstance(data, dict) else {}
+            task_ids.add(_int_or_none(operation.get('id')))
+            board_ids.add(_int_or_none(data.get('board')))
+            user_ids.add(_int_or_none(data.get('assignee_id')))
+            user_ids.add(_int_or_none(data.get('reviewer_id')))
+        task_ids.discard(None)
+        self.tasks = Task.objects.in_bulk(task_ids)
+        board_ids.update(task.board_id for task in self.tasks.values())
+        board_ids.discard(None)
+        self.board_owners = dict(
+            Board.objects.filter(id__in=board_ids).values_list(
+                'id', 'owner_id'
+            )
+        )
+        user_ids.discard(None)
+        self.user_ids = set(
+            User.objects.filter(id__in=user_ids).values_list('id', flat=True)
+        )
+        self.access = get_board_access(self.user)
+
+    def _can_access(self, board_id):
+        """Return True if user is owner or member of board_id."""
+        return board_id in self.access.owned or board_id in self.access.member
+
+    def _validate(self, index, operation):
+        """Validate one operation, queueing it or recording a failure."""
+        op = operation.get('op') if isinstance(operation, dict) else None
+        if op not in OPERATIONS:
+            allowed = ', '.join(OPERATIONS)
+            return self.fail(index, op, status.HTTP_400_BAD_REQUEST,
+                             error=f'op must be one of {allowed}')
+        if op == 'create':
+            return self._validate_create(index, operation)
+        task = self.tasks.get(_int_or_none(operation.get('id')))
+        if task is None:
+            return self.fail(index, op, status.HTTP_404_NOT_FOUND,
+                             error='Task not found')
+        if task.id in self.seen:
+            return self.fail(index, op, status.HTTP_400_BAD_REQUEST,
+                             error='Task appears in more than one operation')
+        self.seen.add(task.id)
+        if op == 'update':
+            return self._validate_update(index, operation, task)
+        is_creator = task.created_by_id == self.user.id
+        is_owner = self.board_owners.get(task.board_id) == self.user.id
+        if not (is_creator or is_owner):
+            return self.fail(index, op, status.HTTP_403_FORBIDDEN,
+                             error='Not authorized to delete this task')
+        self.deletes.append((index, task))
+
+    def _check_board_and_users(self, index, op, board_id, data):
+        """Validate board access and referenced users; return success."""
+        if board_id not in self.board_owners:
+            self.fail(index, op, status.HTTP_404_NOT_FOUND,
+                      error='Board not found')
+            return False
+        if not self._can_access(board_id):
+            self.fail(index, op, status.HTTP_403_FORBIDDEN,
+                      error='Not a board member')
+            return False
+        for field in ('assignee_id', 'reviewer_id'):
+            user_id = data.get(field)
+            if user_id is not None and user_id not in self.user_ids:
+                self.fail(index, op, status.HTTP_400_BAD_REQUEST,
+                          errors={field: ['User not found']})
+                return False
+        return True
+
+    def _validate_create(self, index, operation):
+        """Validate a create operation."""
+        serializer = BatchTaskSerializer(data=operation.get('data'))
+        if not serializer.is_valid():
+            return self.fail(index, 'create', status.HTTP_400_BAD_REQUEST,
+                             errors=serializer.errors)
+        data = serializer.validated_data
+        if self._check_board_and_users(index, 'create', data['board_id'],
+                                       data):
+            task = Task(**data, created_by_id=self.user.id)
+            self.creates.append((index, task))
+
+    def _validate_update(self, index, operation, task):
+        """Validate an update operation against the loaded task."""
+        if not self._can_access(task.board_id):
+            return self.fail(index, 'update', status.HTTP_403_FORBIDDEN,
+                             error='Not a board member')
+        serializer = BatchTaskSerializer(
+            task, data=operation.get('data'), partial=True
+        )
+        if not serializer.is_valid():
+            return self.fail(index, 'update', status.HTTP_400_BAD_REQUEST,
+                             errors=serializer.errors)
+        data = serializer.validated_data
+        board_id = data.get('board_id', task.board_id)
+        if self._check_board_and_users(index, 'update', board_id, data):
+            self.updates.append((index, task, task.board_id, data))
+
+    def _apply(self):
+        """Write all queued operations and record board changes."""
+        upserts, tombstones = {}, {}
+        counts = TaskCounts()
+
+        created = Task.objects.bulk_create(
+            [task for _, task in self.creates]
+        )
+        for task in created:
+            upserts.setdefault(task.board_id, []).append(task.id)
+            counts.add(task.board_id, task.status, task.priority)
+
+        fields = set()
+        for _, task, old_board_id, data in self.updates:
+            counts.remove(task.board_id, task.status, task.priority)
+            for field, value in data.items():
+                setattr(task, field, value)
+                fields.add(field)
+            counts.add(task.board_id, task.status, task.priority)
+            if task.board_id != old_board_id:
+                tombstones.setdefault(old_board_id, []).append(task.id)
+            upserts.setdefault(task.board_id, []).append(task.id)
+        if fields:
+            Task.objects.bulk_update(
+                [task for _, task, _, _ in self.updates], sorted(fields)
+            )
+
+        if self.deletes:
+            queryset = Task.objects.filter(
+                id__in=[task.id for _, task in self.deletes]
+            )
+            queryset.skip_change_log = True
+            queryset.delete()
+            for _, task in self.deletes:
+                tombstones.setdefault(task.board_id, []).append(task.id)
+                counts.remove(task.board_id, task.status, task.priority)
+
+        for board_id, ids in tombstones.items():
+            record_changes(board_id, 'task', ids, DELETE,
+                           counters=counts.pop(board_id))
+        for board_id, ids in upserts.items():
+            record_changes(board_id, 'task', ids, UPSERT,
+                           counters=counts.pop(board_id))
+
+        self._collect_results()
+
+    def _collect_results(self):
+        """Fill per-item results with fresh task representations."""
+        written = [task for _, task in self.creates]
+        written += [task for _, task, _, _ in self.updates]
+        fresh = Task.objects.with_related().in_bulk(
+            [task.id for task in written]
+        )
+        for index, task in self.creates:
+            self.results[index] = {
+                'index': index, 'op': 'create',
+                'status': status.HTTP_201_CREATED,
+                'data': TaskSerializer(fresh[task.id]).data
+            }
+        for index, task, _, _ in self.updates:
+            self.results[index] = {
+                'index': index, 'op': 'update', 'status': status.HTTP_200_OK,
+                'data': TaskSerializer(fresh[task.id]).data
+            }
+        for index, task in self.deletes:
+            self.results[index] = {
+                'index': index, 'op': 'delete',
+                'status': status.HTTP_204_NO_CONTENT, 'id': task.id
+            }
@@ -0,0 +1,83 @@
+"""Cheap ETag validators for conditional board and task reads."""
+import hashlib
+from django.utils.http import parse_etags
+from rest_framework import status
+from rest_framework.response import Response
+from kanban_app.membership import board_ids_for
+from kanban_app.models import Board, Task
+
+
+def board_etag(board_id, version):
+    """Return the ETag of a board detail at a version."""
+    return f'"b{board_id}-v{version}"'
+
+
+def task_etag(task_id, board_id, version):
+    """Return the ETag of a task at its board's version."""
+    return f'"t{task_id}-b{board_id}-v{version}"'
+
+
+def current_board_etag(pk, user):
+    """Return a board's current ETag in one query, or None."""
+    try:
+        pk = int(pk)
+    except (TypeError, ValueError):
+        return None
+    if pk not in board_ids_for(user):
+        return None
+    version = Board.objects.filter(pk=pk).values_list(
+        'version', flat=True
+    ).first()
+    return None if version is None else board_etag(pk, version)
+
+
+def current_task_etag(pk, user):
+    """Return a task's current ETag in one query, or None."""
+    try:
+        pk = int(pk)
+    except (TypeError, ValueError):
+        return None
+    row = Task.objects.filter(
+        pk=pk, board_id__in=board_ids_for(user)
+    ).values_list('board_id', 'board__version').first()
+    return None if row is None else task_etag(pk, *row)
+
+
+def board_list_etag(request, boards=None):
+    """Return the ETag of the caller's board list.
+
+    Uses the already loaded boards when given, else one query.
+    """
+    if boards is None:
+        rows = Board.objects.filter(
+            id__in=board_ids_for(request.user)
+        ).values_list('id', 'version')
+    else:
+        rows = [(board.id, board.version) for board in boards]
+    digest = hashlib.md5(request.META.get('QUERY_STRING', '').encode())
+    for board_id, version in sorted(rows):
+        digest.update(f'{board_id}:{version};'.encode())
+    return f'"l{digest.hexdigest()}"'
+
+
+def is_conditional(request):
+    """Return True if the request carries If-None-Match."""
+    return 'If-None-Match' in request.headers
+
+
+def is_not_modified(request, etag):
+    """Return True if If-None-Match matches etag."""
+    header = request.headers.get('If-None-Match')
+    if not header or etag is None:
+        return False
+    tags = parse_etags(header)
+    if '*' in tags:
+        return True
+    strip = lambda tag: tag[2:] if tag.startswith('W/') else tag
+    return strip(etag) in {strip(tag) for tag in tags}
+
+
+def not_modified(etag):
+    """Return an empty 304 response carrying etag."""
+    return Response(status=status.HTTP_304_NOT_MODIFIED,
+                    headers={'ETag': etag})
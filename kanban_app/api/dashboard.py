@@ -0,0 +1,57 @@
+"""Personal dashboard counters computed in one aggregate query."""
+import datetime
+from django.conf import settings
+from django.db.models import Count, Q
+from django.utils import timezone
+from kanban_app.membership import board_ids_for
+from kanban_app.models import Task
+
+STATUSES = [value for value, _ in Task.STATUS_CHOICES]
+
+
+def _count(**lookups):
+    """Return a filtered task count."""
+    return Count('id', filter=Q(**lookups))
+
+
+def build_dashboard(user, today=None):
+    """Return the user's task and board counters.
+
+    Board ids come from the membership cache; all task counts are
+    conditional aggregates over the user's boards, so no model objects
+    are built.
+    """
+    today = today or timezone.localdate()
+    soon = today + datetime.timedelta(
+        days=getattr(settings, 'KANMIND_DASHBOARD_DUE_SOON_DAYS', 7)
+    )
+    board_ids = board_ids_for(user)
+    counts = {}
+    if board_ids:
+        mine = {'assignee_id': user.id}
+        open_mine = Q(**mine) & ~Q(status='done')
+        counts = Task.objects.filter(board_id__in=board_ids).aggregate(
+            task_count=Count('id'),
+            assigned=_count(**mine),
+            high_priority=Count('id', filter=open_mine & Q(priority='high')),
+            overdue=Count('id', filter=open_mine & Q(due_date__lt=today)),
+            due_soon=Count('id', filter=open_mine & Q(
+                due_date__gte=today, due_date__lte=soon
+            )),
+            awaiting_review=_count(reviewer_id=user.id, status='review'),
+            **{status: _count(status=status, **mine) for status in STATUSES}
+        )
+    return {
+        'board_count': len(board_ids),
+        'task_count': counts.get('task_count', 0),
+        'assigned_to_me': {
+            'total': counts.get('assigned', 0),
+            'by_status': {
+                status: counts.get(status, 0) for status in STATUSES
+            },
+            'high_priority': counts.get('high_priority', 0),
+        },
+        'awaiting_my_review': counts.get('awaiting_review', 0),
+        'overdue': counts.get('overdue', 0),
+        'due_soon': counts.get('due_soon', 0),
+    }
@@ -0,0 +1,145 @@
+"""Server-sent event stream of live board updates (ASGI).
+
+Browsers cannot send an Authorization header with ``EventSource``, so
+they fetch a short-lived signed ticket for one board from the API and
+pass it as ``?ticket=``; API tokens never appear in stream URLs.
+"""
+import json
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core import signing
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import JsonResponse, StreamingHttpResponse
+from django.views.decorators.http import require_GET
+from rest_framework.authentication import get_authorization_header
+from rest_framework.exceptions import AuthenticationFailed
+from auth_app.authentication import CachedTokenAuthentication
+from auth_app.models import User
+from kanban_app.membership import board_ids_for
+from kanban_app.models import Board
+from kanban_app.realtime import get_broker
+
+
+TICKET_SALT = 'kanban_app.events.ticket'
+
+
+def ticket_ttl():
+    """Return the stream ticket lifetime in seconds."""
+    return getattr(settings, 'KANMIND_REALTIME_TICKET_TTL', 60)
+
+
+def issue_ticket(user, board_id):
+    """Return a signed ticket letting user open board_id's stream."""
+    return signing.dumps({'user': user.id, 'board': board_id},
+                         salt=TICKET_SALT)
+
+
+def _ticket_user_id(ticket, board_id):
+    """Return the user id of a valid, unexpired ticket for board_id."""
+    try:
+        data = signing.loads(ticket, salt=TICKET_SALT, max_age=ticket_ttl())
+    except signing.BadSignature:
+        return None
+    if not isinstance(data, dict) or data.get('board') != board_id:
+        return None
+    return data.get('user')
+
+
+def _authenticate(request, board_id):
+    """Return the active user from the Authorization header or ticket."""
+    auth = get_authorization_header(request).split()
+    if len(auth) == 2 and auth[0].lower() == b'token':
+        try:
+            user, _ = CachedTokenAuthentication().authenticate_credentials(
+                auth[1].decode(errors='ignore')
+            )
+        except AuthenticationFailed:
+            return None
+        return user
+    ticket = request.GET.get('ticket')
+    user_id = _ticket_user_id(ticket, board_id) if ticket else None
+    if user_id is None:
+        return None
+    return User.objects.filter(pk=user_id, is_active=True).first()
+
+
+def _names_removed_member(event, user_id):
+    """Return True if event removes user_id from the board's members."""
+    return (event.get('entity') == 'member'
+            and event.get('op') == 'delete'
+            and user_id in event.get('ids', ()))
+
+
+def _format(event_type, data):
+    """Return one SSE frame."""
+    payload = json.dumps(data, cls=DjangoJSONEncoder)
+    return f'event: {event_type}\ndata: {payload}\n\n'
+
+
+async def _has_access(user, board_id):
+    """Return True if user is still active and may see board_id."""
+    active = await User.objects.filter(pk=user.pk, is_active=True).aexists()
+    return active and board_id in await sync_to_async(board_ids_for)(user)
+
+
+async def _stream(broker, subscription, version, user):
+    """Yield board events until the client disconnects or loses access.
+
+    The stream ends after a ``board-deleted`` event, after a member
+    removal naming the user that leaves them without access (owners
+    keep it), and on a heartbeat once the user is deactivated or no
+    longer a member.
+    """
+    heartbeat = getattr(settings, 'KANMIND_REALTIME_HEARTBEAT', 15)
+    board_id = subscription.board_id
+    try:
+        yield _format('ready', {'board_id': board_id, 'version': version})
+        while True:
+            event = await subscription.get(timeout=heartbeat)
+            if event is None:
+                if not await _has_access(user, board_id):
+                    return
+                yield ': ping\n\n'
+                continue
+            yield _format(event.get('type', 'change'), event)
+            if event.get('type') == 'board-deleted':
+                return
+            if (_names_removed_member(event, user.id)
+                    and not await _has_access(user, board_id)):
+                return
+    finally:
+        broker.unsubscribe(subscription)
+
+
+@require_GET
+async def board_events(request, board_id):
+    """Stream task, comment and member changes of a board as SSE."""
+    user = await sync_to_async(_authenticate)(request, board_id)
+    if user is None:
+        return JsonResponse(
+            {'detail': 'Authentication credentials were not provided.'},
+            status=401
+        )
+
+    if board_id not in await sync_to_async(board_ids_for)(user):
+        exists = await Board.objects.filter(pk=board_id).aexists()
+        if not exists:
+            return JsonResponse({'error': 'Board not found'}, status=404)
+        return JsonResponse({'error': 'Not a board member'}, status=403)
+
+    version = await Board.objects.filter(pk=board_id).values_list(
+        'version', flat=True
+    ).afirst()
+    if version is None:
+        return JsonResponse({'error': 'Board not found'}, status=404)
+    # Subscribe last so nothing between here and the response can raise
+    # and leave the subscription behind.
+    broker = get_broker()
+    subscription = broker.subscribe(board_id)
+    response = StreamingHttpResponse(
+        _stream(broker, subscription, version, user),
+        content_type='text/event-stream'
+    )
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
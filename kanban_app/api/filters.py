@@ -0,0 +1,145 @@
+"""Query-string filtering, ordering and sparse fieldsets for task lists."""
+import datetime
+from django.db import models
+from rest_framework.exceptions import ParseError
+from kanban_app.models import Task
+from kanban_app.api.readers import TASK_FIELDS
+
+ORDERING_FIELDS = ['id', 'title', 'status', 'priority', 'due_date']
+PRIORITY_RANK = models.Case(
+    *(models.When(priority=value, then=rank)
+      for rank, (value, _) in enumerate(Task.PRIORITY_CHOICES)),
+    output_field=models.IntegerField()
+)
+
+
+def _invalid(message):
+    """Return a 400 error in the API's error format."""
+    return ParseError({'error': message})
+
+
+def _split(value):
+    """Return the non-empty comma-separated parts of value."""
+    return [part.strip() for part in value.split(',') if part.strip()]
+
+
+class TaskListQuery:
+    """Filters, ordering and sparse fieldset parsed from query params.
+
+    Supported parameters: ``status``, ``priority`` and ``board`` (comma
+    separated), ``assignee`` and ``reviewer`` (user id, ``me`` or
+    ``none``), ``due_date_after``/``due_date_before`` (inclusive ISO
+    dates), ``ordering`` (comma separated, ``-`` for descending) and
+    ``fields`` (comma separated serializer fields).
+    """
+
+    def __init__(self, params, user):
+        """Parse and validate params, raising ParseError when invalid."""
+        self.user = user
+        self.filters = self._parse_filters(params)
+        self.ordering = self._parse_ordering(params.get('ordering'))
+        self.fields = self._parse_fields(params.get('fields'))
+
+    def _choices(self, params, name, choices):
+        """Return a field__in filter for comma separated choice values."""
+        values = _split(params.get(name, ''))
+        valid = {value for value, _ in choices}
+        invalid = [value for value in values if value not in valid]
+        if invalid:
+            raise _invalid(f'Invalid {name}: {", ".join(invalid)}')
+        return {f'{name}__in': values} if values else {}
+
+    def _user(self, params, name):
+        """Return a filter for a user id, "me" or "none" parameter."""
+        value = params.get(name)
+        if value is None:
+            return {}
+        if value == 'me':
+            return {f'{name}_id': self.user.id}
+        if value == 'none':
+            return {f'{name}__isnull': True}
+        try:
+            return {f'{name}_id': int(value)}
+        except ValueError:
+            raise _invalid(f'{name} must be a user id, "me" or "none"')
+
+    def _date(self, params, name, lookup):
+        """Return a due_date range filter for an ISO date parameter."""
+        value = params.get(name)
+        if not value:
+            return {}
+        try:
+            date = datetime.date.fromisoformat(value)
+        except ValueError:
+            raise _invalid(f'{name} must be a date (YYYY-MM-DD)')
+        return {f'due_date__{lookup}': date}
+
+    def _parse_filters(self, params):
+        """Return ORM filter kwargs for the query params."""
+        filters = {}
+        filters.update(self._choices(params, 'status', Task.STATUS_CHOICES))
+        filters.update(
+            self._choices(params, 'priority', Task.PRIORITY_CHOICES)
+        )
+        boards = _split(params.get('board', ''))
+        if boards:
+            try:
+                filters['board_id__in'] = [int(board) for board in boards]
+            except ValueError:
+                raise _invalid('board must be comma separated board ids')
+        filters.update(self._user(params, 'assignee'))
+        filters.update(self._user(params, 'reviewer'))
+        filters.update(self._date(params, 'due_date_after', 'gte'))
+        filters.update(self._date(params, 'due_date_before', 'lte'))
+        return filters
+
+    def _parse_ordering(self, value):
+        """Return order_by expressions, ending with an id tiebreaker."""
+        self.ranks_priority = False
+        if not value:
+            return []
+        ordering = []
+        for term in _split(value):
+            name = term.lstrip('-')
+            if name not in ORDERING_FIELDS:
+                raise _invalid(
+                    f'Invalid ordering: {name}. '
+                    f'Use one of {", ".join(ORDERING_FIELDS)}'
+                )
+            descending = term.startswith('-')
+            if name == 'priority':
+                self.ranks_priority = True
+                expression = models.F('priority_rank')
+            else:
+                expression = models.F(name)
+            ordering.append(
+                expression.desc(nulls_last=True) if descending
+                else expression.asc(nulls_last=True)
+            )
+            if name == 'id':
+                return ordering
+        return ordering + ['-id']
+
+    def _parse_fields(self, value):
+        """Return the requested serializer fields, or None for all."""
+        if value is None:
+            return None
+        fields = _split(value)
+        invalid = [name for name in fields if name not in TASK_FIELDS]
+        if invalid or not fields:
+            raise _invalid(
+                f'Invalid fields: {", ".join(invalid) or value!r}. '
+                f'Use any of {", ".join(TASK_FIELDS)}'
+            )
+        return fields
+
+    def apply(self, queryset):
+        """Filter and order queryset in SQL.
+
+        Columns and joins for the sparse fieldset are chosen by
+        ``readers.task_values``.
+        """
+        queryset = queryset.filter(**self.filters)
+        if self.ranks_priority:
+            queryset = queryset.annotate(priority_rank=PRIORITY_RANK)
+        return queryset.order_by(*(self.ordering or ['-id']))
@@ -0,0 +1,67 @@
+"""Fused fetch-and-authorize lookups for kanban API views."""
+from django.db.models import F
+from kanban_app.models import Board, Task, Comment
+from kanban_app.membership import get_board_access
+
+
+def _first(queryset, **lookup):
+    """Return the first matching object or None for missing/invalid keys."""
+    try:
+        return queryset.filter(**lookup).first()
+    except (ValueError, TypeError):
+        return None
+
+
+def _authorize(obj, board_id, user):
+    """Set is_member/is_owner flags from the cached board access."""
+    if obj is not None:
+        access = get_board_access(user)
+        obj.is_member = board_id in access.member
+        obj.is_owner = board_id in access.owned
+    return obj
+
+
+def get_board(pk, user, queryset=None):
+    """Return board with is_member/is_owner flags."""
+    if queryset is None:
+        queryset = Board.objects.all()
+    board = _first(queryset, pk=pk)
+    return _authorize(board, board and board.pk, user)
+
+
+def get_task(pk, user, queryset=None):
+    """Return task with is_member/is_owner flags."""
+    if queryset is None:
+        queryset = Task.objects.with_related()
+    task = _first(queryset, pk=pk)
+    return _authorize(task, task and task.board_id, user)
+
+
+def get_comment(pk, task_id, user, queryset=None):
+    """Return comment of a task with is_member/is_owner flags."""
+    if queryset is None:
+        queryset = Comment.objects.all()
+    comment = _first(
+        queryset.annotate(board_id=F('task__board_id')),
+        pk=pk,
+        task_id=task_id
+    )
+    return _authorize(comment, comment and comment.board_id, user)
+
+
+def has_board_access(obj):
+    """Return True if the looked-up object grants board access."""
+    return obj.is_member or obj.is_owner
+
+
+def resolve_access(obj, user):
+    """Return obj carrying access flags, fetching them if missing."""
+    if hasattr(obj, 'is_member') and hasattr(obj, 'is_owner'):
+        return obj
+    if isinstance(obj, Board):
+        return _authorize(obj, obj.pk, user)
+    if isinstance(obj, Task):
+        return _authorize(obj, obj.board_id, user)
+    if isinstance(obj, Comment):
+        return get_comment(obj.pk, obj.task_id, user)
+    return None
@@ -0,0 +1,145 @@
+"""Opt-in keyset (cursor) pagination for kanban list endpoints."""
+import datetime
+from django.conf import settings
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import Cursor, CursorPagination
+
+
+class OptInCursorPagination(CursorPagination):
+    """Cursor pagination applied only when the client asks for it.
+
+    Clients opt in with ``?paginate=cursor`` (or by following a
+    ``cursor`` link); requests without it keep the unpaginated list.
+    """
+
+    page_size = getattr(settings, 'KANMIND_PAGE_SIZE', 50)
+    page_size_query_param = 'page_size'
+    max_page_size = getattr(settings, 'KANMIND_MAX_PAGE_SIZE', 500)
+    opt_in_query_param = 'paginate'
+    ordering = '-id'
+
+    def is_requested(self, request):
+        """Return True if the request opted into pagination."""
+        params = request.query_params
+        return (params.get(self.opt_in_query_param) == 'cursor'
+                or self.cursor_query_param in params)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """Paginate only opted-in requests, else return None."""
+        if not self.is_requested(request):
+            return None
+        return super().paginate_queryset(queryset, request, view)
+
+
+class BoardPagination(OptInCursorPagination):
+    """Cursor pagination over boards, newest first."""
+
+    ordering = '-id'
+
+
+class TaskPagination(OptInCursorPagination):
+    """Cursor pagination over tasks, newest first."""
+
+    ordering = '-id'
+
+
+class CommentPagination(OptInCursorPagination):
+    """Keyset pagination over comments on (created_at, id), oldest first.
+
+    Cursors carry the (created_at, id) of the row a page continues from,
+    so each page is one range scan on the (task, created_at, id) index
+    however deep it is, and ties on created_at never skip rows.
+    ``?latest=<n>`` returns the newest n comments, still oldest first,
+    with a ``previous`` link to the ones before them.
+    """
+
+    ordering = ('created_at', 'id')
+    latest_query_param = 'latest'
+
+    def is_requested(self, request):
+        """Return True for cursor pagination or the latest mode."""
+        return (super().is_requested(request)
+                or self.get_latest(request) is not None)
+
+    def get_latest(self, request):
+        """Return the requested latest count capped at max_page_size."""
+        try:
+            latest = int(request.query_params[self.latest_query_param])
+        except (KeyError, ValueError):
+            return None
+        return min(latest, self.max_page_size) if latest > 0 else None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """Return one page of comment rows ordered oldest first."""
+        if not self.is_requested(request):
+            return None
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        cursor = self.decode_cursor(request)
+        latest = self.get_latest(request) if cursor is None else None
+        if latest:
+            self.page_size = latest
+            cursor = Cursor(offset=0, reverse=True, position=None)
+        reverse = cursor is not None and cursor.reverse
+        self.position = position = self.parse_position(cursor)
+        if position is not None:
+            created_at, pk = position
+            queryset = queryset.filter(
+                **{'created_at__lte' if reverse else 'created_at__gte':
+                   created_at}
+            ).exclude(
+                **{'id__gte' if reverse else 'id__lte': pk,
+                   'created_at': created_at}
+            )
+        queryset = queryset.order_by(
+            *(f'-{field}' if reverse else field for field in self.ordering)
+        )
+        rows = list(queryset[:self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        self.page = rows[:self.page_size]
+        if reverse:
+            self.page.reverse()
+        self.has_next = has_more if not reverse else position is not None
+        self.has_previous = has_more if reverse else position is not None
+        return self.page
+
+    def parse_position(self, cursor):
+        """Return the (created_at, id) a cursor continues from, or None."""
+        if cursor is None or cursor.position is None:
+            return None
+        try:
+            created_at, pk = cursor.position.rsplit('|', 1)
+            return datetime.datetime.fromisoformat(created_at), int(pk)
+        except ValueError:
+            raise NotFound(self.invalid_cursor_message)
+
+    def position_link(self, row, reverse):
+        """Return the link continuing from row in one direction.
+
+        An empty page continues from the cursor it was requested with.
+        """
+        if row is None:
+            created_at, pk = self.position
+        else:
+            created_at, pk = row['created_at'], row['id']
+        return self.encode_cursor(Cursor(
+            offset=0, reverse=reverse,
+            position=f'{created_at.isoformat()}|{pk}'
+        ))
+
+    def get_next_link(self):
+        """Return the link to newer comments, if there are any."""
+        if not self.has_next:
+            return None
+        return self.position_link(
+            self.page[-1] if self.page else None, reverse=False
+        )
+
+    def get_previous_link(self):
+        """Return the link to older comments, if there are any."""
+        if not self.has_previous:
+            return None
+        return self.position_link(
+            self.page[0] if self.page else None, reverse=True
+        )
@@ -1,5 +1,6 @@
 """Custom permission classes for kanban app."""
 from rest_framework import permissions
+from kanban_app.api.lookups import resolve_access, has_board_access
 
 
 class IsBoardMember(permissions.BasePermission):
@@ -7,14 +8,8 @@ class IsBoardMember(permissions.BasePermission):
     
     def has_object_permission(self, request, view, obj):
         """Check if user is board member or owner."""
-        if hasattr(obj, 'members'):
-            return (obj.members.filter(id=request.user.id).exists() 
-                    or obj.owner == request.user)
-        if hasattr(obj, 'board'):
-            board = obj.board
-            return (board.members.filter(id=request.user.id).exists() 
-                    or board.owner == request.user)
-        return False
+        obj = resolve_access(obj, request.user)
+        return obj is not None and has_board_access(obj)
 
 
 class IsBoardOwner(permissions.BasePermission):
@@ -22,7 +17,8 @@ class IsBoardOwner(permissions.BasePermission):
     
     def has_object_permission(self, request, view, obj):
         """Check if user is board owner."""
-        return obj.owner == request.user
+        obj = resolve_access(obj, request.user)
+        return obj is not None and obj.is_owner
 
 
 class IsTaskCreatorOrBoardOwner(permissions.BasePermission):
@@ -30,8 +26,10 @@ class IsTaskCreatorOrBoardOwner(permissions.BasePermission):
     
     def has_object_permission(self, request, view, obj):
         """Check if user is task creator or board owner."""
-        return (obj.created_by == request.user 
-                or obj.board.owner == request.user)
+        if obj.created_by_id == request.user.id:
+            return True
+        obj = resolve_access(obj, request.user)
+        return obj is not None and obj.is_owner
 
 
 class IsCommentAuthor(permissions.BasePermission):
@@ -39,4 +37,4 @@ class IsCommentAuthor(permissions.BasePermission):
     
     def has_object_permission(self, request, view, obj):
         """Check if user is comment author."""
-        return obj.author == request.user
\ No newline at end of file
+        return obj.author_id == request.user.id
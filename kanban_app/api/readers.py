@@ -0,0 +1,126 @@
+"""Read-only fast paths building response data from ``.values()`` rows.
+
+Skips model instantiation and DRF's per-field machinery for large
+lists. The output matches ``TaskSerializer``, ``UserSerializer`` and
+``CommentSerializer`` key for key so rendered JSON is byte-identical;
+the serializers stay in charge of writes and validation.
+"""
+from operator import itemgetter
+from rest_framework import serializers
+from core.metrics import timed_representation
+
+TASK_FIELDS = [
+    'id', 'title', 'description', 'status', 'priority', 'assignee',
+    'reviewer', 'due_date', 'comments_count', 'board',
+]
+USER_FIELDS = ['id', 'email', 'fullname']
+COMMENT_COLUMNS = ['id', 'created_at', 'author__fullname', 'content']
+
+# Reuse DRF's formatting so timezone handling and the "Z" suffix match.
+_datetime = serializers.DateTimeField().to_representation
+
+
+def _date(key):
+    """Return a getter formatting a date column like DRF's DateField."""
+    def get(row):
+        value = row[key]
+        return value.isoformat() if value else None
+    return get
+
+
+def _user(prefix):
+    """Return a getter nesting user columns like UserSerializer."""
+    def get(row):
+        if row[f'{prefix}_id'] is None:
+            return None
+        return {
+            'id': row[f'{prefix}_id'],
+            'email': row[f'{prefix}__email'],
+            'fullname': row[f'{prefix}__fullname'],
+        }
+    return get
+
+
+def _task_columns(fields):
+    """Return the value columns and (key, getter) pairs for fields."""
+    columns = ['id']
+    getters = []
+    for name in fields:
+        if name in ('assignee', 'reviewer'):
+            columns += [f'{name}_id', f'{name}__email', f'{name}__fullname']
+            getters.append((name, _user(name)))
+        elif name == 'board':
+            columns.append('board_id')
+            getters.append((name, itemgetter('board_id')))
+        elif name == 'due_date':
+            columns.append(name)
+            getters.append((name, _date(name)))
+        else:
+            if name != 'id':
+                columns.append(name)
+            getters.append((name, itemgetter(name)))
+    return columns, getters
+
+
+def _requested(fields):
+    """Return requested task fields in serializer order."""
+    if fields is None:
+        return TASK_FIELDS
+    return [name for name in TASK_FIELDS if name in fields]
+
+
+def task_values(queryset, fields=None):
+    """Return queryset as rows carrying the columns fields need.
+
+    Rows always include ``id`` so cursor pagination can read positions.
+    """
+    columns, _ = _task_columns(_requested(fields))
+    return queryset.values(*columns)
+
+
+@timed_representation
+def task_data(rows, fields=None):
+    """Return TaskSerializer-shaped dicts for task_values rows."""
+    _, getters = _task_columns(_requested(fields))
+    return [{key: get(row) for key, get in getters} for row in rows]
+
+
+def user_values(queryset):
+    """Return user rows for user_data."""
+    return queryset.values(*USER_FIELDS)
+
+
+@timed_representation
+def user_data(rows):
+    """Return UserSerializer-shaped dicts for user_values rows."""
+    return [
+        {'id': row['id'], 'email': row['email'],
+         'fullname': row['fullname']}
+        for row in rows
+    ]
+
+
+def comment_values(queryset):
+    """Return comment rows for comment_data, joining the author name."""
+    return queryset.values(*COMMENT_COLUMNS)
+
+
+@timed_representation
+def comment_data(rows):
+    """Return CommentSerializer-shaped dicts for comment_values rows."""
+    return [
+        {'id': row['id'], 'created_at': _datetime(row['created_at']),
+         'author': row['author__fullname'], 'content': row['content']}
+        for row in rows
+    ]
+
+
+def board_detail_data(board, tasks):
+    """Return BoardDetailSerializer-shaped data for board and its tasks."""
+    return {
+        'id': board.id,
+        'title': board.title,
+        'owner_id': board.owner_id,
+        'members': user_data(user_values(board.members.all())),
+        'tasks': task_data(task_values(tasks)),
+    }
@@ -1,10 +1,12 @@
 """Serializers for kanban app models."""
 from rest_framework import serializers
+from core.metrics import TimedRepresentationMixin
 from kanban_app.models import Board, Task, Comment
 from auth_app.models import User
 
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(TimedRepresentationMixin,
+                     serializers.ModelSerializer):
     """Serializer for user data in responses."""
     
     class Meta:
@@ -12,35 +14,18 @@ class UserSerializer(serializers.ModelSerializer):
         fields = ['id', 'email', 'fullname']
 
 
-class BoardListSerializer(serializers.ModelSerializer):
-    """Serializer for board list view with aggregated counts."""
+class BoardListSerializer(TimedRepresentationMixin,
+                          serializers.ModelSerializer):
+    """Serializer for board list view reading the counter columns."""
     
-    member_count = serializers.SerializerMethodField()
-    ticket_count = serializers.SerializerMethodField()
-    tasks_to_do_count = serializers.SerializerMethodField()
-    tasks_high_prio_count = serializers.SerializerMethodField()
-    owner_id = serializers.IntegerField(source='owner.id', read_only=True)
+    owner_id = serializers.IntegerField(read_only=True)
     
     class Meta:
         model = Board
         fields = ['id', 'title', 'member_count', 'ticket_count', 
                   'tasks_to_do_count', 'tasks_high_prio_count', 'owner_id']
-    
-    def get_member_count(self, obj):
-        """Return number of board members."""
-        return obj.members.count()
-    
-    def get_ticket_count(self, obj):
-        """Return total number of tasks."""
-        return obj.tasks.count()
-    
-    def get_tasks_to_do_count(self, obj):
-        """Return number of tasks with to-do status."""
-        return obj.tasks.filter(status='to-do').count()
-    
-    def get_tasks_high_prio_count(self, obj):
-        """Return number of high priority tasks."""
-        return obj.tasks.filter(priority='high').count()
+        read_only_fields = ['member_count', 'ticket_count',
+                            'tasks_to_do_count', 'tasks_high_prio_count']
 
 
 class BoardCreateSerializer(serializers.ModelSerializer):
@@ -66,7 +51,8 @@ class BoardCreateSerializer(serializers.ModelSerializer):
         return board
 
 
-class TaskSerializer(serializers.ModelSerializer):
+class TaskSerializer(TimedRepresentationMixin,
+                     serializers.ModelSerializer):
     """Serializer for task with assignee and reviewer details."""
     
     assignee = UserSerializer(read_only=True)
@@ -81,32 +67,79 @@ class TaskSerializer(serializers.ModelSerializer):
         required=False, 
         allow_null=True
     )
-    comments_count = serializers.SerializerMethodField()
+    comments_count = serializers.IntegerField(read_only=True)
     
     class Meta:
         model = Task
         fields = ['id', 'title', 'description', 'status', 'priority', 
                   'assignee', 'reviewer', 'assignee_id', 'reviewer_id', 
                   'due_date', 'comments_count', 'board']
+
+
+class BatchTaskSerializer(TaskSerializer):
+    """Task serializer validating board IDs without a query per item."""
+    
+    board = serializers.IntegerField(source='board_id')
+
+
+class TaskMoveSerializer(serializers.Serializer):
+    """Serializer validating a bulk status/priority/assignee transition."""
     
-    def get_comments_count(self, obj):
-        """Return number of comments on task."""
-        return obj.comments.count()
+    CHANGE_FIELDS = ['status', 'priority', 'assignee_id', 'reviewer_id']
+    
+    task_ids = serializers.ListField(
+        child=serializers.IntegerField(),
+        allow_empty=False,
+        max_length=1000
+    )
+    status = serializers.ChoiceField(
+        choices=Task.STATUS_CHOICES,
+        required=False
+    )
+    priority = serializers.ChoiceField(
+        choices=Task.PRIORITY_CHOICES,
+        required=False
+    )
+    assignee_id = serializers.IntegerField(required=False, allow_null=True)
+    reviewer_id = serializers.IntegerField(required=False, allow_null=True)
+    
+    def validate(self, attrs):
+        """Require at least one change and existing users."""
+        changes = {
+            field: attrs[field]
+            for field in self.CHANGE_FIELDS if field in attrs
+        }
+        if not changes:
+            raise serializers.ValidationError(
+                f"Provide at least one of {', '.join(self.CHANGE_FIELDS)}"
+            )
+        user_ids = {
+            changes.get(field) for field in ('assignee_id', 'reviewer_id')
+        } - {None}
+        found = set(
+            User.objects.filter(id__in=user_ids).values_list('id', flat=True)
+        )
+        if user_ids - found:
+            raise serializers.ValidationError('User not found')
+        attrs['changes'] = changes
+        return attrs
 
 
-class BoardDetailSerializer(serializers.ModelSerializer):
+class BoardDetailSerializer(TimedRepresentationMixin,
+                            serializers.ModelSerializer):
     """Serializer for detailed board view with members and tasks."""
     
     members = UserSerializer(many=True, read_only=True)
     tasks = TaskSerializer(many=True, read_only=True)
-    owner_id = serializers.IntegerField(source='owner.id', read_only=True)
+    owner_id = serializers.IntegerField(read_only=True)
     
     class Meta:
         model = Board
         fields = ['id', 'title', 'owner_id', 'members', 'tasks']
 
 
-class CommentSerializer(serializers.ModelSerializer):
+class CommentSerializer(TimedRepresentationMixin,
+                        serializers.ModelSerializer):
     """Serializer for task comments."""
     
     author = serializers.CharField(
@@ -0,0 +1,76 @@
+"""Delta-sync payloads for boards: everything changed since a version."""
+from kanban_app.changes import collect_changes, UPSERT
+from kanban_app.models import Task, Comment
+from kanban_app.api.serializers import (
+    UserSerializer, TaskSerializer, CommentSerializer
+)
+
+
+def _split(changes):
+    """Split {object_id: (op, parent_id)} into upserted and deleted."""
+    upserted = [pk for pk, (op, _) in changes.items() if op == UPSERT]
+    deleted = {pk: parent for pk, (op, parent) in changes.items()
+               if op != UPSERT}
+    return upserted, deleted
+
+
+def build_changes(board, since):
+    """Return upserted and deleted board data after version since."""
+    changes = collect_changes(board.id, since, board.version)
+
+    task_ids, deleted_tasks = _split(changes.get('task', {}))
+    tasks = list(
+        Task.objects.with_related().filter(board=board, id__in=task_ids)
+    )
+    deleted_tasks.update(
+        dict.fromkeys(set(task_ids) - {task.id for task in tasks})
+    )
+
+    comment_ids, deleted_comments = _split(changes.get('comment', {}))
+    comments = list(
+        Comment.objects.select_related('author').filter(
+            task__board=board, id__in=comment_ids
+        )
+    )
+    for comment_id in set(comment_ids) - {c.id for c in comments}:
+        deleted_comments[comment_id] = changes['comment'][comment_id][1]
+
+    member_ids, deleted_members = _split(changes.get('member', {}))
+    members = list(board.members.filter(id__in=member_ids))
+    deleted_members.update(
+        dict.fromkeys(set(member_ids) - {member.id for member in members})
+    )
+
+    board_data = None
+    if 'board' in changes:
+        board_data = {
+            'id': board.id,
+            'title': board.title,
+            'owner_id': board.owner_id
+        }
+
+    return {
+        'board_id': board.id,
+        'since': since,
+        'version': board.version,
+        'board': board_data,
+        'tasks': {
+            'upserted': TaskSerializer(tasks, many=True).data,
+            'deleted': sorted(deleted_tasks),
+        },
+        'comments': {
+            'upserted': [
+                {**CommentSerializer(comment).data,
+                 'task_id': comment.task_id}
+                for comment in comments
+            ],
+            'deleted': [
+                {'id': pk, 'task_id': task_id}
+                for pk, task_id in sorted(deleted_comments.items())
+            ],
+        },
+        'members': {
+            'upserted': UserSerializer(members, many=True).data,
+            'deleted': sorted(deleted_members),
+        },
+    }
@@ -2,8 +2,9 @@ from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 from kanban_app.api.views import (
     BoardViewSet, TaskViewSet, 
-    CommentListCreateView, CommentDeleteView
+    CommentListCreateView, CommentDeleteView, SearchView, DashboardView
 )
+from kanban_app.api.events import board_events
 
 router = DefaultRouter()
 router.register('boards', BoardViewSet, basename='board')
@@ -11,6 +12,13 @@ router.register('tasks', TaskViewSet, basename='task')
 
 urlpatterns = [
     path('', include(router.urls)),
+    path(
+        'boards/<int:board_id>/events/',
+        board_events,
+        name='board-events'
+    ),
+    path('search/', SearchView.as_view(), name='search'),
+    path('dashboard/', DashboardView.as_view(), name='dashboard'),
     path(
         'tasks/<int:task_id>/comments/', 
         CommentListCreateView.as_view(), 
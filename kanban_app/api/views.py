@@ -4,12 +4,39 @@ from rest_framework.response import Response
 from rest_framework.decorators import action
 from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated
-from django.db import models
-from kanban_app.models import Board, Task, Comment
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from kanban_app.models import Board, Task
 from kanban_app.api.serializers import (
     BoardListSerializer, BoardCreateSerializer,
-    BoardDetailSerializer, TaskSerializer, CommentSerializer
+    BoardDetailSerializer, TaskSerializer, CommentSerializer,
+    TaskMoveSerializer
 )
+from kanban_app.api.sync import build_changes
+from kanban_app.api.batch import TaskBatch
+from kanban_app.api.dashboard import build_dashboard
+from kanban_app.api.events import issue_ticket, ticket_ttl
+from kanban_app.api.filters import TaskListQuery
+from kanban_app.api.readers import (
+    board_detail_data, comment_data, comment_values, task_data, task_values
+)
+from kanban_app.api.conditional import (
+    board_etag, task_etag, board_list_etag, current_board_etag,
+    current_task_etag, is_conditional, is_not_modified, not_modified
+)
+from kanban_app.api.lookups import (
+    get_board, get_task, get_comment, has_board_access
+)
+from kanban_app.api.pagination import (
+    BoardPagination, TaskPagination, CommentPagination
+)
+from kanban_app.changes import record_changes, UPSERT
+from kanban_app.export import export_response
+from kanban_app.importer import FORMATS, BoardImporter, read_records
+from kanban_app.membership import board_ids_for
+from kanban_app.search import get_backend, parse_terms
+from kanban_app.stats import TaskCounts
 from auth_app.models import User
 
 
@@ -17,13 +44,11 @@ class BoardViewSet(viewsets.ModelViewSet):
     """ViewSet for board CRUD operations."""
     
     permission_classes = [IsAuthenticated]
+    pagination_class = BoardPagination
 
     def get_queryset(self):
-        """Return boards where user is owner or member."""
-        user = self.request.user
-        return Board.objects.filter(
-            models.Q(owner=user) | models.Q(members=user)
-        ).distinct()
+        """Return boards where user is owner or member with counts."""
+        return Board.objects.filter(id__in=board_ids_for(self.request.user))
 
     def get_serializer_class(self):
         """Return appropriate serializer based on action."""
@@ -33,6 +58,29 @@ class BoardViewSet(viewsets.ModelViewSet):
             return BoardDetailSerializer
         return BoardListSerializer
 
+    def list(self, request):
+        """List boards, answering 304 when the client copy is current."""
+        etag = None
+        if is_conditional(request):
+            etag = board_list_etag(request)
+            if is_not_modified(request, etag):
+                return not_modified(etag)
+        
+        queryset = self.get_queryset()
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            response = self.get_paginated_response(serializer.data)
+            response['ETag'] = etag or board_list_etag(request)
+            return response
+        
+        boards = list(queryset)
+        serializer = self.get_serializer(boards, many=True)
+        return Response(
+            serializer.data,
+            headers={'ETag': etag or board_list_etag(request, boards)}
+        )
+
     def create(self, request):
         """Create a new board with members."""
         serializer = self.get_serializer(
@@ -41,7 +89,9 @@ class BoardViewSet(viewsets.ModelViewSet):
         )
         if serializer.is_valid():
             board = serializer.save()
-            response_serializer = BoardListSerializer(board)
+            response_serializer = BoardListSerializer(
+                Board.objects.get(pk=board.pk)
+            )
             return Response(
                 response_serializer.data,
                 status=status.HTTP_201_CREATED
@@ -53,40 +103,42 @@ class BoardViewSet(viewsets.ModelViewSet):
     
     def retrieve(self, request, pk=None):
         """Get board details with permission check."""
-        try:
-            board = Board.objects.get(pk=pk)
-        except Board.DoesNotExist:
+        if is_conditional(request):
+            etag = current_board_etag(pk, request.user)
+            if is_not_modified(request, etag):
+                return not_modified(etag)
+        
+        board = get_board(pk, request.user)
+        if board is None:
             return Response(
                 {'error': 'Board not found'},
                 status=status.HTTP_404_NOT_FOUND
             )
         
-        is_member = board.members.filter(id=request.user.id).exists()
-        is_owner = board.owner == request.user
-        
-        if not (is_member or is_owner):
+        if not has_board_access(board):
             return Response(
                 {'error': 'Not a board member'},
                 status=status.HTTP_403_FORBIDDEN
             )
         
-        serializer = BoardDetailSerializer(board)
-        return Response(serializer.data)
+        tasks = Task.objects.with_related().filter(
+            board_id=board.id
+        ).order_by('-id')
+        return Response(
+            board_detail_data(board, tasks),
+            headers={'ETag': board_etag(board.id, board.version)}
+        )
 
     def update(self, request, pk=None, partial=False):
         """Update board title and members."""
-        try:
-            board = Board.objects.get(pk=pk)
-        except Board.DoesNotExist:
+        board = get_board(pk, request.user)
+        if board is None:
             return Response(
                 {'error': 'Board not found'},
                 status=status.HTTP_404_NOT_FOUND
             )
         
-        is_member = board.members.filter(id=request.user.id).exists()
-        is_owner = board.owner == request.user
-        
-        if not (is_member or is_owner):
+        if not has_board_access(board):
             return Response(
                 {'error': 'Not a board member'},
                 status=status.HTTP_403_FORBIDDEN
@@ -96,39 +148,36 @@ class BoardViewSet(viewsets.ModelViewSet):
         member_ids = request.data.get('members', [])
         
         board.title = title
-        board.save()
+        board.save(update_fields=['title'])
         
         if member_ids:
             board.members.set(User.objects.filter(id__in=member_ids))
         
-        owner_data = {
+        board = Board.objects.select_related('owner').prefetch_related(
+            'members'
+        ).get(pk=board.pk)
+        data = BoardListSerializer(board).data
+        data['owner_data'] = {
             'id': board.owner.id,
             'email': board.owner.email,
             'fullname': board.owner.fullname
         }
-        members_data = [
+        data['members_data'] = [
             {'id': m.id, 'email': m.email, 'fullname': m.fullname}
             for m in board.members.all()
         ]
-        
-        return Response({
-            'id': board.id,
-            'title': board.title,
-            'owner_data': owner_data,
-            'members_data': members_data
-        })
+        return Response(data)
     
     def destroy(self, request, pk=None):
         """Delete board (owner only)."""
-        try:
-            board = Board.objects.get(pk=pk)
-        except Board.DoesNotExist:
+        board = get_board(pk, request.user)
+        if board is None:
             return Response(
                 {'error': 'Board not found'},
                 status=status.HTTP_404_NOT_FOUND
             )
         
-        if board.owner != request.user:
+        if not board.is_owner:
             return Response(
                 {'error': 'Not board owner'},
                 status=status.HTTP_403_FORBIDDEN
@@ -137,36 +186,213 @@ class BoardViewSet(viewsets.ModelViewSet):
         board.delete()
         return Response(status=status.HTTP_204_NO_CONTENT)
 
+    @action(detail=True, methods=['post'], url_path='tasks/move')
+    def move_tasks(self, request, pk=None):
+        """Apply one status/priority/assignee change to many tasks."""
+        board = get_board(pk, request.user)
+        if board is None:
+            return Response(
+                {'error': 'Board not found'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        
+        if not has_board_access(board):
+            return Response(
+                {'error': 'Not a board member'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+        
+        serializer = TaskMoveSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(
+                serializer.errors,
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        with transaction.atomic():
+            tasks = Task.objects.filter(
+                board_id=board.id,
+                id__in=serializer.validated_data['task_ids']
+            )
+            # Locked so the counter deltas match what the update replaces.
+            rows = list(tasks.select_for_update().values_list(
+                'id', 'status', 'priority'
+            ))
+            task_ids = [task_id for task_id, _, _ in rows]
+            changes = serializer.validated_data['changes']
+            counts = TaskCounts()
+            for _, old_status, old_priority in rows:
+                counts.remove(board.id, old_status, old_priority)
+                counts.add(board.id, changes.get('status', old_status),
+                           changes.get('priority', old_priority))
+            updated = Task.objects.filter(id__in=task_ids).update(**changes)
+            record_changes(board.id, 'task', task_ids, UPSERT,
+                           counters=counts.pop(board.id))
+        
+        tasks = Task.objects.with_related().filter(id__in=task_ids)
+        return Response({
+            'updated': updated,
+            'tasks': TaskSerializer(tasks, many=True).data
+        })
+
+    @action(detail=True, methods=['get'], url_path='changes')
+    def changes(self, request, pk=None):
+        """Get tasks, comments and members changed since a version."""
+        board = get_board(pk, request.user)
+        if board is None:
+            return Response(
+                {'error': 'Board not found'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        
+        if not has_board_access(board):
+            return Response(
+                {'error': 'Not a board member'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+        
+        try:
+            since = int(request.query_params.get('since', ''))
+        except ValueError:
+            since = -1
+        if since < 0:
+            return Response(
+                {'error': 'Query parameter since must be a version >= 0'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        return Response(build_changes(board, since))
+
+    @action(detail=True, methods=['post'], url_path='events/ticket',
+            url_name='events-ticket')
+    def events_ticket(self, request, pk=None):
+        """Issue a short-lived ticket for the board's event stream."""
+        board = get_board(pk, request.user)
+        if board is None:
+            return Response(
+                {'error': 'Board not found'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        if not has_board_access(board):
+            return Response(
+                {'error': 'Not a board member'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        return Response({
+            'ticket': issue_ticket(request.user, board.id),
+            'expires_in': ticket_ttl(),
+        })
+
+    @action(detail=True, methods=['get'])
+    def export(self, request, pk=None):
+        """Stream the board, members, tasks and comments as NDJSON."""
+        board = get_board(pk, request.user)
+        if board is None:
+            return Response(
+                {'error': 'Board not found'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        
+        if not has_board_access(board):
+            return Response(
+                {'error': 'Not a board member'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+        
+        return export_response(
+            request,
+            Board.objects.filter(pk=board.pk),
+            f'board-{board.pk}.ndjson'
+        )
+
+    @action(detail=False, methods=['post'], url_path='import',
+            url_name='import')
+    def import_boards(self, request):
+        """Import NDJSON or CSV boards owned by the current user.
+
+        The body is read line by line from the request stream, or from
+        an uploaded ``file`` for multipart requests. Imported tasks and
+        comments are created by the current user.
+        """
+        lines, format = self._import_source(request)
+        if lines is None:
+            return Response(
+                {'error': 'Send application/x-ndjson or text/csv, '
+                          'or upload a file'},
+                status=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE
+            )
+
+        importer = BoardImporter(
+            request.user,
+            getattr(settings, 'KANMIND_IMPORT_CHUNK_SIZE', 1000)
+        )
+        stats = importer.run(read_records(lines, format))
+        if stats['rows'] == stats['skipped']:
+            return Response(
+                {'error': 'Nothing to import', **stats},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        return Response(stats, status=status.HTTP_201_CREATED)
+
+    def _import_source(self, request):
+        """Return (line iterable, format) of an import request."""
+        media_type = request.content_type.split(';')[0].strip().lower()
+        if media_type == 'multipart/form-data':
+            upload = request.FILES.get('file')
+            if upload is None:
+                return None, None
+            is_csv = (upload.name.lower().endswith('.csv')
+                      or upload.content_type == FORMATS['csv'])
+            return upload, 'csv' if is_csv else 'ndjson'
+        for format, content_type in FORMATS.items():
+            if media_type == content_type:
+                return request._request, format
+        return None, None
+
 
 class TaskViewSet(viewsets.ModelViewSet):
     """ViewSet for task CRUD operations."""
     
     serializer_class = TaskSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = TaskPagination
+
+    list_actions = ('list', 'assigned_to_me', 'reviewing')
 
     def get_queryset(self):
-        """Return tasks from boards where user is owner or member."""
-        user = self.request.user
-        boards = Board.objects.filter(
-            models.Q(owner=user) | models.Q(members=user)
+        """Return tasks from boards where user is owner or member.
+
+        List actions apply the filters and ordering from the query
+        string; list_response selects the sparse fieldset's columns.
+        """
+        tasks = Task.objects.filter(
+            board_id__in=board_ids_for(self.request.user)
         )
-        return Task.objects.filter(board__in=boards)
+        if self.action in self.list_actions:
+            return self.list_query.apply(tasks)
+        return tasks.with_related()
+
+    @property
+    def list_query(self):
+        """Return the parsed task list query parameters."""
+        if not hasattr(self, '_list_query'):
+            self._list_query = TaskListQuery(
+                self.request.query_params, self.request.user
+            )
+        return self._list_query
 
     def create(self, request):
         """Create a new task with permission check."""
-        board_id = request.data.get('board')
-        try:
-            board = Board.objects.get(id=board_id)
-        except Board.DoesNotExist:
+        board = get_board(request.data.get('board'), request.user)
+        if board is None:
             return Response(
                 {'error': 'Board not found'},
                 status=status.HTTP_404_NOT_FOUND
             )
 
-        is_member = board.members.filter(id=request.user.id).exists()
-        is_owner = board.owner == request.user
-        
-        if not (is_member or is_owner):
+        if not has_board_access(board):
             return Response(
                 {'error': 'Not a board member'},
                 status=status.HTTP_403_FORBIDDEN
@@ -194,40 +420,47 @@ class TaskViewSet(viewsets.ModelViewSet):
     
     def retrieve(self, request, pk=None):
         """Get task details with permission check."""
-        try:
-            task = Task.objects.get(pk=pk)
-        except Task.DoesNotExist:
+        if is_conditional(request):
+            etag = current_task_etag(pk, request.user)
+            if is_not_modified(request, etag):
+                return not_modified(etag)
+        
+        task = get_task(
+            pk, request.user,
+            Task.objects.with_related().annotate(
+                board_version=F('board__version')
+            )
+        )
+        if task is None:
             return Response(
                 {'error': 'Task not found'},
                 status=status.HTTP_404_NOT_FOUND
             )
         
-        is_member = task.board.members.filter(id=request.user.id).exists()
-        is_owner = task.board.owner == request.user
-        
-        if not (is_member or is_owner):
+        if not has_board_access(task):
             return Response(
                 {'error': 'Not a board member'},
                 status=status.HTTP_403_FORBIDDEN
             )
         
         serializer = TaskSerializer(task)
-        return Response(serializer.data)
+        return Response(
+            serializer.data,
+            headers={
+                'ETag': task_etag(task.id, task.board_id, task.board_version)
+            }
+        )
 
     def update(self, request, pk=None, partial=False):
         """Update task with permission check."""
-        try:
-            task = Task.objects.get(pk=pk)
-        except Task.DoesNotExist:
+        task = get_task(pk, request.user)
+        if task is None:
             return Response(
                 {'error': 'Task not found'},
                 status=status.HTTP_404_NOT_FOUND
             )
         
-        is_member = task.board.members.filter(id=request.user.id).exists()
-        is_owner = task.board.owner == request.user
-        
-        if not (is_member or is_owner):
+        if not has_board_access(task):
             return Response(
                 {'error': 'Not a board member'},
                 status=status.HTTP_403_FORBIDDEN
@@ -255,18 +488,16 @@ class TaskViewSet(viewsets.ModelViewSet):
     
     def destroy(self, request, pk=None):
         """Delete task (creator or board owner only)."""
-        try:
-            task = Task.objects.get(pk=pk)
-        except Task.DoesNotExist:
+        task = get_task(pk, request.user, Task.objects.all())
+        if task is None:
             return Response(
                 {'error': 'Task not found'},
                 status=status.HTTP_404_NOT_FOUND
             )
         
-        is_creator = task.created_by == request.user
-        is_board_owner = task.board.owner == request.user
+        is_creator = task.created_by_id == request.user.id
         
-        if not (is_creator or is_board_owner):
+        if not (is_creator or task.is_owner):
             return Response(
                 {'error': 'Not authorized to delete this task'},
                 status=status.HTTP_403_FORBIDDEN
@@ -275,19 +506,67 @@ class TaskViewSet(viewsets.ModelViewSet):
         task.delete()
         return Response(status=status.HTTP_204_NO_CONTENT)
 
+    @action(detail=False, methods=['post'], url_path='batch')
+    def batch(self, request):
+        """Create, update and delete many tasks in one transaction."""
+        operations = request.data
+        if isinstance(operations, dict):
+            operations = operations.get('operations')
+        if not isinstance(operations, list) or not operations:
+            return Response(
+                {'error': 'operations must be a non-empty list'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        batch = TaskBatch(operations, request.user)
+        if len(operations) > batch.max_size:
+            return Response(
+                {'error': f'At most {batch.max_size} operations per batch'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        applied = batch.run()
+        return Response(
+            {'applied': applied, 'results': batch.results},
+            status=status.HTTP_200_OK if applied
+            else status.HTTP_400_BAD_REQUEST
+        )
+
     @action(detail=False, methods=['get'], url_path='assigned-to-me')
     def assigned_to_me(self, request):
         """Get tasks assigned to current user."""
         tasks = self.get_queryset().filter(assignee=request.user)
-        serializer = self.get_serializer(tasks, many=True)
-        return Response(serializer.data)
+        return self.list_response(tasks)
 
     @action(detail=False, methods=['get'], url_path='reviewing')
     def reviewing(self, request):
         """Get tasks where current user is reviewer."""
         tasks = self.get_queryset().filter(reviewer=request.user)
-        serializer = self.get_serializer(tasks, many=True)
-        return Response(serializer.data)
+        return self.list_response(tasks)
+
+    def list(self, request):
+        """List tasks on the user's boards."""
+        return self.list_response(self.get_queryset())
+
+    def list_response(self, queryset):
+        """Return queryset as task dicts, paginated when opted in.
+
+        Cursor pages are always ordered by -id, so an explicit ordering
+        cannot be combined with them.
+        """
+        if (self.list_query.ordering
+                and self.paginator.is_requested(self.request)):
+            return Response(
+                {'error': 'ordering cannot be combined with cursor '
+                          'pagination, which orders by -id'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        fields = self.list_query.fields
+        rows = task_values(queryset, fields)
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(task_data(page, fields))
+        return Response(task_data(rows, fields))
 
 
 class CommentListCreateView(APIView):
@@ -296,42 +575,37 @@ class CommentListCreateView(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request, task_id):
-        """Get all comments for a task."""
-        try:
-            task = Task.objects.get(id=task_id)
-        except Task.DoesNotExist:
+        """Get a task's comments, oldest first, optionally paginated."""
+        task = get_task(task_id, request.user, Task.objects.all())
+        if task is None:
             return Response(
                 {'error': 'Task not found'},
                 status=status.HTTP_404_NOT_FOUND
             )
 
-        is_member = task.board.members.filter(id=request.user.id).exists()
-        is_owner = task.board.owner == request.user
-        
-        if not (is_member or is_owner):
+        if not has_board_access(task):
             return Response(
                 {'error': 'Not a board member'},
                 status=status.HTTP_403_FORBIDDEN
             )
 
-        comments = task.comments.all()
-        serializer = CommentSerializer(comments, many=True)
-        return Response(serializer.data)
+        comments = comment_values(task.comments.all())
+        paginator = CommentPagination()
+        page = paginator.paginate_queryset(comments, request, view=self)
+        if page is not None:
+            return paginator.get_paginated_response(comment_data(page))
+        return Response(comment_data(comments))
 
     def post(self, request, task_id):
         """Create a new comment on a task."""
-        try:
-            task = Task.objects.get(id=task_id)
-        except Task.DoesNotExist:
+        task = get_task(task_id, request.user, Task.objects.all())
+        if task is None:
             return Response(
                 {'error': 'Task not found'},
                 status=status.HTTP_404_NOT_FOUND
             )
 
-        is_member = task.board.members.filter(id=request.user.id).exists()
-        is_owner = task.board.owner == request.user
-        
-        if not (is_member or is_owner):
+        if not has_board_access(task):
             return Response(
                 {'error': 'Not a board member'},
                 status=status.HTTP_403_FORBIDDEN
@@ -357,22 +631,56 @@ class CommentDeleteView(APIView):
 
     def delete(self, request, task_id, comment_id):
         """Delete a comment (author only)."""
-        try:
-            comment = Comment.objects.get(
-                id=comment_id,
-                task_id=task_id
-            )
-        except Comment.DoesNotExist:
+        comment = get_comment(comment_id, task_id, request.user)
+        if comment is None:
             return Response(
                 {'error': 'Comment not found'},
                 status=status.HTTP_404_NOT_FOUND
             )
 
-        if comment.author != request.user:
+        if comment.author_id != request.user.id:
             return Response(
                 {'error': 'Not comment author'},
                 status=status.HTTP_403_FORBIDDEN
             )
 
         comment.delete()
-        return Response(status=status.HTTP_204_NO_CONTENT)
\ No newline at end of file
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class SearchView(APIView):
+    """API view for full-text search across the user's boards."""
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        """Return tasks and comments matching q, best match first."""
+        query = request.query_params.get('q', '')
+        if not parse_terms(query):
+            return Response(
+                {'error': 'Query parameter q is required'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        max_results = getattr(settings, 'KANMIND_SEARCH_MAX_RESULTS', 100)
+        try:
+            limit = int(request.query_params.get('limit', 20))
+        except ValueError:
+            return Response(
+                {'error': 'limit must be an integer'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        limit = min(max(limit, 1), max_results)
+        results = get_backend().search(
+            query, board_ids_for(request.user), limit
+        )
+        return Response(results)
+
+
+class DashboardView(APIView):
+    """API view for the current user's home screen counters."""
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        """Return task counts by status, review and due date."""
+        return Response(build_dashboard(request.user))
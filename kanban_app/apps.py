@@ -4,3 +4,17 @@ from django.apps import AppConfig
 class KanbanAppConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'kanban_app'
+
+    def ready(self):
+        """Connect signal handlers and register system checks."""
+        from django.conf import settings
+        from django.db.backends.signals import connection_created
+        from core import metrics
+        from kanban_app import checks, signals  # noqa: F401
+        if getattr(settings, 'KANMIND_METRICS_ENABLED', False):
+            # Every connection, including those of ASGI worker threads,
+            # counts queries for the request that is current there.
+            connection_created.connect(
+                metrics.install_query_counter,
+                dispatch_uid='kanmind_query_counter',
+            )
@@ -0,0 +1,68 @@
+"""Per-board change versions and change log used for delta sync."""
+from django.db import transaction
+from django.db.models import F
+from kanban_app.models import Board, BoardChange
+from kanban_app.realtime import publish_on_commit
+
+UPSERT = 'upsert'
+DELETE = 'delete'
+
+
+def record_changes(board_id, entity, object_ids, op, parent_ids=None,
+                   counters=None):
+    """Bump a board's version and log one change per object.
+
+    The bump, its read-back and the log rows share one transaction, so
+    concurrent writers to the same board serialize on its row and
+    readers never see a version without its changes; ``counters`` are
+    extra board column updates written by the same statement. Returns
+    the new version or None if the board does not exist.
+    """
+    object_ids = list(object_ids)
+    if not object_ids:
+        return None
+    parent_ids = parent_ids or {}
+    # Join the writer's transaction, if any, instead of a savepoint.
+    with transaction.atomic(savepoint=False):
+        bumped = Board.objects.filter(pk=board_id).update(
+            version=F('version') + 1, **(counters or {})
+        )
+        if not bumped:
+            return None
+        version = Board.objects.filter(pk=board_id).values_list(
+            'version', flat=True
+        ).get()
+        BoardChange.objects.bulk_create([
+            BoardChange(
+                board_id=board_id,
+                version=version,
+                entity=entity,
+                object_id=object_id,
+                parent_id=parent_ids.get(object_id),
+                op=op
+            )
+            for object_id in object_ids
+        ])
+    publish_on_commit(board_id, {
+        'type': 'change',
+        'board_id': board_id,
+        'version': version,
+        'entity': entity,
+        'op': op,
+        'ids': object_ids,
+    })
+    return version
+
+
+def collect_changes(board_id, since, until):
+    """Return the latest op per (entity, object) in (since, until].
+
+    The result maps entity names to ``{object_id: (op, parent_id)}``.
+    """
+    latest = {}
+    rows = BoardChange.objects.filter(
+        board_id=board_id, version__gt=since, version__lte=until
+    ).values_list('entity', 'object_id', 'parent_id', 'op')
+    for entity, object_id, parent_id, op in rows:
+        latest.setdefault(entity, {})[object_id] = (op, parent_id)
+    return latest
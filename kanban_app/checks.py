@@ -0,0 +1,23 @@
+"""System checks for kanban_app settings."""
+from django.conf import settings
+from django.core.checks import Error, Tags, register
+from core.checks import MAX_LOCAL_TTL, cache_is_shared
+
+
+@register(Tags.caches, Tags.security)
+def check_membership_cache(app_configs, **kwargs):
+    """Reject long membership cache timeouts on a process-local cache."""
+    timeout = getattr(settings, 'KANMIND_MEMBERSHIP_CACHE_TIMEOUT',
+                      MAX_LOCAL_TTL)
+    too_long = timeout is None or timeout > MAX_LOCAL_TTL
+    if too_long and not cache_is_shared():
+        return [Error(
+            'KANMIND_MEMBERSHIP_CACHE_TIMEOUT is longer than '
+            f'{MAX_LOCAL_TTL}s but the default cache is process-local, '
+            'so removed members keep access in other workers until it '
+            'expires.',
+            hint='Use a shared cache backend (e.g. Redis) or lower '
+                 'the timeout.',
+            id='kanban_app.E001',
+        )]
+    return []
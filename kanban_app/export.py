@@ -0,0 +1,106 @@
+"""Streaming NDJSON export of boards with members, tasks and comments.
+
+Each line is one JSON object with a ``type`` of board, member, task or
+comment. Users are referenced by email so an export can be imported
+into another database. Rows are read with chunked ``.iterator()``
+querysets and encoded one at a time, so memory stays flat regardless
+of board size.
+"""
+from itertools import islice
+from asgiref.sync import sync_to_async
+from django.http import StreamingHttpResponse
+from core.renderers import FastJSONRenderer
+from kanban_app.models import Board, Task, Comment
+
+CHUNK_SIZE = 2000
+BATCH_LINES = 500
+CONTENT_TYPE = 'application/x-ndjson'
+
+BOARD_COLUMNS = ['id', 'title', 'owner__email', 'version']
+MEMBER_COLUMNS = ['id', 'email', 'fullname']
+TASK_COLUMNS = [
+    'id', 'title', 'description', 'status', 'priority', 'due_date',
+    'assignee__email', 'reviewer__email', 'created_by__email',
+]
+COMMENT_COLUMNS = [
+    'id', 'task_id', 'author__email', 'content', 'created_at',
+]
+RENAMED = {
+    'owner__email': 'owner',
+    'assignee__email': 'assignee',
+    'reviewer__email': 'reviewer',
+    'created_by__email': 'created_by',
+    'author__email': 'author',
+}
+
+_renderer = FastJSONRenderer()
+
+
+def _line(record_type, row):
+    """Return one encoded NDJSON line for a values() row."""
+    record = {'type': record_type}
+    for key, value in row.items():
+        record[RENAMED.get(key, key)] = value
+    return _renderer.render(record) + b'\n'
+
+
+def board_lines(board_queryset, chunk_size=CHUNK_SIZE):
+    """Yield NDJSON lines for every board in board_queryset."""
+    boards = board_queryset.order_by('id').values(*BOARD_COLUMNS)
+    for board in boards.iterator(chunk_size=chunk_size):
+        board_id = board['id']
+        yield _line('board', board)
+        members = Board.members.through.objects.filter(
+            board_id=board_id
+        ).order_by('user_id').values_list(
+            'user_id', 'user__email', 'user__fullname'
+        )
+        for row in members.iterator(chunk_size=chunk_size):
+            yield _line('member', dict(zip(MEMBER_COLUMNS, row)))
+        tasks = Task.objects.filter(board_id=board_id).order_by('id')
+        for row in tasks.values(*TASK_COLUMNS).iterator(
+            chunk_size=chunk_size
+        ):
+            yield _line('task', {'board_id': board_id, **row})
+        comments = Comment.objects.filter(
+            task__board_id=board_id
+        ).order_by('task_id', 'id')
+        for row in comments.values(*COMMENT_COLUMNS).iterator(
+            chunk_size=chunk_size
+        ):
+            yield _line('comment', row)
+
+
+def _batches(lines):
+    """Join lines into larger writes."""
+    while True:
+        batch = b''.join(islice(lines, BATCH_LINES))
+        if not batch:
+            return
+        yield batch
+
+
+async def _async_batches(lines):
+    """Yield batches produced in the sync thread that owns the DB."""
+    batches = _batches(lines)
+    take = sync_to_async(lambda: next(batches, None), thread_sensitive=True)
+    while True:
+        batch = await take()
+        if batch is None:
+            return
+        yield batch
+
+
+def export_response(request, board_queryset, filename):
+    """Return a StreamingHttpResponse of the boards as NDJSON.
+
+    ASGI servers get an async iterator so the export is not buffered.
+    """
+    lines = board_lines(board_queryset)
+    if getattr(request, 'scope', None) is not None:
+        content = _async_batches(lines)
+    else:
+        content = _batches(lines)
+    response = StreamingHttpResponse(content, content_type=CONTENT_TYPE)
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
@@ -0,0 +1,414 @@
+"""Chunked bulk import of boards from NDJSON or CSV.
+
+NDJSON input uses the export format of ``kanban_app.export``: board,
+member, task and comment records with users referenced by email. CSV
+input has one task per row and creates boards by title. Input is read
+line by line and written with ``bulk_create`` in chunks, each chunk in
+its own transaction together with the boards' counters. Memory is
+bounded by the chunk size, the email lookup and the task id map of the
+board being imported.
+
+Imported boards are new, so no change log entries are written for them;
+clients load them with a normal board request.
+"""
+import csv
+import datetime
+import json
+import time
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from auth_app.models import User
+from kanban_app import membership, stats
+from kanban_app.models import Board, Task, Comment
+from kanban_app.stats import TaskCounts
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+CHUNK_SIZE = 1000
+MAX_ERRORS = 100
+FORMATS = {'ndjson': 'application/x-ndjson', 'csv': 'text/csv'}
+CSV_COLUMNS = [
+    'board', 'title', 'description', 'status', 'priority', 'due_date',
+    'assignee', 'reviewer', 'created_by',
+]
+STATUSES = {value for value, _ in Task.STATUS_CHOICES}
+PRIORITIES = {value for value, _ in Task.PRIORITY_CHOICES}
+RECORD_TYPES = ('board', 'member', 'task', 'comment')
+# Fields used as lookup keys; they must be strings, numbers or null.
+SCALAR_FIELDS = ('type', 'id', 'board_id', 'task_id', 'status', 'priority')
+
+
+class InvalidRecord(ValueError):
+    """A record that cannot be imported."""
+
+
+def _loads(line):
+    """Decode one JSON line."""
+    if orjson is not None:
+        try:
+            return orjson.loads(line)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(line)
+
+
+def read_ndjson(lines):
+    """Yield (line number, record) for NDJSON lines.
+
+    Member records in the export carry no board id; they belong to the
+    board record before them.
+    """
+    board_key = None
+    for number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            record = _loads(line)
+        except ValueError:
+            yield number, {'type': 'invalid', 'error': 'Invalid JSON'}
+            continue
+        if not isinstance(record, dict):
+            yield number, {'type': 'invalid',
+                           'error': 'Record must be an object'}
+            continue
+        field = next((
+            field for field in SCALAR_FIELDS
+            if isinstance(record.get(field), (dict, list))
+        ), None)
+        if field is not None:
+            yield number, {'type': 'invalid',
+                           'error': f'{field} must be a string or number'}
+            continue
+        if record.get('type') == 'board':
+            board_key = record.get('id')
+        elif record.get('type') == 'member':
+            record.setdefault('board_id', board_key)
+        yield number, record
+
+
+def read_csv(lines):
+    """Yield (line number, record) for CSV task rows.
+
+    A board record is emitted the first time a board title appears and
+    a member record the first time an assignee or reviewer appears on
+    a board.
+    """
+    reader = csv.DictReader(
+        line.decode('utf-8-sig') if isinstance(line, bytes) else line
+        for line in lines
+    )
+    members = {}
+    for row in reader:
+        number = reader.line_num
+        title = (row.get('board') or '').strip()
+        if not title:
+            yield number, {'type': 'invalid', 'error': 'board is required'}
+            continue
+        if title not in members:
+            members[title] = set()
+            yield number, {'type': 'board', 'id': title, 'title': title}
+        for role in ('assignee', 'reviewer'):
+            email = (row.get(role) or '').strip()
+            if email and email not in members[title]:
+                members[title].add(email)
+                yield number, {'type': 'member', 'board_id': title,
+                               'email': email}
+        record = {
+            key: (row.get(key) or '').strip() or None
+            for key in CSV_COLUMNS[1:]
+        }
+        record.update({'type': 'task', 'board_id': title,
+                       'description': row.get('description') or ''})
+        yield number, record
+
+
+def read_records(lines, format):
+    """Return the record reader for format ('ndjson' or 'csv')."""
+    if format == 'csv':
+        return read_csv(lines)
+    return read_ndjson(lines)
+
+
+def _date(value):
+    """Return an ISO date string as a date, or None."""
+    if not value:
+        return None
+    try:
+        return datetime.date.fromisoformat(str(value))
+    except ValueError:
+        raise InvalidRecord('due_date must be a date (YYYY-MM-DD)')
+
+
+def _datetime(value):
+    """Return an ISO datetime string as an aware datetime, or None."""
+    if not value:
+        return None
+    try:
+        parsed = parse_datetime(str(value))
+    except ValueError:
+        parsed = None
+    if parsed is None:
+        raise InvalidRecord('created_at must be an ISO datetime')
+    if settings.USE_TZ and timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
+
+class BoardImporter:
+    """Insert boards, members, tasks and comments in chunks.
+
+    With an owner every imported board is owned by that user; otherwise
+    the board record's owner email must match an existing user. Unknown
+    assignees and reviewers are left empty and unknown members skipped.
+    Task creators and comment authors are the board owner unless
+    keep_authors is set, which keeps known users named by email; only
+    trusted imports (the management command) should set it.
+    """
+
+    def __init__(self, owner=None, chunk_size=CHUNK_SIZE,
+                 keep_authors=False):
+        """Prepare an import for owner in chunks of chunk_size."""
+        self.owner = owner
+        self.chunk_size = max(chunk_size, 1)
+        self.keep_authors = keep_authors
+        self.users = {}
+        self.boards = {}
+        self.tasks = {}
+        self.current_board = None
+        self.stats = {
+            'rows': 0, 'boards': 0, 'members': 0, 'tasks': 0,
+            'comments': 0, 'skipped': 0, 'errors': [],
+        }
+
+    def run(self, records):
+        """Import (line number, record) pairs and return the stats."""
+        start = time.perf_counter()
+        chunk = []
+        for number, record in records:
+            chunk.append((number, record))
+            if record.get('type') == 'board':
+                self.current_board = record.get('id')
+            if len(chunk) >= self.chunk_size:
+                self._flush(chunk)
+                chunk = []
+        if chunk:
+            self._flush(chunk)
+        elapsed = time.perf_counter() - start
+        self.stats['seconds'] = round(elapsed, 3)
+        self.stats['rows_per_second'] = (
+            round(self.stats['rows'] / elapsed, 1) if elapsed else 0.0
+        )
+        return self.stats
+
+    def fail(self, number, message):
+        """Count a skipped record and keep the first MAX_ERRORS errors."""
+        self.stats['skipped'] += 1
+        if len(self.stats['errors']) < MAX_ERRORS:
+            self.stats['errors'].append({'line': number, 'error': message})
+
+    def _flush(self, chunk):
+        """Write one chunk of records in a transaction."""
+        self.stats['rows'] += len(chunk)
+        grouped = {record_type: [] for record_type in RECORD_TYPES}
+        for number, record in chunk:
+            record_type = record.get('type')
+            if record_type in grouped:
+                grouped[record_type].append((number, record))
+            else:
+                self.fail(number, record.get('error')
+                          or f'Unknown record type: {record_type!r}')
+        self._resolve_users(chunk)
+        touched = set()
+        with transaction.atomic():
+            self._create_boards(grouped['board'], touched)
+            member_boards = self._create_members(grouped['member'], touched)
+            counts = self._create_tasks(grouped['task'])
+            self._create_comments(grouped['comment'])
+            self._update_counters(member_boards, counts)
+            membership.invalidate(touched)
+        # Tasks of earlier boards are no longer referenced by comments.
+        self.tasks = {
+            key: ids for key, ids in self.tasks.items()
+            if key == self.current_board
+        }
+
+    def _resolve_users(self, chunk):
+        """Look up the chunk's unseen emails in one query."""
+        emails = set()
+        for _, record in chunk:
+            for key in ('owner', 'email', 'assignee', 'reviewer',
+                        'created_by', 'author'):
+                value = record.get(key)
+                if isinstance(value, str) and value not in self.users:
+                    emails.add(value)
+        if not emails:
+            return
+        found = dict(
+            User.objects.filter(email__in=emails).values_list('email', 'id')
+        )
+        for email in emails:
+            self.users[email] = found.get(email)
+
+    def _user(self, record, key):
+        """Return the user id for an email field of record, or None."""
+        value = record.get(key)
+        return self.users.get(value) if isinstance(value, str) else None
+
+    def _author(self, record, key, owner_id):
+        """Return the creating user id of a task or comment record."""
+        if not self.keep_authors:
+            return owner_id
+        return self._user(record, key) or owner_id
+
+    def _create_boards(self, items, touched):
+        """Create boards and remember their ids by import key."""
+        boards = []
+        keys = []
+        for number, record in items:
+            owner_id = (self.owner.id if self.owner
+                        else self._user(record, 'owner'))
+            title = str(record.get('title') or '').strip()
+            if record.get('id') is None:
+                self.fail(number, 'Board id is required')
+            elif not title:
+                self.fail(number, 'Board title is required')
+            elif owner_id is None:
+                self.fail(number, 'Unknown board owner')
+            else:
+                boards.append(Board(title=title[:255], owner_id=owner_id))
+                keys.append(record['id'])
+        for key, board in zip(keys, Board.objects.bulk_create(boards)):
+            self.boards[key] = (board.id, board.owner_id)
+            touched.add(board.owner_id)
+        self.stats['boards'] += len(boards)
+
+    def _board(self, record):
+        """Return (board id, owner id) for a record's board key."""
+        board = self.boards.get(record.get('board_id'))
+        if board is None:
+            raise InvalidRecord('Unknown board')
+        return board
+
+    def _create_members(self, items, touched):
+        """Add existing users to boards; return the boards' ids."""
+        through = Board.members.through
+        members = {}
+        for number, record in items:
+            try:
+                board_id, _ = self._board(record)
+            except InvalidRecord as error:
+                self.fail(number, str(error))
+                continue
+            user_id = self._user(record, 'email')
+            if user_id is None:
+                self.fail(number, f'Unknown user: {record.get("email")}')
+                continue
+            members[(board_id, user_id)] = through(
+                board_id=board_id, user_id=user_id
+            )
+            touched.add(user_id)
+        through.objects.bulk_create(members.values(), ignore_conflicts=True)
+        self.stats['members'] += len(members)
+        return {board_id for board_id, _ in members}
+
+    def _task(self, record):
+        """Return an unsaved Task for a task record."""
+        board_id, owner_id = self._board(record)
+        title = str(record.get('title') or '').strip()
+        if not title:
+            raise InvalidRecord('Task title is required')
+        status = record.get('status') or 'to-do'
+        if status not in STATUSES:
+            raise InvalidRecord(f'Invalid status: {status}')
+        priority = record.get('priority') or 'medium'
+        if priority not in PRIORITIES:
+            raise InvalidRecord(f'Invalid priority: {priority}')
+        return Task(
+            board_id=board_id,
+            title=title[:255],
+            description=str(record.get('description') or ''),
+            status=status,
+            priority=priority,
+            due_date=_date(record.get('due_date')),
+            assignee_id=self._user(record, 'assignee'),
+            reviewer_id=self._user(record, 'reviewer'),
+            created_by_id=self._author(record, 'created_by', owner_id),
+        )
+
+    def _create_tasks(self, items):
+        """Create tasks, remember their ids and return counter deltas."""
+        tasks = []
+        keys = []
+        for number, record in items:
+            try:
+                tasks.append(self._task(record))
+            except InvalidRecord as error:
+                self.fail(number, str(error))
+                continue
+            keys.append((record['board_id'], record.get('id')))
+        counts = TaskCounts()
+        for (board_key, key), task in zip(keys,
+                                          Task.objects.bulk_create(tasks)):
+            counts.add(task.board_id, task.status, task.priority)
+            if key is not None:
+                self.tasks.setdefault(board_key, {})[key] = (
+                    task.id, self.boards[board_key][1]
+                )
+        self.stats['tasks'] += len(tasks)
+        return counts
+
+    def _update_counters(self, member_boards, counts):
+        """Write member recounts and task deltas, one UPDATE per board."""
+        for board_id in sorted(member_boards | set(counts.deltas)):
+            changes = counts.pop(board_id)
+            if board_id in member_boards:
+                changes.update(stats.member_recount())
+            Board.objects.filter(pk=board_id).update(**changes)
+
+    def _comment_task(self, record):
+        """Return (task id, board owner id) for a comment's task key."""
+        key = record.get('task_id')
+        for ids in self.tasks.values():
+            if key in ids:
+                return ids[key]
+        raise InvalidRecord('Unknown task')
+
+    def _create_comments(self, items):
+        """Create comments, keeping exported timestamps, and count them."""
+        comments = []
+        created = []
+        for number, record in items:
+            try:
+                task_id, owner_id = self._comment_task(record)
+                content = str(record.get('content') or '')
+                if not content.strip():
+                    raise InvalidRecord('Comment content is required')
+                created_at = _datetime(record.get('created_at'))
+            except InvalidRecord as error:
+                self.fail(number, str(error))
+                continue
+            comments.append(Comment(
+                task_id=task_id,
+                author_id=self._author(record, 'author', owner_id),
+                content=content,
+            ))
+            created.append(created_at)
+        comments = Comment.objects.bulk_create(comments)
+        # auto_now_add overwrites created_at on insert.
+        dated = []
+        for comment, created_at in zip(comments, created):
+            if created_at is not None:
+                comment.created_at = created_at
+                dated.append(comment)
+        if dated:
+            Comment.objects.bulk_update(dated, ['created_at'])
+        if comments:
+            Task.objects.filter(
+                id__in={comment.task_id for comment in comments}
+            ).update(**stats.comment_recount())
+        self.stats['comments'] += len(comments)
@@ -0,0 +1,229 @@
+"""Benchmark every API route and report latency percentiles as JSON."""
+import datetime
+import json
+import platform
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+import django
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext, override_settings
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+from kanban_app.models import Task
+from kanban_app.querycount import CASES, request_options, seed_dataset
+
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+PERCENTILES = (50, 90, 95, 99)
+
+
+def percentile(sorted_values, pct):
+    """Return the nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(int(round(pct / 100 * len(sorted_values))) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+def summarize(timings, elapsed):
+    """Return throughput and latency stats for per-request seconds."""
+    ordered = sorted(timings)
+    stats = {
+        'requests': len(ordered),
+        'rps': round(len(ordered) / elapsed, 1) if elapsed else 0.0,
+        'mean_ms': round(sum(ordered) / len(ordered) * 1000, 3),
+    }
+    for pct in PERCENTILES:
+        stats[f'p{pct}_ms'] = round(percentile(ordered, pct) * 1000, 3)
+    stats['max_ms'] = round(ordered[-1] * 1000, 3)
+    return stats
+
+
+class Command(BaseCommand):
+    """Drive each API route and report throughput and latency."""
+
+    help = ('Benchmark every API route through the test client or a live '
+            'server and print JSON results.')
+
+    def add_arguments(self, parser):
+        """Add benchmark arguments."""
+        parser.add_argument('--iterations', type=int, default=50)
+        parser.add_argument('--warmup', type=int, default=5)
+        parser.add_argument(
+            '--tasks', type=int, default=1000,
+            help='Tasks on the benchmark board created for this run.'
+        )
+        parser.add_argument(
+            '--url',
+            help='Base URL of a running server, e.g. http://127.0.0.1:8000. '
+                 'Only read-only routes are run in this mode.'
+        )
+        parser.add_argument(
+            '--routes', nargs='*', default=[],
+            help='Only run cases whose "METHOD name" key contains one of '
+                 'these strings.'
+        )
+        parser.add_argument('--output', help='Also write results to a file.')
+        parser.add_argument(
+            '--compare',
+            help='Earlier results file; adds p50/rps ratios per route.'
+        )
+
+    def handle(self, *args, **options):
+        """Create the benchmark fixture, run all cases and print JSON."""
+        if options['iterations'] < 1:
+            raise CommandError('--iterations must be at least 1.')
+        cases = [
+            case for case in CASES
+            if not options['routes']
+            or any(part in case.key for part in options['routes'])
+        ]
+        if options['url']:
+            cases = [c for c in cases if c.method in SAFE_METHODS]
+            routes = self._run_live(cases, options)
+        else:
+            routes = self._run_client(cases, options)
+        results = {'meta': self._meta(options), 'routes': routes}
+        if options['compare']:
+            self._compare(results, options['compare'])
+        output = json.dumps(results, indent=2)
+        if options['output']:
+            Path(options['output']).write_text(output + '\n')
+        self.stdout.write(output)
+
+    def _label(self):
+        """Return a unique fixture label for this run."""
+        return f"bench-{datetime.datetime.now():%Y%m%d%H%M%S%f}"
+
+    def _run_client(self, cases, options):
+        """Run cases in-process inside a rolled-back transaction."""
+        hosts = [*settings.ALLOWED_HOSTS, 'testserver']
+        with override_settings(ALLOWED_HOSTS=hosts), transaction.atomic():
+            ds = seed_dataset(options['tasks'], self._label())
+            token = Token.objects.create(user=ds.owner)
+            routes = {
+                case.key: self._bench(
+                    lambda case=case: self._client_request(case, ds, token),
+                    case, options
+                )
+                for case in cases
+            }
+            transaction.set_rollback(True)
+        return routes
+
+    def _client_request(self, case, ds, token):
+        """Send one request through the test client; return its status."""
+        client = APIClient()
+        if case.authenticated:
+            client.credentials(HTTP_AUTHORIZATION=f'Token {token.key}')
+        send = getattr(client, case.method.lower())
+        if case.method in SAFE_METHODS:
+            response = send(case.path(ds), case.query)
+            if response.streaming:
+                b''.join(response.streaming_content)
+            return response.status_code
+        data = case.data(ds) if case.data else None
+        with transaction.atomic():
+            status_code = send(self._path(case, ds), data,
+                               **request_options(case)).status_code
+            transaction.set_rollback(True)
+        return status_code
+
+    def _run_live(self, cases, options):
+        """Run read-only cases against a live server."""
+        ds = seed_dataset(options['tasks'], self._label())
+        token = Token.objects.create(user=ds.owner)
+        base = options['url'].rstrip('/')
+        try:
+            return {
+                case.key: self._bench(
+                    lambda case=case: self._live_request(
+                        base + self._path(case, ds),
+                        token.key if case.authenticated else None
+                    ),
+                    case, options, count_queries=False
+                )
+                for case in cases
+            }
+        finally:
+            ds.owner.delete()
+            ds.member.delete()
+
+    def _live_request(self, url, key):
+        """Send one HTTP GET and return its status."""
+        request = urllib.request.Request(url)
+        if key:
+            request.add_header('Authorization', f'Token {key}')
+        try:
+            with urllib.request.urlopen(request) as response:
+                response.read()
+                return response.status
+        except urllib.error.HTTPError as error:
+            return error.code
+
+    def _path(self, case, ds):
+        """Return the case path including its query string."""
+        path = case.path(ds)
+        if case.query:
+            path += '?' + '&'.join(f'{k}={v}' for k, v in case.query.items())
+        return path
+
+    def _bench(self, send, case, options, count_queries=True):
+        """Warm up, then time iterations of send."""
+        for _ in range(options['warmup']):
+            send()
+        queries = None
+        if count_queries:
+            with CaptureQueriesContext(connection) as captured:
+                send()
+            queries = len(captured)
+        timings = []
+        statuses = set()
+        start = time.perf_counter()
+        for _ in range(options['iterations']):
+            began = time.perf_counter()
+            statuses.add(send())
+            timings.append(time.perf_counter() - began)
+        elapsed = time.perf_counter() - start
+        stats = summarize(timings, elapsed)
+        stats['status'] = sorted(statuses)
+        stats['expected_status'] = case.expected_status
+        if queries is not None:
+            stats['queries'] = queries
+        return stats
+
+    def _meta(self, options):
+        """Return run metadata for comparing results over time."""
+        return {
+            'timestamp': datetime.datetime.now(
+                datetime.timezone.utc
+            ).isoformat(timespec='seconds'),
+            'mode': 'live' if options['url'] else 'client',
+            'url': options['url'],
+            'iterations': options['iterations'],
+            'warmup': options['warmup'],
+            'fixture_tasks': options['tasks'],
+            'tasks_in_db': Task.objects.count(),
+            'database': connection.vendor,
+            'python': platform.python_version(),
+            'django': django.get_version(),
+        }
+
+    def _compare(self, results, path):
+        """Add ratios against an earlier run to each shared route."""
+        try:
+            baseline = json.loads(Path(path).read_text())['routes']
+        except (OSError, ValueError, KeyError) as error:
+            raise CommandError(f'Cannot read baseline {path}: {error}')
+        for key, stats in results['routes'].items():
+            before = baseline.get(key)
+            if not before:
+                continue
+            stats['vs_baseline'] = {
+                'p50': round(stats['p50_ms'] / max(before['p50_ms'], 1e-9),
+                             2),
+                'rps': round(stats['rps'] / max(before['rps'], 1e-9), 2),
+            }
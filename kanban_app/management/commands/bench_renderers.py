@@ -0,0 +1,51 @@
+"""Benchmark JSON renderers on a large board detail payload."""
+import json
+import time
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+from core import renderers
+from core.renderers import FastJSONRenderer
+from kanban_app.api.serializers import BoardDetailSerializer
+from kanban_app.models import Board
+from kanban_app.querycount import seed_dataset
+
+
+class Command(BaseCommand):
+    """Compare JSONRenderer and FastJSONRenderer on board detail data."""
+
+    help = 'Benchmark JSON renderers on BoardDetailSerializer output.'
+
+    def add_arguments(self, parser):
+        """Add task count and iteration arguments."""
+        parser.add_argument('--tasks', type=int, default=5000)
+        parser.add_argument('--iterations', type=int, default=20)
+
+    def handle(self, *args, **options):
+        """Seed a board, render its detail with both renderers, print JSON."""
+        with transaction.atomic():
+            ds = seed_dataset(options['tasks'], 'bench-renderers')
+            board = Board.objects.with_detail().get(pk=ds.board.pk)
+            data = BoardDetailSerializer(board).data
+            transaction.set_rollback(True)
+        iterations = options['iterations']
+        stock, stock_body = self._run(JSONRenderer(), data, iterations)
+        fast, fast_body = self._run(FastJSONRenderer(), data, iterations)
+        results = {
+            'tasks': options['tasks'],
+            'bytes': len(stock_body),
+            'encoder': 'orjson' if renderers.orjson else 'stdlib',
+            'stock_ms': stock,
+            'fast_ms': fast,
+            'identical': stock_body == fast_body,
+            'speedup': round(stock / max(fast, 1e-9), 1),
+        }
+        self.stdout.write(json.dumps(results, indent=2))
+
+    def _run(self, renderer, data, iterations):
+        """Return mean milliseconds per render and the rendered body."""
+        start = time.perf_counter()
+        for _ in range(iterations):
+            body = renderer.render(data)
+        elapsed = time.perf_counter() - start
+        return round(elapsed / iterations * 1000, 2), body
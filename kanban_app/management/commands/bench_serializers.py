@@ -0,0 +1,66 @@
+"""Benchmark DRF serializers against the values() read path."""
+import json
+import time
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+from kanban_app.api.readers import task_data, task_values
+from kanban_app.api.serializers import TaskSerializer
+from kanban_app.querycount import seed_dataset
+from kanban_app.models import Task
+
+
+class Command(BaseCommand):
+    """Compare task list serialization paths on a throwaway board."""
+
+    help = 'Benchmark TaskSerializer against the values() read path.'
+
+    def add_arguments(self, parser):
+        """Add task count and repeat arguments."""
+        parser.add_argument('--tasks', type=int, default=10000)
+        parser.add_argument('--repeat', type=int, default=3)
+
+    def handle(self, *args, **options):
+        """Seed tasks, time both paths and print JSON."""
+        with transaction.atomic():
+            ds = seed_dataset(options['tasks'], 'bench-serializers')
+            queryset = Task.objects.with_related().filter(
+                board=ds.board
+            ).order_by('-id')
+            drf = self._run(
+                lambda: TaskSerializer(list(queryset), many=True).data,
+                options['repeat']
+            )
+            fast = self._run(
+                lambda: task_data(task_values(queryset)), options['repeat']
+            )
+            transaction.set_rollback(True)
+        results = {
+            'tasks': options['tasks'],
+            'drf': drf['stats'],
+            'values': fast['stats'],
+            'identical': drf['body'] == fast['body'],
+            'speedup': round(
+                drf['stats']['total_ms']
+                / max(fast['stats']['total_ms'], 1e-9), 1
+            ),
+        }
+        self.stdout.write(json.dumps(results, indent=2))
+
+    def _run(self, build, repeat):
+        """Return the best of repeat timings and the rendered body."""
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            data = build()
+            built = time.perf_counter()
+            body = JSONRenderer().render(data)
+            done = time.perf_counter()
+            timing = {
+                'build_ms': round((built - start) * 1000, 1),
+                'render_ms': round((done - built) * 1000, 1),
+                'total_ms': round((done - start) * 1000, 1),
+            }
+            if best is None or timing['total_ms'] < best['total_ms']:
+                best = timing
+        return {'stats': best, 'body': body}
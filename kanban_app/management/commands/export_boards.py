@@ -0,0 +1,49 @@
+"""Export boards with members, tasks and comments as NDJSON."""
+import sys
+import time
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from kanban_app.export import CHUNK_SIZE, board_lines
+from kanban_app.models import Board
+
+
+class Command(BaseCommand):
+    """Stream many boards to one NDJSON file from a single snapshot."""
+
+    help = 'Export boards, members, tasks and comments as NDJSON.'
+
+    def add_arguments(self, parser):
+        """Add board selection and output arguments."""
+        parser.add_argument('board_ids', nargs='*', type=int)
+        parser.add_argument('--all', action='store_true',
+                            help='Export every board.')
+        parser.add_argument('--owner',
+                            help='Export boards owned by this email.')
+        parser.add_argument('--output', '-o',
+                            help='Output file (default: stdout).')
+        parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        """Write the selected boards and report counts on stderr."""
+        boards = Board.objects.all()
+        if options['board_ids']:
+            boards = boards.filter(id__in=options['board_ids'])
+        if options['owner']:
+            boards = boards.filter(owner__email=options['owner'])
+        if not (options['all'] or options['board_ids']
+                or options['owner']):
+            raise CommandError('Pass board ids, --owner or --all.')
+        start = time.perf_counter()
+        lines = 0
+        with transaction.atomic(), self._open(options['output']) as out:
+            for line in board_lines(boards, options['chunk_size']):
+                out.write(line)
+                lines += 1
+        elapsed = time.perf_counter() - start
+        self.stderr.write(f'Exported {lines} lines in {elapsed:.1f}s.')
+
+    def _open(self, path):
+        """Return a binary output stream for path or stdout."""
+        if path:
+            return open(path, 'wb')
+        return open(sys.stdout.fileno(), 'wb', closefd=False)
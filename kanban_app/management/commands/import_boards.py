@@ -0,0 +1,72 @@
+"""Import boards with members, tasks and comments from NDJSON or CSV."""
+import json
+import sys
+from django.core.management.base import BaseCommand, CommandError
+from auth_app.models import User
+from kanban_app.importer import (
+    CHUNK_SIZE, FORMATS, BoardImporter, read_records
+)
+
+
+class Command(BaseCommand):
+    """Stream a file into the database in chunked bulk inserts.
+
+    Unlike the API endpoint, task creators and comment authors named by
+    email are kept.
+    """
+
+    help = ('Import boards, members, tasks and comments from an NDJSON '
+            'export or a CSV file of tasks.')
+
+    def add_arguments(self, parser):
+        """Add input, format and ownership arguments."""
+        parser.add_argument('path', help='Input file, or - for stdin.')
+        parser.add_argument(
+            '--format', choices=sorted(FORMATS),
+            help='Input format (default: csv for .csv files, else ndjson).'
+        )
+        parser.add_argument(
+            '--owner',
+            help='Email of the user owning every imported board '
+                 '(default: the owner named in each board record).'
+        )
+        parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE)
+        parser.add_argument('--json', action='store_true',
+                            help='Print the full stats as JSON.')
+
+    def handle(self, *args, **options):
+        """Run the import and report counts and rows per second."""
+        owner = None
+        if options['owner']:
+            owner = User.objects.filter(email=options['owner']).first()
+            if owner is None:
+                raise CommandError(f'Unknown owner: {options["owner"]}')
+        path = options['path']
+        format = options['format'] or (
+            'csv' if path.lower().endswith('.csv') else 'ndjson'
+        )
+        importer = BoardImporter(owner, options['chunk_size'],
+                                 keep_authors=True)
+        with self._open(path) as lines:
+            stats = importer.run(read_records(lines, format))
+        if options['json']:
+            self.stdout.write(json.dumps(stats, indent=2))
+            return
+        for error in stats['errors']:
+            self.stderr.write(f'Line {error["line"]}: {error["error"]}')
+        self.stdout.write(
+            f'Imported {stats["boards"]} boards, {stats["members"]} '
+            f'members, {stats["tasks"]} tasks and {stats["comments"]} '
+            f'comments ({stats["rows"]} rows, {stats["skipped"]} skipped) '
+            f'in {stats["seconds"]:.1f}s, '
+            f'{stats["rows_per_second"]:.0f} rows/s.'
+        )
+
+    def _open(self, path):
+        """Return a binary input stream for path or stdin."""
+        if path == '-':
+            return open(sys.stdin.fileno(), 'rb', closefd=False)
+        try:
+            return open(path, 'rb')
+        except OSError as error:
+            raise CommandError(f'Cannot read {path}: {error}')
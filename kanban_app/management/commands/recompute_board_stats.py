@@ -0,0 +1,41 @@
+"""Recount denormalized board counters and repair drift."""
+import time
+from django.core.management.base import BaseCommand, CommandError
+from kanban_app import stats
+from kanban_app.models import Board
+
+
+class Command(BaseCommand):
+    """Compare board counters with a recount and rewrite drifted ones."""
+
+    help = ('Recompute task and member counters on boards and fix any '
+            'that drifted.')
+
+    def add_arguments(self, parser):
+        """Add board selection and check-only arguments."""
+        parser.add_argument('board_ids', nargs='*', type=int)
+        parser.add_argument('--chunk-size', type=int, default=1000)
+        parser.add_argument(
+            '--check', action='store_true',
+            help='Only report drift; exit with an error if any is found.'
+        )
+
+    def handle(self, *args, **options):
+        """Recount the selected boards and report drift."""
+        boards = Board.objects.all()
+        if options['board_ids']:
+            boards = boards.filter(id__in=options['board_ids'])
+        start = time.perf_counter()
+        checked, drifted = stats.recompute(
+            boards, max(options['chunk_size'], 1), dry_run=options['check']
+        )
+        elapsed = time.perf_counter() - start
+        if options['check'] and drifted:
+            raise CommandError(
+                f'{drifted} of {checked} boards have drifted counters.'
+            )
+        verb = 'Found' if options['check'] else 'Repaired'
+        self.stdout.write(self.style.SUCCESS(
+            f'Checked {checked} boards in {elapsed:.1f}s. '
+            f'{verb} {drifted} with drift.'
+        ))
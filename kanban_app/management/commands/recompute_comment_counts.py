@@ -0,0 +1,44 @@
+"""Check and repair the denormalized comment count on tasks."""
+import time
+from django.core.management.base import BaseCommand, CommandError
+from kanban_app import stats
+from kanban_app.models import Task
+
+
+class Command(BaseCommand):
+    """Compare task comment counts with a recount and fix drifted ones."""
+
+    help = 'Recompute comments_count on tasks and fix any that drifted.'
+
+    def add_arguments(self, parser):
+        """Add task selection and check-only arguments."""
+        parser.add_argument('task_ids', nargs='*', type=int)
+        parser.add_argument('--board', type=int, action='append',
+                            help='Only tasks on this board (repeatable).')
+        parser.add_argument('--chunk-size', type=int, default=1000)
+        parser.add_argument(
+            '--check', action='store_true',
+            help='Only report drift; exit with an error if any is found.'
+        )
+
+    def handle(self, *args, **options):
+        """Recount the selected tasks and report drift."""
+        tasks = Task.objects.all()
+        if options['task_ids']:
+            tasks = tasks.filter(id__in=options['task_ids'])
+        if options['board']:
+            tasks = tasks.filter(board_id__in=options['board'])
+        start = time.perf_counter()
+        checked, drifted = stats.recompute_comment_counts(
+            tasks, max(options['chunk_size'], 1), dry_run=options['check']
+        )
+        elapsed = time.perf_counter() - start
+        if options['check'] and drifted:
+            raise CommandError(
+                f'{drifted} of {checked} tasks have a drifted comment count.'
+            )
+        verb = 'Found' if options['check'] else 'Repaired'
+        self.stdout.write(self.style.SUCCESS(
+            f'Checked {checked} tasks in {elapsed:.1f}s. '
+            f'{verb} {drifted} with drift.'
+        ))
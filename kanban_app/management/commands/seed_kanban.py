@@ -0,0 +1,216 @@
+"""Generate synthetic users, boards, tasks and comments at scale."""
+import datetime
+import random
+import time
+from itertools import accumulate
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from auth_app.models import User
+from kanban_app import stats
+from kanban_app.models import Board, Task, Comment
+
+STATUS_WEIGHTS = {'to-do': 35, 'in-progress': 25, 'review': 10, 'done': 30}
+PRIORITY_WEIGHTS = {'low': 30, 'medium': 50, 'high': 20}
+WORDS = (
+    'api', 'login', 'board', 'sync', 'cache', 'deploy', 'report', 'search',
+    'invoice', 'export', 'import', 'mobile', 'email', 'layout', 'billing',
+    'onboarding', 'docs', 'release', 'metrics', 'backup',
+)
+VERBS = ('Fix', 'Add', 'Refactor', 'Review', 'Update', 'Remove', 'Test')
+
+
+def _chunks(iterable, size):
+    """Yield lists of at most size items from iterable."""
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class Command(BaseCommand):
+    """Bulk-create a realistic Kanban dataset in chunks."""
+
+    help = 'Seed users, boards, memberships, tasks and comments.'
+
+    def add_arguments(self, parser):
+        """Add scale and generator arguments."""
+        parser.add_argument('--users', type=int, default=200)
+        parser.add_argument('--boards', type=int, default=100)
+        parser.add_argument('--tasks', type=int, default=10000)
+        parser.add_argument(
+            '--comments-per-task', type=float, default=1.5,
+            help='Average comments per task (geometric distribution).'
+        )
+        parser.add_argument('--max-members', type=int, default=12)
+        parser.add_argument('--chunk-size', type=int, default=5000)
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument(
+            '--prefix', default='seed',
+            help='Local part prefix of generated user emails.'
+        )
+        parser.add_argument('--password', default='seed1234')
+        parser.add_argument(
+            '--flush', action='store_true',
+            help='Delete data from a previous run with the same prefix.'
+        )
+
+    def handle(self, *args, **options):
+        """Generate the dataset and print a summary."""
+        if min(options['users'], options['boards']) < 1:
+            raise CommandError('--users and --boards must be at least 1.')
+        if options['chunk_size'] < 1:
+            raise CommandError('--chunk-size must be at least 1.')
+        self.verbosity = options['verbosity']
+        self.rng = random.Random(options['seed'])
+        self.chunk_size = options['chunk_size']
+        self.prefix = options['prefix']
+        existing = User.objects.filter(email__startswith=f'{self.prefix}-')
+        if options['flush']:
+            existing.delete()
+        elif existing.exists():
+            raise CommandError(
+                f'Users with prefix "{self.prefix}" exist; '
+                'use --flush or another --prefix.'
+            )
+        start = time.perf_counter()
+        users = self._create_users(options['users'], options['password'])
+        boards = self._create_boards(users, options['boards'],
+                                     options['max_members'])
+        tasks, comments = self._create_tasks(
+            boards, options['tasks'], options['comments_per_task']
+        )
+        seeded = Board.objects.filter(
+            owner__email__startswith=f'{self.prefix}-'
+        )
+        stats.recompute(seeded, self.chunk_size)
+        stats.recompute_comment_counts(
+            Task.objects.filter(board__in=seeded), self.chunk_size
+        )
+        elapsed = time.perf_counter() - start
+        self.stdout.write(self.style.SUCCESS(
+            f'Seeded {len(users)} users, {len(boards)} boards, '
+            f'{tasks} tasks and {comments} comments in {elapsed:.1f}s.'
+        ))
+
+    def _log(self, message):
+        """Write a progress line when verbosity allows."""
+        if self.verbosity > 1:
+            self.stdout.write(message)
+
+    def _create_users(self, count, password):
+        """Create users sharing one password hash and return their ids."""
+        hashed = make_password(password)
+        ids = []
+        rows = (
+            User(email=f'{self.prefix}-{index}@kanmind.local',
+                 fullname=f'Seed User {index}', password=hashed)
+            for index in range(count)
+        )
+        for chunk in _chunks(rows, self.chunk_size):
+            with transaction.atomic():
+                ids.extend(u.id for u in User.objects.bulk_create(chunk))
+        self._log(f'users: {len(ids)}')
+        return ids
+
+    def _create_boards(self, users, count, max_members):
+        """Create boards with owners and members; return member lists."""
+        boards = []
+        Membership = Board.members.through
+        for offset in range(0, count, self.chunk_size):
+            size = min(self.chunk_size, count - offset)
+            owners = [self.rng.choice(users) for _ in range(size)]
+            with transaction.atomic():
+                created = Board.objects.bulk_create([
+                    Board(title=self._title('Board', offset + index),
+                          owner_id=owner)
+                    for index, owner in enumerate(owners)
+                ])
+                memberships = []
+                for board, owner in zip(created, owners):
+                    members = self._members(users, owner, max_members)
+                    memberships.extend(
+                        Membership(board_id=board.id, user_id=user_id)
+                        for user_id in members
+                    )
+                    boards.append((board.id, owner, members))
+                Membership.objects.bulk_create(
+                    memberships, batch_size=self.chunk_size
+                )
+        self._log(f'boards: {len(boards)}')
+        return boards
+
+    def _members(self, users, owner, max_members):
+        """Return the owner plus a skewed-small sample of other users."""
+        upper = min(max_members, len(users))
+        size = min(upper, 1 + int(self.rng.paretovariate(1.5)))
+        others = self.rng.sample(users, size)
+        return [owner] + [u for u in others if u != owner][:size - 1]
+
+    def _create_tasks(self, boards, count, comments_per_task):
+        """Create tasks skewed towards a few large boards, plus comments."""
+        weights = list(accumulate(
+            1 / (rank + 1) ** 0.8 for rank in range(len(boards))
+        ))
+        statuses = list(STATUS_WEIGHTS)
+        status_weights = list(accumulate(STATUS_WEIGHTS.values()))
+        priorities = list(PRIORITY_WEIGHTS)
+        priority_weights = list(accumulate(PRIORITY_WEIGHTS.values()))
+        today = datetime.date.today()
+        comment_total = 0
+        created_total = 0
+        for offset in range(0, count, self.chunk_size):
+            size = min(self.chunk_size, count - offset)
+            picks = self.rng.choices(boards, cum_weights=weights, k=size)
+            chunk = []
+            rng = self.rng
+            for index, (board_id, _, members) in enumerate(picks):
+                chunk.append(Task(
+                    board_id=board_id,
+                    title=self._title(rng.choice(VERBS), offset + index),
+                    description=' '.join(rng.choices(WORDS, k=12)),
+                    status=rng.choices(statuses,
+                                       cum_weights=status_weights)[0],
+                    priority=rng.choices(priorities,
+                                         cum_weights=priority_weights)[0],
+                    assignee_id=(rng.choice(members)
+                                 if rng.random() < 0.8 else None),
+                    reviewer_id=(rng.choice(members)
+                                 if rng.random() < 0.4 else None),
+                    due_date=(today + datetime.timedelta(
+                        days=rng.randint(-60, 60)
+                    ) if rng.random() < 0.6 else None),
+                    created_by_id=rng.choice(members),
+                ))
+            with transaction.atomic():
+                created = Task.objects.bulk_create(chunk)
+                comment_total += self._create_comments(
+                    created, picks, comments_per_task
+                )
+            created_total += len(created)
+            self._log(f'tasks: {created_total}/{count}')
+        return created_total, comment_total
+
+    def _create_comments(self, tasks, picks, average):
+        """Create a geometric number of comments per task."""
+        if average <= 0:
+            return 0
+        stop = 1 / (1 + average)
+        comments = []
+        for task, (_, _, members) in zip(tasks, picks):
+            while self.rng.random() > stop:
+                comments.append(Comment(
+                    task_id=task.id,
+                    author_id=self.rng.choice(members),
+                    content=' '.join(self.rng.choices(WORDS, k=8)),
+                ))
+        Comment.objects.bulk_create(comments, batch_size=self.chunk_size)
+        return len(comments)
+
+    def _title(self, prefix, index):
+        """Return a short generated title."""
+        return f'{prefix} {self.rng.choice(WORDS)} #{index}'
@@ -0,0 +1,84 @@
+"""Cross-request cache of the boards each user can access.
+
+Invalidations only reach processes sharing the default cache; with a
+process-local cache the timeout bounds how long other workers keep a
+revoked access, so the ``kanban_app.E001`` check keeps it short.
+"""
+import threading
+from collections import namedtuple
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from kanban_app.models import Board
+
+CACHE_KEY = 'kanban:board-access:{}'
+
+BoardAccess = namedtuple('BoardAccess', ['owned', 'member'])
+
+_stats_lock = threading.Lock()
+_stats = {'hits': 0, 'misses': 0, 'invalidations': 0}
+
+
+def _count(name, amount=1):
+    """Increment a cache statistics counter."""
+    with _stats_lock:
+        _stats[name] += amount
+
+
+def get_stats():
+    """Return a snapshot of cache hit, miss and invalidation counters."""
+    with _stats_lock:
+        return dict(_stats)
+
+
+def reset_stats():
+    """Reset all cache statistics counters to zero."""
+    with _stats_lock:
+        for name in _stats:
+            _stats[name] = 0
+
+
+def _load(user):
+    """Load owned and member board IDs for a user in one query."""
+    owned, member = set(), set()
+    rows = Board.objects.for_user(user).with_access(user).values_list(
+        'id', 'is_owner', 'is_member'
+    )
+    for board_id, is_owner, is_member in rows:
+        if is_owner:
+            owned.add(board_id)
+        if is_member:
+            member.add(board_id)
+    return BoardAccess(frozenset(owned), frozenset(member))
+
+
+def get_board_access(user):
+    """Return the cached BoardAccess of a user, loading it on a miss."""
+    key = CACHE_KEY.format(user.id)
+    access = cache.get(key)
+    if access is not None:
+        _count('hits')
+        return access
+    _count('misses')
+    access = _load(user)
+    cache.set(
+        key, access,
+        getattr(settings, 'KANMIND_MEMBERSHIP_CACHE_TIMEOUT', 5)
+    )
+    return access
+
+
+def board_ids_for(user):
+    """Return IDs of all boards the user owns or is a member of."""
+    access = get_board_access(user)
+    return access.owned | access.member
+
+
+def invalidate(user_ids):
+    """Drop cached access for users now and again after commit."""
+    keys = [CACHE_KEY.format(user_id) for user_id in set(user_ids)]
+    if not keys:
+        return
+    _count('invalidations', len(keys))
+    cache.delete_many(keys)
+    transaction.on_commit(lambda: cache.delete_many(keys))
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.8 on 2026-10-17 04:32
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kanban_app', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='board',
+            name='version',
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+        migrations.CreateModel(
+            name='BoardChange',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('version', models.PositiveBigIntegerField()),
+                ('entity', models.CharField(choices=[('board', 'Board'), ('task', 'Task'), ('comment', 'Comment'), ('member', 'Member')], max_length=10)),
+                ('object_id', models.PositiveBigIntegerField()),
+                ('parent_id', models.PositiveBigIntegerField(blank=True, null=True)),
+                ('op', models.CharField(choices=[('upsert', 'Upsert'), ('delete', 'Delete')], max_length=10)),
+                ('board', models.ForeignKey(db_constraint=False, db_index=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='changes', to='kanban_app.board')),
+            ],
+            options={
+                'verbose_name': 'Board change',
+                'verbose_name_plural': 'Board changes',
+                'ordering': ['version', 'id'],
+                'indexes': [models.Index(fields=['board', 'version'], name='kanban_app__board_i_7c4c5e_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,63 @@
+"""Create the SQLite FTS5 search table and its sync triggers."""
+from django.db import migrations
+
+CREATE_SQL = [
+    "CREATE VIRTUAL TABLE kanban_search USING fts5("
+    "title, body, task_id UNINDEXED, "
+    "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')",
+    "CREATE TRIGGER kanban_search_task_ai AFTER INSERT ON kanban_app_task "
+    "BEGIN INSERT INTO kanban_search (rowid, title, body, task_id) "
+    "VALUES (new.id * 2, new.title, new.description, new.id); END",
+    "CREATE TRIGGER kanban_search_task_au "
+    "AFTER UPDATE OF title, description ON kanban_app_task "
+    "BEGIN UPDATE kanban_search SET title = new.title, "
+    "body = new.description WHERE rowid = new.id * 2; END",
+    "CREATE TRIGGER kanban_search_task_ad AFTER DELETE ON kanban_app_task "
+    "BEGIN DELETE FROM kanban_search WHERE rowid = old.id * 2; END",
+    "CREATE TRIGGER kanban_search_comment_ai "
+    "AFTER INSERT ON kanban_app_comment "
+    "BEGIN INSERT INTO kanban_search (rowid, title, body, task_id) "
+    "VALUES (new.id * 2 + 1, '', new.content, new.task_id); END",
+    "CREATE TRIGGER kanban_search_comment_au "
+    "AFTER UPDATE OF content, task_id ON kanban_app_comment "
+    "BEGIN UPDATE kanban_search SET body = new.content, "
+    "task_id = new.task_id WHERE rowid = new.id * 2 + 1; END",
+    "CREATE TRIGGER kanban_search_comment_ad "
+    "AFTER DELETE ON kanban_app_comment "
+    "BEGIN DELETE FROM kanban_search WHERE rowid = old.id * 2 + 1; END",
+    "INSERT INTO kanban_search (rowid, title, body, task_id) "
+    "SELECT id * 2, title, description, id FROM kanban_app_task",
+    "INSERT INTO kanban_search (rowid, title, body, task_id) "
+    "SELECT id * 2 + 1, '', content, task_id FROM kanban_app_comment",
+]
+
+DROP_SQL = [
+    'DROP TRIGGER IF EXISTS kanban_search_comment_ad',
+    'DROP TRIGGER IF EXISTS kanban_search_comment_au',
+    'DROP TRIGGER IF EXISTS kanban_search_comment_ai',
+    'DROP TRIGGER IF EXISTS kanban_search_task_ad',
+    'DROP TRIGGER IF EXISTS kanban_search_task_au',
+    'DROP TRIGGER IF EXISTS kanban_search_task_ai',
+    'DROP TABLE IF EXISTS kanban_search',
+]
+
+
+def _run(statements):
+    """Return a RunPython callable executing statements on SQLite only."""
+    def run(apps, schema_editor):
+        if schema_editor.connection.vendor != 'sqlite':
+            return
+        for statement in statements:
+            schema_editor.execute(statement)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kanban_app', '0003_task_comment_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(_run(CREATE_SQL), _run(DROP_SQL)),
+    ]
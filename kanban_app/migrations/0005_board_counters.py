@@ -0,0 +1,93 @@
+# Generated by Django 5.2.8 on 2026-10-17 05:23
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+COUNTED_TASKS = {
+    'tasks_to_do_count': ('status', 'to-do'),
+    'tasks_in_progress_count': ('status', 'in-progress'),
+    'tasks_review_count': ('status', 'review'),
+    'tasks_done_count': ('status', 'done'),
+    'tasks_low_prio_count': ('priority', 'low'),
+    'tasks_medium_prio_count': ('priority', 'medium'),
+    'tasks_high_prio_count': ('priority', 'high'),
+}
+
+
+def _count_of(queryset):
+    """Return a subquery counting queryset rows of the outer board."""
+    counted = queryset.filter(board_id=OuterRef('pk')).order_by().values(
+        'board_id'
+    ).annotate(count=Count('id')).values('count')
+    return Coalesce(Subquery(counted), 0)
+
+
+def backfill(apps, schema_editor):
+    """Fill the counters of existing boards from their rows."""
+    Board = apps.get_model('kanban_app', 'Board')
+    Task = apps.get_model('kanban_app', 'Task')
+    tasks = Task.objects.all()
+    counters = {
+        'member_count': _count_of(Board.members.through.objects.all()),
+        'ticket_count': _count_of(tasks),
+    }
+    for field, (name, value) in COUNTED_TASKS.items():
+        counters[field] = _count_of(tasks.filter(**{name: value}))
+    Board.objects.update(**counters)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kanban_app', '0004_search_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='board',
+            name='member_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='board',
+            name='tasks_done_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='board',
+            name='tasks_high_prio_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='board',
+            name='tasks_in_progress_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='board',
+            name='tasks_low_prio_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='board',
+            name='tasks_medium_prio_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='board',
+            name='tasks_review_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='board',
+            name='tasks_to_do_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='board',
+            name='ticket_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,61 @@
+# Generated by Django 5.2.8 on 2026-10-17 05:31
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+# SQLite rebuilds the task table to add the column, which drops the
+# search triggers created by 0004; recreate them afterwards.
+TASK_TRIGGERS_SQL = [
+    "CREATE TRIGGER IF NOT EXISTS kanban_search_task_ai "
+    "AFTER INSERT ON kanban_app_task "
+    "BEGIN INSERT INTO kanban_search (rowid, title, body, task_id) "
+    "VALUES (new.id * 2, new.title, new.description, new.id); END",
+    "CREATE TRIGGER IF NOT EXISTS kanban_search_task_au "
+    "AFTER UPDATE OF title, description ON kanban_app_task "
+    "BEGIN UPDATE kanban_search SET title = new.title, "
+    "body = new.description WHERE rowid = new.id * 2; END",
+    "CREATE TRIGGER IF NOT EXISTS kanban_search_task_ad "
+    "AFTER DELETE ON kanban_app_task "
+    "BEGIN DELETE FROM kanban_search WHERE rowid = old.id * 2; END",
+]
+
+
+def restore_search_triggers(apps, schema_editor):
+    """Recreate the task search triggers on SQLite."""
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    for statement in TASK_TRIGGERS_SQL:
+        schema_editor.execute(statement)
+
+
+def backfill(apps, schema_editor):
+    """Fill comments_count of existing tasks from their comments."""
+    Task = apps.get_model('kanban_app', 'Task')
+    Comment = apps.get_model('kanban_app', 'Comment')
+    counted = Comment.objects.filter(task_id=OuterRef('pk')).order_by(
+    ).values('task_id').annotate(count=Count('id')).values('count')
+    Task.objects.update(comments_count=Coalesce(Subquery(counted), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kanban_app', '0005_board_counters'),
+    ]
+
+    operations = [
+        # Reversed last, after removing the column rebuilt the table again.
+        migrations.RunPython(
+            migrations.RunPython.noop, restore_search_triggers
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='comments_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunPython(
+            restore_search_triggers, migrations.RunPython.noop
+        ),
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+    ]
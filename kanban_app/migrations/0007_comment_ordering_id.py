@@ -0,0 +1,17 @@
+# Generated by Django 5.2.8 on 2026-10-17 05:39
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kanban_app', '0006_task_comments_count'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='comment',
+            options={'ordering': ['created_at', 'id'], 'verbose_name': 'Comment', 'verbose_name_plural': 'Comments'},
+        ),
+    ]
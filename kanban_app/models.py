@@ -1,8 +1,79 @@
 """Models for Kanban board application."""
 from django.db import models
+from django.db.models.functions import Coalesce
 from auth_app.models import User
 
 
+def _membership(board_ref, user):
+    """Return an EXISTS subquery for user's membership of a board."""
+    return models.Exists(
+        Board.members.through.objects.filter(
+            board_id=models.OuterRef(board_ref),
+            user_id=user.id
+        )
+    )
+
+
+def _ownership(owner_lookup, user):
+    """Return a boolean expression comparing a board owner with user."""
+    return models.ExpressionWrapper(
+        models.Q(**{owner_lookup: user.id}),
+        output_field=models.BooleanField()
+    )
+
+
+class BoardQuerySet(models.QuerySet):
+    """QuerySet with access filtering and aggregated board counts."""
+
+    def with_access(self, user):
+        """Annotate is_member and is_owner flags for user."""
+        return self.annotate(
+            is_member=_membership('pk', user),
+            is_owner=_ownership('owner_id', user),
+        )
+
+    def for_user(self, user):
+        """Return boards where user is owner or member without a join."""
+        member_boards = Board.members.through.objects.filter(
+            user_id=user.id
+        ).values('board_id')
+        return self.filter(
+            models.Q(owner_id=user.id) | models.Q(id__in=member_boards)
+        )
+
+    def with_counts(self):
+        """Annotate member and task counts recounted from the tables.
+
+        Each annotation is a counter column's name prefixed with
+        ``counted_``; the board list reads the columns instead.
+        """
+        member_count = Board.members.through.objects.filter(
+            board_id=models.OuterRef('pk')
+        ).order_by().values('board_id').annotate(
+            count=models.Count('id')
+        ).values('count')
+        counts = {
+            'counted_member_count': Coalesce(
+                models.Subquery(member_count), 0
+            ),
+            'counted_ticket_count': models.Count('tasks'),
+        }
+        for field, (name, value) in Board.COUNTED_TASKS.items():
+            counts[f'counted_{field}'] = models.Count(
+                'tasks', filter=models.Q(**{f'tasks__{name}': value})
+            )
+        return self.annotate(**counts)
+
+    def with_detail(self):
+        """Prefetch members and tasks for the nested board detail view."""
+        return self.prefetch_related(
+            'members',
+            models.Prefetch(
+                'tasks', queryset=Task.objects.with_related().order_by('-id')
+            ),
+        )
+
+
 class Board(models.Model):
     """Kanban board with owner and members."""
     
@@ -13,6 +84,53 @@ class Board(models.Model):
         related_name='owned_boards'
     )
     members = models.ManyToManyField(User, related_name='boards')
+    version = models.PositiveBigIntegerField(default=0)
+    # Denormalized counters kept by kanban_app.stats. Signed so a drifted
+    # counter never blocks a write; recompute_board_stats repairs drift.
+    member_count = models.IntegerField(default=0)
+    ticket_count = models.IntegerField(default=0)
+    tasks_to_do_count = models.IntegerField(default=0)
+    tasks_in_progress_count = models.IntegerField(default=0)
+    tasks_review_count = models.IntegerField(default=0)
+    tasks_done_count = models.IntegerField(default=0)
+    tasks_low_prio_count = models.IntegerField(default=0)
+    tasks_medium_prio_count = models.IntegerField(default=0)
+    tasks_high_prio_count = models.IntegerField(default=0)
+
+    COUNTED_TASKS = {
+        'tasks_to_do_count': ('status', 'to-do'),
+        'tasks_in_progress_count': ('status', 'in-progress'),
+        'tasks_review_count': ('status', 'review'),
+        'tasks_done_count': ('status', 'done'),
+        'tasks_low_prio_count': ('priority', 'low'),
+        'tasks_medium_prio_count': ('priority', 'medium'),
+        'tasks_high_prio_count': ('priority', 'high'),
+    }
+    # Only changed by atomic F() updates, never written by a full save().
+    ATOMIC_FIELDS = {
+        'version', 'member_count', 'ticket_count', *COUNTED_TASKS
+    }
+
+    objects = BoardQuerySet.as_manager()
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Remember the loaded owner to detect ownership transfers."""
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_owner_id = instance.__dict__.get('owner_id')
+        return instance
+
+    def save(self, *args, **kwargs):
+        """Save, leaving version and counters to their atomic updates."""
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            deferred = self.get_deferred_fields()
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key
+                and field.attname not in deferred
+                and field.name not in self.ATOMIC_FIELDS
+            ]
+        super().save(*args, **kwargs)
     
     def __str__(self):
         """Return board title."""
@@ -24,6 +142,14 @@ class Board(models.Model):
         ordering = ['-id']
 
 
+class TaskQuerySet(models.QuerySet):
+    """QuerySet with the joins needed to serialize tasks."""
+
+    def with_related(self):
+        """Select the assignee and reviewer serialized with each task."""
+        return self.select_related('assignee', 'reviewer')
+
+
 class Task(models.Model):
     """Task with status, priority, assignee and reviewer."""
     
@@ -42,6 +168,7 @@ class Task(models.Model):
     board = models.ForeignKey(
         Board, 
         on_delete=models.CASCADE, 
+        db_index=False,
         related_name='tasks'
     )
     title = models.CharField(max_length=255)
@@ -53,6 +180,7 @@ class Task(models.Model):
         on_delete=models.SET_NULL, 
         null=True, 
         blank=True, 
+        db_index=False,
         related_name='assigned_tasks'
     )
     reviewer = models.ForeignKey(
@@ -60,6 +188,7 @@ class Task(models.Model):
         on_delete=models.SET_NULL, 
         null=True, 
         blank=True, 
+        db_index=False,
         related_name='review_tasks'
     )
     due_date = models.DateField(null=True, blank=True)
@@ -68,6 +197,31 @@ class Task(models.Model):
         on_delete=models.CASCADE, 
         related_name='created_tasks'
     )
+    # Denormalized; kept by kanban_app.stats with atomic F() updates.
+    comments_count = models.IntegerField(default=0)
+
+    objects = TaskQuerySet.as_manager()
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Remember the loaded board, status and priority for counters."""
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_board_id = instance.__dict__.get('board_id')
+        instance._loaded_status = instance.__dict__.get('status')
+        instance._loaded_priority = instance.__dict__.get('priority')
+        return instance
+
+    def save(self, *args, **kwargs):
+        """Save, leaving comments_count to its atomic counter updates."""
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            deferred = self.get_deferred_fields()
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key
+                and field.attname not in deferred
+                and field.name != 'comments_count'
+            ]
+        super().save(*args, **kwargs)
     
     def __str__(self):
         """Return task title."""
@@ -77,6 +231,34 @@ class Task(models.Model):
         verbose_name = 'Task'
         verbose_name_plural = 'Tasks'
         ordering = ['-id']
+        indexes = [
+            # Board list counts, board + status/priority filters and the
+            # board FK itself (cascades, prefetch) share this index.
+            models.Index(
+                fields=['board', 'status', 'priority'],
+                name='task_board_status_prio_idx'
+            ),
+            models.Index(
+                fields=['board', 'priority'],
+                name='task_board_priority_idx'
+            ),
+            # Partial: most tasks have no reviewer, many no due date.
+            models.Index(
+                fields=['assignee', 'board'],
+                name='task_assignee_board_idx',
+                condition=models.Q(assignee__isnull=False)
+            ),
+            models.Index(
+                fields=['reviewer', 'board'],
+                name='task_reviewer_board_idx',
+                condition=models.Q(reviewer__isnull=False)
+            ),
+            models.Index(
+                fields=['due_date'],
+                name='task_due_date_idx',
+                condition=models.Q(due_date__isnull=False)
+            ),
+        ]
 
 
 class Comment(models.Model):
@@ -85,6 +267,7 @@ class Comment(models.Model):
     task = models.ForeignKey(
         Task, 
         on_delete=models.CASCADE, 
+        db_index=False,
         related_name='comments'
     )
     author = models.ForeignKey(
@@ -96,10 +279,56 @@ class Comment(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     
     def __str__(self):
-        """Return comment description with author."""
-        return f"Comment by {self.author.fullname}"
+        """Return comment description, naming the author if loaded."""
+        if Comment.author.is_cached(self):
+            return f"Comment by {self.author.fullname}"
+        return f"Comment by user {self.author_id}"
     
     class Meta:
         verbose_name = 'Comment'
         verbose_name_plural = 'Comments'
-        ordering = ['created_at']
\ No newline at end of file
+        ordering = ['created_at', 'id']
+        indexes = [
+            models.Index(
+                fields=['task', 'created_at', 'id'],
+                name='comment_task_created_idx'
+            ),
+        ]
+
+
+class BoardChange(models.Model):
+    """Change log entry for delta sync; delete entries are tombstones."""
+
+    ENTITY_CHOICES = [
+        ('board', 'Board'),
+        ('task', 'Task'),
+        ('comment', 'Comment'),
+        ('member', 'Member'),
+    ]
+    OP_CHOICES = [
+        ('upsert', 'Upsert'),
+        ('delete', 'Delete'),
+    ]
+
+    board = models.ForeignKey(
+        Board,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        related_name='changes'
+    )
+    version = models.PositiveBigIntegerField()
+    entity = models.CharField(max_length=10, choices=ENTITY_CHOICES)
+    object_id = models.PositiveBigIntegerField()
+    parent_id = models.PositiveBigIntegerField(null=True, blank=True)
+    op = models.CharField(max_length=10, choices=OP_CHOICES)
+
+    def __str__(self):
+        """Return change description with board version."""
+        return f"{self.op} {self.entity} {self.object_id} @ v{self.version}"
+
+    class Meta:
+        verbose_name = 'Board change'
+        verbose_name_plural = 'Board changes'
+        ordering = ['version', 'id']
+        indexes = [models.Index(fields=['board', 'version'])]
@@ -0,0 +1,254 @@
+"""Query-count regression harness for every API route.
+
+Seeds boards of several sizes, runs one request per route and records
+how many SQL queries it issued. Tests assert the counts do not grow
+with data size and stay within ``query_budgets.json``. Regenerate the
+budget file after an intentional change with::
+
+    UPDATE_QUERY_BUDGETS=1 python manage.py test kanban_app
+"""
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Callable, Optional
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from auth_app.models import User
+from kanban_app import stats
+from kanban_app.membership import board_ids_for
+from kanban_app.models import Board, Task, Comment
+
+SIZES = (10, 100, 1000)
+BUDGET_FILE = Path(__file__).with_name('query_budgets.json')
+STATUSES = ['to-do', 'in-progress', 'review', 'done']
+PRIORITIES = ['low', 'medium', 'high']
+
+
+@dataclass
+class RouteCase:
+    """One request against a named route."""
+
+    name: str
+    method: str
+    path: Callable
+    data: Optional[Callable] = None
+    authenticated: bool = True
+    expected_status: int = 200
+    query: dict = field(default_factory=dict)
+    content_type: Optional[str] = None
+
+    @property
+    def key(self):
+        """Return the budget file key of this case."""
+        return f'{self.method} {self.name}'
+
+
+def seed_dataset(task_count, label):
+    """Create users and a board with task_count tasks.
+
+    Destructive routes act on a spare board/task of fixed size, since a
+    cascading delete is inherently proportional to what it removes.
+    """
+    owner = User.objects.create_user(
+        email=f'owner-{label}@bench.local',
+        fullname=f'Owner {label}',
+        password='bench1234'
+    )
+    member = User.objects.create_user(
+        email=f'member-{label}@bench.local',
+        fullname=f'Member {label}'
+    )
+    users = [owner, member]
+    board = Board.objects.create(title=f'Board {label}', owner=owner)
+    board.members.add(owner, member)
+    Task.objects.bulk_create([
+        Task(
+            board=board,
+            title=f'Task {index}',
+            description='Seeded task',
+            status=STATUSES[index % len(STATUSES)],
+            priority=PRIORITIES[index % len(PRIORITIES)],
+            assignee=users[index % 2],
+            reviewer=users[(index + 1) % 2],
+            created_by=owner
+        )
+        for index in range(task_count)
+    ])
+    task = board.tasks.order_by('id').first()
+    Comment.objects.bulk_create([
+        Comment(task=task, author=users[index % 2], content='Seeded')
+        for index in range(max(task_count // 10, 1))
+    ])
+    spare_board = Board.objects.create(title=f'Spare {label}', owner=owner)
+    spare_board.members.add(member)
+    Task.objects.bulk_create([
+        Task(board=spare_board, title='Spare', status='to-do',
+             priority='low', created_by=owner)
+        for _ in range(3)
+    ])
+    spare_task = Task.objects.create(
+        board=board, title='Spare', status='to-do',
+        priority='low', created_by=owner
+    )
+    spare_comment = Comment.objects.create(
+        task=task, author=owner, content='Spare'
+    )
+    stats.recompute(Board.objects.filter(id__in=[board.id, spare_board.id]))
+    stats.recompute_comment_counts(Task.objects.filter(pk=task.pk))
+    return SimpleNamespace(
+        label=label, owner=owner, member=member, board=board, task=task,
+        spare_board=spare_board, spare_task=spare_task,
+        spare_comment=spare_comment,
+        move_ids=list(
+            board.tasks.order_by('id').values_list('id', flat=True)[:5]
+        ),
+    )
+
+
+def _task_payload(ds):
+    """Return a valid task creation payload."""
+    return {'board': ds.board.id, 'title': 'New', 'status': 'to-do',
+            'priority': 'high', 'assignee_id': ds.member.id}
+
+
+def _import_body(ds):
+    """Return a small NDJSON board import."""
+    records = [
+        {'type': 'board', 'id': 1, 'title': 'Imported'},
+        {'type': 'member', 'email': ds.member.email},
+        {'type': 'task', 'board_id': 1, 'id': 1, 'title': 'A',
+         'assignee': ds.member.email},
+        {'type': 'task', 'board_id': 1, 'id': 2, 'title': 'B'},
+        {'type': 'comment', 'task_id': 1, 'content': 'Hi',
+         'author': ds.member.email},
+    ]
+    return ''.join(json.dumps(record) + '\n' for record in records)
+
+
+CASES = [
+    RouteCase('api-root', 'GET', lambda ds: '/api/'),
+    RouteCase('board-list', 'GET', lambda ds: '/api/boards/'),
+    RouteCase('board-list', 'POST', lambda ds: '/api/boards/',
+              lambda ds: {'title': 'New', 'members': [ds.member.id]},
+              expected_status=201),
+    RouteCase('board-detail', 'GET',
+              lambda ds: f'/api/boards/{ds.board.id}/'),
+    RouteCase('board-detail', 'PATCH',
+              lambda ds: f'/api/boards/{ds.board.id}/',
+              lambda ds: {'title': 'Renamed',
+                          'members': [ds.owner.id, ds.member.id]}),
+    RouteCase('board-detail', 'DELETE',
+              lambda ds: f'/api/boards/{ds.spare_board.id}/',
+              expected_status=204),
+    RouteCase('board-changes', 'GET',
+              lambda ds: f'/api/boards/{ds.board.id}/changes/',
+              query={'since': 0}),
+    RouteCase('board-export', 'GET',
+              lambda ds: f'/api/boards/{ds.board.id}/export/'),
+    RouteCase('board-import', 'POST', lambda ds: '/api/boards/import/',
+              _import_body, expected_status=201,
+              content_type='application/x-ndjson'),
+    RouteCase('board-move-tasks', 'POST',
+              lambda ds: f'/api/boards/{ds.board.id}/tasks/move/',
+              lambda ds: {'task_ids': ds.move_ids, 'status': 'review'}),
+    RouteCase('board-events-ticket', 'POST',
+              lambda ds: f'/api/boards/{ds.board.id}/events/ticket/'),
+    RouteCase('board-events', 'GET',
+              lambda ds: f'/api/boards/{ds.board.id}/events/',
+              authenticated=False, expected_status=401),
+    RouteCase('task-list', 'GET', lambda ds: '/api/tasks/'),
+    RouteCase('task-list', 'POST', lambda ds: '/api/tasks/', _task_payload,
+              expected_status=201),
+    RouteCase('task-detail', 'GET',
+              lambda ds: f'/api/tasks/{ds.task.id}/'),
+    RouteCase('task-detail', 'PATCH',
+              lambda ds: f'/api/tasks/{ds.task.id}/',
+              lambda ds: {'status': 'done', 'reviewer_id': ds.owner.id}),
+    RouteCase('task-detail', 'DELETE',
+              lambda ds: f'/api/tasks/{ds.spare_task.id}/',
+              expected_status=204),
+    RouteCase('task-assigned-to-me', 'GET',
+              lambda ds: '/api/tasks/assigned-to-me/'),
+    RouteCase('task-reviewing', 'GET', lambda ds: '/api/tasks/reviewing/'),
+    RouteCase('task-batch', 'POST', lambda ds: '/api/tasks/batch/',
+              lambda ds: [{'op': 'create', 'data': _task_payload(ds)},
+                          {'op': 'update', 'id': ds.task.id,
+                           'data': {'priority': 'low'}}]),
+    RouteCase('comment-list', 'GET',
+              lambda ds: f'/api/tasks/{ds.task.id}/comments/'),
+    RouteCase('comment-list', 'POST',
+              lambda ds: f'/api/tasks/{ds.task.id}/comments/',
+              lambda ds: {'content': 'Hello'}, expected_status=201),
+    RouteCase('comment-delete', 'DELETE',
+              lambda ds: (f'/api/tasks/{ds.task.id}/comments/'
+                          f'{ds.spare_comment.id}/'),
+              expected_status=204),
+    RouteCase('search', 'GET', lambda ds: '/api/search/',
+              query={'q': 'seeded'}),
+    RouteCase('dashboard', 'GET', lambda ds: '/api/dashboard/'),
+    RouteCase('registration', 'POST', lambda ds: '/api/registration/',
+              lambda ds: {'fullname': 'New', 'password': 'pw123456',
+                          'repeated_password': 'pw123456',
+                          'email': f'new-{ds.label}@bench.local'},
+              authenticated=False, expected_status=201),
+    RouteCase('login', 'POST', lambda ds: '/api/login/',
+              lambda ds: {'email': ds.owner.email, 'password': 'bench1234'},
+              authenticated=False),
+    RouteCase('email-check', 'GET', lambda ds: '/api/email-check/',
+              query={'email': 'nobody@bench.local'}, expected_status=404),
+]
+
+
+def route_names(patterns):
+    """Return all named routes in a list of URL patterns."""
+    names = set()
+    for pattern in patterns:
+        if hasattr(pattern, 'url_patterns'):
+            names |= route_names(pattern.url_patterns)
+        elif pattern.name:
+            names.add(pattern.name)
+    return names
+
+
+def request_options(case):
+    """Return test client keyword arguments encoding case's body."""
+    if case.method == 'GET':
+        return {}
+    if case.content_type:
+        return {'content_type': case.content_type}
+    return {'format': 'json'}
+
+
+def measure(client, case, ds):
+    """Run case against dataset ds and return (status, query count)."""
+    client.force_authenticate(user=ds.owner if case.authenticated else None)
+    board_ids_for(ds.owner)
+    path = case.path(ds)
+    if case.query:
+        path += '?' + '&'.join(f'{k}={v}' for k, v in case.query.items())
+    data = case.data(ds) if case.data else None
+    send = getattr(client, case.method.lower())
+    options = request_options(case)
+    with CaptureQueriesContext(connection) as queries:
+        response = send(path, data, **options)
+        if response.streaming:
+            b''.join(response.streaming_content)
+    return response.status_code, len(queries)
+
+
+def load_budgets():
+    """Return the committed query budgets."""
+    return json.loads(BUDGET_FILE.read_text())
+
+
+def should_update_budgets():
+    """Return True when budgets should be rewritten from measurements."""
+    return os.environ.get('UPDATE_QUERY_BUDGETS') == '1'
+
+
+def write_budgets(counts):
+    """Write measured counts as the new budget file."""
+    BUDGET_FILE.write_text(json.dumps(dict(sorted(counts.items())),
+                                      indent=2) + '\n')
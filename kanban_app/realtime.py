@@ -0,0 +1,123 @@
+"""Live board update fan-out for server-sent event subscribers.
+
+Brokers are pluggable via ``KANMIND_REALTIME_BROKER``. The in-memory
+broker keeps one asyncio queue per subscriber, so idle connections cost
+a coroutine each rather than a thread, and it is safe to publish from
+the sync worker threads that run the API views.
+"""
+import asyncio
+import threading
+from django.conf import settings
+from django.db import transaction
+from django.utils.module_loading import import_string
+
+DEFAULT_BROKER = 'kanban_app.realtime.InMemoryBroker'
+
+
+class BaseBroker:
+    """Interface for board event brokers."""
+
+    def publish(self, board_id, event):
+        """Deliver event to all subscribers of board_id."""
+        raise NotImplementedError
+
+    def subscribe(self, board_id):
+        """Return a Subscription for board_id in the running loop."""
+        raise NotImplementedError
+
+    def unsubscribe(self, subscription):
+        """Stop delivering events to subscription."""
+        raise NotImplementedError
+
+
+class Subscription:
+    """Bounded event queue bound to one subscriber's event loop."""
+
+    RESYNC = {'type': 'resync'}
+
+    def __init__(self, board_id, max_queue):
+        """Create a subscription in the running event loop."""
+        self.board_id = board_id
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(maxsize=max_queue)
+
+    def _put(self, event):
+        """Enqueue event; on overflow ask the client to resync."""
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(self.RESYNC)
+
+    def deliver(self, event):
+        """Schedule delivery from any thread."""
+        self.loop.call_soon_threadsafe(self._put, event)
+
+    async def get(self, timeout=None):
+        """Wait for the next event, returning None on timeout."""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class InMemoryBroker(BaseBroker):
+    """Single-process broker for single-node setups and tests."""
+
+    def __init__(self, max_queue=100):
+        """Create a broker without subscribers."""
+        self.max_queue = max_queue
+        self._subscribers = {}
+        self._lock = threading.Lock()
+
+    def publish(self, board_id, event):
+        """Deliver event to all subscribers of board_id."""
+        with self._lock:
+            subscribers = list(self._subscribers.get(board_id, ()))
+        for subscription in subscribers:
+            try:
+                subscription.deliver(event)
+            except RuntimeError:
+                self.unsubscribe(subscription)
+
+    def subscribe(self, board_id):
+        """Register a subscription for board_id."""
+        subscription = Subscription(board_id, self.max_queue)
+        with self._lock:
+            self._subscribers.setdefault(board_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        """Remove a subscription."""
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.board_id)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[subscription.board_id]
+
+    def subscriber_count(self, board_id=None):
+        """Return number of subscriptions, optionally for one board."""
+        with self._lock:
+            if board_id is not None:
+                return len(self._subscribers.get(board_id, ()))
+            return sum(len(subs) for subs in self._subscribers.values())
+
+
+_brokers = {}
+_brokers_lock = threading.Lock()
+
+
+def get_broker():
+    """Return the configured broker instance."""
+    path = getattr(settings, 'KANMIND_REALTIME_BROKER', DEFAULT_BROKER)
+    with _brokers_lock:
+        if path not in _brokers:
+            _brokers[path] = import_string(path)()
+        return _brokers[path]
+
+
+def publish_on_commit(board_id, event):
+    """Publish event once the current transaction commits."""
+    transaction.on_commit(lambda: get_broker().publish(board_id, event))
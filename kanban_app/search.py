@@ -0,0 +1,118 @@
+"""Full-text search over task titles, descriptions and comments.
+
+Backends are pluggable via ``KANMIND_SEARCH_BACKEND``. The SQLite
+backend reads the ``kanban_search`` FTS5 table created by migration
+0004, which database triggers keep in sync with tasks and comments so
+bulk writes are indexed too. Task rows use rowid ``2 * id`` and comment
+rows ``2 * id + 1``, letting the triggers address them by rowid.
+"""
+import re
+import threading
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils.module_loading import import_string
+
+DEFAULT_BACKEND = 'kanban_app.search.SQLiteFTSBackend'
+TERM_RE = re.compile(r'\w+', re.UNICODE)
+
+_backends = {}
+_backends_lock = threading.Lock()
+
+
+def parse_terms(query):
+    """Return the word terms of a free-text query."""
+    return TERM_RE.findall(query or '')
+
+
+class BaseSearchBackend:
+    """Interface for search backends."""
+
+    def search(self, query, board_ids, limit):
+        """Return up to limit ranked hits on the given boards.
+
+        Each hit is a dict with type, id, task_id, board_id, title,
+        snippet and score; higher scores are more relevant.
+        """
+        raise NotImplementedError
+
+    def rebuild(self):
+        """Re-index all tasks and comments and return the row count."""
+        raise NotImplementedError
+
+
+class SQLiteFTSBackend(BaseSearchBackend):
+    """Search backed by the SQLite FTS5 ``kanban_search`` table."""
+
+    table = 'kanban_search'
+    title_weight = 10.0
+    body_weight = 1.0
+    snippet_tokens = 12
+
+    def match_expression(self, query):
+        """Return an FTS5 query matching every term as a prefix."""
+        return ' '.join(f'"{term}"*' for term in parse_terms(query))
+
+    def search(self, query, board_ids, limit):
+        """Return ranked hits joined to their task's board."""
+        expression = self.match_expression(query)
+        if not expression or not board_ids:
+            return []
+        board_ids = sorted(board_ids)
+        placeholders = ', '.join(['%s'] * len(board_ids))
+        sql = (
+            'SELECT s.rowid, s.task_id, t.board_id, t.title, '
+            f"snippet({self.table}, -1, '[', ']', '…', "
+            f'{self.snippet_tokens}), '
+            f'bm25({self.table}, {self.title_weight}, {self.body_weight}) '
+            'AS rank '
+            f'FROM {self.table} s '
+            'JOIN kanban_app_task t ON t.id = s.task_id '
+            f'WHERE {self.table} MATCH %s '
+            f'AND t.board_id IN ({placeholders}) '
+            'ORDER BY rank LIMIT %s'
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [expression, *board_ids, limit])
+            rows = cursor.fetchall()
+        return [
+            {
+                'type': 'comment' if rowid % 2 else 'task',
+                'id': rowid // 2,
+                'task_id': task_id,
+                'board_id': board_id,
+                'title': title,
+                'snippet': snippet,
+                'score': round(-rank, 4),
+            }
+            for rowid, task_id, board_id, title, snippet, rank in rows
+        ]
+
+    def rebuild(self):
+        """Repopulate the FTS table from tasks and comments."""
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {self.table}')
+            cursor.execute(
+                f'INSERT INTO {self.table} (rowid, title, body, task_id) '
+                'SELECT id * 2, title, description, id '
+                'FROM kanban_app_task'
+            )
+            cursor.execute(
+                f'INSERT INTO {self.table} (rowid, title, body, task_id) '
+                "SELECT id * 2 + 1, '', content, task_id "
+                'FROM kanban_app_comment'
+            )
+            cursor.execute(
+                f'INSERT INTO {self.table} ({self.table}) '
+                "VALUES ('optimize')"
+            )
+            cursor.execute(f'SELECT count(*) FROM {self.table}')
+            return cursor.fetchone()[0]
+
+
+def get_backend():
+    """Return the configured search backend instance."""
+    path = getattr(settings, 'KANMIND_SEARCH_BACKEND', DEFAULT_BACKEND)
+    with _backends_lock:
+        if path not in _backends:
+            _backends[path] = import_string(path)()
+        return _backends[path]
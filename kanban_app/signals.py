@@ -0,0 +1,268 @@
+"""Signal handlers keeping kanban caches and change logs consistent."""
+from django.db.models import Q
+from django.db.models.signals import (
+    m2m_changed, pre_save, post_save, pre_delete, post_delete
+)
+from django.dispatch import receiver
+from auth_app.models import User
+from kanban_app.models import Board, BoardChange, Task, Comment
+from kanban_app import membership, stats
+from kanban_app.changes import record_changes, UPSERT, DELETE
+from kanban_app.realtime import publish_on_commit
+
+# User fields nested in board, task and comment payloads.
+PROFILE_FIELDS = ('fullname', 'email')
+
+
+def _mark_deleting(origin, name, pk):
+    """Remember on the deletion origin which objects it cascades to."""
+    if origin is None:
+        return
+    deleting = getattr(origin, name, None)
+    if deleting is None:
+        deleting = set()
+        setattr(origin, name, deleting)
+    deleting.add(pk)
+
+
+def _is_deleting(origin, name, pk):
+    """Return True if pk is removed by the same cascading delete."""
+    return pk in getattr(origin, name, ())
+
+
+def _comment_board_id(comment):
+    """Return the board ID of a comment's task."""
+    if Comment.task.is_cached(comment):
+        return comment.task.board_id
+    return Task.objects.filter(pk=comment.task_id).values_list(
+        'board_id', flat=True
+    ).first()
+
+
+@receiver(m2m_changed, sender=Board.members.through)
+def board_members_changed(sender, instance, action, reverse, pk_set,
+                          **kwargs):
+    """Invalidate access and log changes of board membership."""
+    if action == 'pre_clear':
+        if reverse:
+            instance._cleared_pairs = [
+                (board_id, instance.pk)
+                for board_id in instance.boards.values_list('id', flat=True)
+            ]
+        else:
+            instance._cleared_pairs = [
+                (instance.pk, user_id)
+                for user_id in instance.members.values_list('id', flat=True)
+            ]
+    elif action == 'post_clear':
+        pairs = getattr(instance, '_cleared_pairs', [])
+        membership.invalidate(user_id for _, user_id in pairs)
+        _record_member_changes(pairs, DELETE)
+    elif action in ('post_add', 'post_remove'):
+        if reverse:
+            pairs = [(board_id, instance.pk) for board_id in pk_set]
+        else:
+            pairs = [(instance.pk, user_id) for user_id in pk_set]
+        membership.invalidate(user_id for _, user_id in pairs)
+        op = UPSERT if action == 'post_add' else DELETE
+        _record_member_changes(pairs, op)
+
+
+def _record_member_changes(pairs, op):
+    """Log member changes and recount members, grouped by board."""
+    by_board = {}
+    for board_id, user_id in pairs:
+        by_board.setdefault(board_id, []).append(user_id)
+    for board_id, user_ids in by_board.items():
+        record_changes(board_id, 'member', user_ids, op,
+                       counters=stats.member_recount())
+
+
+@receiver(post_save, sender=Board)
+def board_saved(sender, instance, created, **kwargs):
+    """Invalidate owner access and log board updates."""
+    user_ids = [instance.owner_id]
+    loaded_owner_id = getattr(instance, '_loaded_owner_id', None)
+    if not created and loaded_owner_id not in (None, instance.owner_id):
+        user_ids.append(loaded_owner_id)
+    instance._loaded_owner_id = instance.owner_id
+    membership.invalidate(user_ids)
+    if not created:
+        record_changes(instance.pk, 'board', [instance.pk], UPSERT)
+
+
+@receiver(pre_delete, sender=Board)
+def board_deleting(sender, instance, origin=None, **kwargs):
+    """Remember board members before their memberships cascade away."""
+    _mark_deleting(origin, '_deleting_board_ids', instance.pk)
+    instance._deleted_member_ids = list(
+        instance.members.values_list('id', flat=True)
+    )
+
+
+@receiver(post_delete, sender=Board)
+def board_deleted(sender, instance, **kwargs):
+    """Invalidate member access and drop the board's change log."""
+    membership.invalidate(
+        [instance.owner_id] + getattr(instance, '_deleted_member_ids', [])
+    )
+    BoardChange.objects.filter(board_id=instance.pk).delete()
+    publish_on_commit(
+        instance.pk, {'type': 'board-deleted', 'board_id': instance.pk}
+    )
+
+
+@receiver(post_save, sender=Task)
+def task_saved(sender, instance, created, **kwargs):
+    """Log task upserts, and a tombstone when it moves boards.
+
+    Board counters follow the task's board, status and priority in the
+    same updates that bump the board versions.
+    """
+    loaded_board_id = getattr(instance, '_loaded_board_id', None)
+    current = (instance.board_id, instance.status, instance.priority)
+    loaded = (loaded_board_id, getattr(instance, '_loaded_status', None),
+              getattr(instance, '_loaded_priority', None))
+    counts = stats.TaskCounts()
+    if created:
+        counts.add(*current)
+    elif None not in loaded:
+        counts.remove(*loaded)
+        counts.add(*current)
+    if not created and loaded_board_id not in (None, instance.board_id):
+        record_changes(loaded_board_id, 'task', [instance.pk], DELETE,
+                       counters=counts.pop(loaded_board_id))
+    (instance._loaded_board_id, instance._loaded_status,
+     instance._loaded_priority) = current
+    record_changes(instance.board_id, 'task', [instance.pk], UPSERT,
+                   counters=counts.pop(instance.board_id))
+    if not created and None in loaded:
+        # Loaded with deferred fields: recount instead of guessing.
+        stats.recompute(Board.objects.filter(
+            id__in=[instance.board_id, loaded_board_id]
+        ))
+
+
+@receiver(pre_delete, sender=Task)
+def task_deleting(sender, instance, origin=None, **kwargs):
+    """Mark tasks removed together with their comments."""
+    _mark_deleting(origin, '_deleting_task_ids', instance.pk)
+
+
+@receiver(post_delete, sender=Task)
+def task_deleted(sender, instance, origin=None, **kwargs):
+    """Log a task tombstone and uncount it unless its board goes too.
+
+    Bulk deletes set ``skip_change_log`` on the queryset and log the
+    tombstones and counter changes themselves, grouped per board.
+    """
+    if getattr(origin, 'skip_change_log', False):
+        return
+    if _is_deleting(origin, '_deleting_board_ids', instance.board_id):
+        return
+    counts = stats.TaskCounts()
+    counts.remove(instance.board_id, instance.status, instance.priority)
+    record_changes(instance.board_id, 'task', [instance.pk], DELETE,
+                   counters=counts.pop(instance.board_id))
+
+
+@receiver(post_save, sender=Comment)
+def comment_saved(sender, instance, created, **kwargs):
+    """Count new comments and log comment upserts on the task's board."""
+    if created:
+        stats.comments_changed(instance.task_id, 1)
+    record_changes(
+        _comment_board_id(instance), 'comment', [instance.pk], UPSERT,
+        {instance.pk: instance.task_id}
+    )
+
+
+@receiver(post_delete, sender=Comment)
+def comment_deleted(sender, instance, origin=None, **kwargs):
+    """Uncount and log a comment tombstone unless its task goes too."""
+    if _is_deleting(origin, '_deleting_task_ids', instance.task_id):
+        return
+    stats.comments_changed(instance.task_id, -1)
+    board_id = _comment_board_id(instance)
+    if board_id is None:
+        return
+    record_changes(
+        board_id, 'comment', [instance.pk], DELETE,
+        {instance.pk: instance.task_id}
+    )
+
+
+@receiver(pre_save, sender=User)
+def user_saving(sender, instance, update_fields=None, **kwargs):
+    """Note whether the save changes the user's name or email."""
+    instance._profile_changed = False
+    if instance._state.adding or (
+            update_fields is not None
+            and not set(PROFILE_FIELDS) & set(update_fields)):
+        return
+    stored = User.objects.filter(pk=instance.pk).values_list(
+        *PROFILE_FIELDS
+    ).first()
+    current = tuple(getattr(instance, name) for name in PROFILE_FIELDS)
+    instance._profile_changed = stored not in (None, current)
+
+
+@receiver(post_save, sender=User)
+def user_saved(sender, instance, created, **kwargs):
+    """Drop stale access for new users; log changed profiles."""
+    if created:
+        membership.invalidate([instance.pk])
+    elif getattr(instance, '_profile_changed', False):
+        instance._profile_changed = False
+        _record_profile_changes(instance.pk)
+
+
+def _record_profile_changes(user_id):
+    """Log upserts of every board object nesting the user's profile.
+
+    Bumps the affected boards' versions, and with them their ETags.
+    """
+    member_board_ids = Board.members.through.objects.filter(
+        user_id=user_id
+    ).values_list('board_id', flat=True)
+    for board_id in member_board_ids:
+        record_changes(board_id, 'member', [user_id], UPSERT)
+    tasks = {}
+    for task_id, board_id in Task.objects.filter(
+            Q(assignee_id=user_id) | Q(reviewer_id=user_id)
+    ).values_list('id', 'board_id'):
+        tasks.setdefault(board_id, []).append(task_id)
+    for board_id, task_ids in tasks.items():
+        record_changes(board_id, 'task', task_ids, UPSERT)
+    comments = {}
+    for comment_id, task_id, board_id in Comment.objects.filter(
+            author_id=user_id
+    ).values_list('id', 'task_id', 'task__board_id'):
+        comments.setdefault(board_id, {})[comment_id] = task_id
+    for board_id, parent_ids in comments.items():
+        record_changes(board_id, 'comment', list(parent_ids), UPSERT,
+                       parent_ids)
+
+
+@receiver(pre_delete, sender=User)
+def user_deleting(sender, instance, **kwargs):
+    """Remember the user's boards before their memberships cascade away.
+
+    The cascade deletes membership rows without ``m2m_changed``.
+    """
+    instance._member_board_ids = list(
+        instance.boards.values_list('id', flat=True)
+    )
+
+
+@receiver(post_delete, sender=User)
+def user_deleted(sender, instance, **kwargs):
+    """Recount members and log tombstones on the user's former boards.
+
+    Boards deleted in the same cascade are skipped by record_changes.
+    """
+    membership.invalidate([instance.pk])
+    _record_member_changes([
+        (board_id, instance.pk)
+        for board_id in getattr(instance, '_member_board_ids', [])
+    ], DELETE)
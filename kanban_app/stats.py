@@ -0,0 +1,165 @@
+"""Denormalized board and task counters kept in step with writes.
+
+Boards carry a total, per-status and per-priority task count and a
+member count, so the board list reads them instead of scanning tasks.
+Task writes adjust them with ``F()`` updates in the writer's transaction,
+riding on the board's version bump where there is one. Member changes
+recount the board's memberships instead, since ``m2m_changed`` may
+report users that were never members. Comment writes adjust their
+task's ``comments_count`` with ``F()``. ``recompute`` and
+``recompute_comment_counts`` rebuild counters from the tables to repair
+drift.
+"""
+from collections import Counter
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from kanban_app.models import Board, Task, Comment
+
+TASK_FIELDS = ['ticket_count', *Board.COUNTED_TASKS]
+FIELDS = ['member_count', *TASK_FIELDS]
+FIELD_FOR = {
+    (name, value): field
+    for field, (name, value) in Board.COUNTED_TASKS.items()
+}
+
+
+class TaskCounts:
+    """Counter deltas per board, applied with one F() update per board."""
+
+    def __init__(self):
+        """Start with no deltas."""
+        self.deltas = {}
+
+    def add(self, board_id, status, priority, count=1):
+        """Count tasks with status and priority onto a board."""
+        counter = self.deltas.setdefault(board_id, Counter())
+        counter['ticket_count'] += count
+        for field in (FIELD_FOR.get(('status', status)),
+                      FIELD_FOR.get(('priority', priority))):
+            if field:
+                counter[field] += count
+
+    def remove(self, board_id, status, priority, count=1):
+        """Count tasks with status and priority off a board."""
+        self.add(board_id, status, priority, -count)
+
+    def pop(self, board_id):
+        """Return and forget a board's deltas as F() update kwargs."""
+        deltas = self.deltas.pop(board_id, {})
+        return {
+            field: F(field) + delta
+            for field, delta in deltas.items() if delta
+        }
+
+    def apply(self):
+        """Write the deltas; boards are updated in id order."""
+        for board_id in sorted(self.deltas):
+            changes = self.pop(board_id)
+            if changes:
+                Board.objects.filter(pk=board_id).update(**changes)
+
+
+def _count_of(queryset, key='board_id'):
+    """Return a subquery counting queryset rows of the outer row."""
+    counted = queryset.filter(**{key: OuterRef('pk')}).order_by(
+    ).values(key).annotate(count=Count('id')).values('count')
+    return Coalesce(Subquery(counted), 0)
+
+
+def recount_expressions():
+    """Return counter field -> subquery recounting it from the tables."""
+    tasks = Task.objects.all()
+    expressions = {**member_recount(), 'ticket_count': _count_of(tasks)}
+    for field, (name, value) in Board.COUNTED_TASKS.items():
+        expressions[field] = _count_of(tasks.filter(**{name: value}))
+    return expressions
+
+
+def member_recount():
+    """Return update kwargs recounting a board's members."""
+    return {'member_count': _count_of(Board.members.through.objects.all())}
+
+
+def recount_rows(board_ids):
+    """Return rows of boards' stored counters next to a fresh recount."""
+    return Board.objects.filter(id__in=board_ids).with_counts().values(
+        'id', *FIELDS, *(f'counted_{field}' for field in FIELDS)
+    )
+
+
+def stale_board_ids(board_ids):
+    """Return ids of boards whose counters differ from a recount."""
+    rows = recount_rows(board_ids)
+    return [
+        row['id'] for row in rows
+        if any(row[field] != row[f'counted_{field}'] for field in FIELDS)
+    ]
+
+
+def recompute(boards=None, chunk_size=1000, dry_run=False):
+    """Recount boards (default: all) in chunks and fix drifted counters.
+
+    Drifted boards are fixed with a single UPDATE of recount subqueries,
+    so concurrent F() increments are not lost. Returns (boards checked,
+    boards with drift).
+    """
+    if boards is None:
+        boards = Board.objects.all()
+    ids = boards.order_by('id').values_list('id', flat=True)
+    checked = repaired = 0
+    last_id = 0
+    while True:
+        chunk = list(ids.filter(id__gt=last_id)[:chunk_size])
+        if not chunk:
+            return checked, repaired
+        last_id = chunk[-1]
+        stale = stale_board_ids(chunk)
+        if stale and not dry_run:
+            Board.objects.filter(id__in=stale).update(
+                **recount_expressions()
+            )
+        checked += len(chunk)
+        repaired += len(stale)
+
+
+def comments_changed(task_id, delta):
+    """Add delta to a task's comment count."""
+    Task.objects.filter(pk=task_id).update(
+        comments_count=F('comments_count') + delta
+    )
+
+
+def comment_recount():
+    """Return update kwargs recounting a task's comments."""
+    return {
+        'comments_count': _count_of(Comment.objects.all(), key='task_id')
+    }
+
+
+def recompute_comment_counts(tasks=None, chunk_size=1000, dry_run=False):
+    """Recount comments of tasks (default: all) in chunks.
+
+    Returns (tasks checked, tasks with drift); drifted tasks are fixed
+    with one recount UPDATE per chunk unless dry_run.
+    """
+    if tasks is None:
+        tasks = Task.objects.all()
+    ids = tasks.order_by('id').values_list('id', flat=True)
+    checked = repaired = 0
+    last_id = 0
+    while True:
+        chunk = list(ids.filter(id__gt=last_id)[:chunk_size])
+        if not chunk:
+            return checked, repaired
+        last_id = chunk[-1]
+        stale = list(
+            Task.objects.filter(id__in=chunk).order_by().annotate(
+                counted=Count('comments')
+            ).exclude(comments_count=F('counted')).values_list(
+                'id', flat=True
+            )
+        )
+        if stale and not dry_run:
+            Task.objects.filter(id__in=stale).update(**comment_recount())
+        checked += len(chunk)
+        repaired += len(stale)
@@ -1,9 +1,56 @@
 """Tests for Kanban app."""
-from django.test import TestCase
+import asyncio
+import datetime
+import json
+import os
+import tempfile
+import time
+from decimal import Decimal
+from io import BytesIO, StringIO
+from unittest import mock, skipUnless
+from asgiref.sync import async_to_sync, sync_to_async
+from django.utils.translation import gettext_lazy
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test import (
+    TestCase, SimpleTestCase, TransactionTestCase, override_settings
+)
+from django.test.utils import CaptureQueriesContext
+from django.conf import settings
+from django.core.cache.backends.locmem import LocMemCache
+from django.utils import timezone
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from core.parsers import FastJSONParser
+from core.renderers import FastJSONRenderer, orjson
 from rest_framework.test import APIClient
 from rest_framework import status
 from auth_app.models import User
-from kanban_app.models import Board, Task, Comment
+from kanban_app.models import Board, BoardChange, Task, Comment
+from kanban_app.api.lookups import get_task
+from kanban_app.api.filters import TaskListQuery
+from kanban_app.api.readers import (
+    board_detail_data, comment_data, comment_values, task_data, task_values
+)
+from kanban_app.api.serializers import (
+    BoardDetailSerializer, CommentSerializer, TaskSerializer
+)
+from kanban_app.checks import check_membership_cache
+from kanban_app.membership import board_ids_for, get_stats, reset_stats
+from kanban_app.realtime import InMemoryBroker, get_broker
+from core.metrics import registry
+from kanban_app.importer import BoardImporter, read_ndjson
+from kanban_app import export, querycount, stats
+from kanban_app.changes import record_changes, UPSERT
+from kanban_app.api import urls as kanban_urls
+from auth_app.api import urls as auth_urls
+from rest_framework.authtoken.models import Token
+from kanban_app.api.permissions import (
+    IsBoardMember, IsBoardOwner,
+    IsTaskCreatorOrBoardOwner, IsCommentAuthor
+)
 
 
 class BoardTests(TestCase):
@@ -36,6 +83,38 @@ class BoardTests(TestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data), 1)
 
+    def test_list_boards_counts(self):
+        """Test board list counts come from one aggregated query."""
+        other = User.objects.create_user(
+            email='other@test.de',
+            fullname='Other',
+            password='pass'
+        )
+        for index in range(3):
+            board = Board.objects.create(
+                title=f'Board {index}',
+                owner=self.user
+            )
+            board.members.add(self.user, other)
+            Task.objects.create(
+                board=board, title='A', status='to-do',
+                priority='high', created_by=self.user
+            )
+            Task.objects.create(
+                board=board, title='B', status='done',
+                priority='low', created_by=self.user
+            )
+        board_ids_for(self.user)
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/boards/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 3)
+        self.assertEqual(response.data[0]['member_count'], 2)
+        self.assertEqual(response.data[0]['ticket_count'], 2)
+        self.assertEqual(response.data[0]['tasks_to_do_count'], 1)
+        self.assertEqual(response.data[0]['tasks_high_prio_count'], 1)
+        self.assertEqual(response.data[0]['owner_id'], self.user.id)
+
     def test_get_board_detail(self):
         """Test retrieving board details."""
         board = Board.objects.create(
@@ -47,6 +126,36 @@ class BoardTests(TestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['title'], 'Test')
 
+    def test_board_detail_query_count_is_constant(self):
+        """Test board detail queries do not grow with task count."""
+        board = Board.objects.create(title='Big', owner=self.user)
+        board.members.add(self.user)
+
+        def add_tasks(count):
+            for index in range(count):
+                task = Task.objects.create(
+                    board=board, title=f'Task {index}', status='to-do',
+                    priority='low', assignee=self.user,
+                    reviewer=self.user, created_by=self.user
+                )
+                Comment.objects.create(
+                    task=task, author=self.user, content='Hi'
+                )
+
+        add_tasks(1)
+        board_ids_for(self.user)
+        with self.assertNumQueries(3):
+            response = self.client.get(f'/api/boards/{board.id}/')
+        self.assertEqual(len(response.data['tasks']), 1)
+        add_tasks(20)
+        with self.assertNumQueries(3):
+            response = self.client.get(f'/api/boards/{board.id}/')
+        self.assertEqual(len(response.data['tasks']), 21)
+        self.assertEqual(response.data['tasks'][0]['comments_count'], 1)
+        self.assertEqual(
+            response.data['tasks'][0]['assignee']['id'], self.user.id
+        )
+
     def test_update_board(self):
         """Test updating board title and members."""
         board = Board.objects.create(
@@ -397,4 +506,2152 @@ class EdgeCaseTests(TestCase):
         }
         response = self.client.post('/api/tasks/', data)
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        self.assertEqual(response.data['reviewer']['id'], self.user.id)
\ No newline at end of file
+        self.assertEqual(response.data['reviewer']['id'], self.user.id)
+
+
+class LookupTests(TestCase):
+    """Test suite for fused fetch-and-authorize lookups."""
+
+    def setUp(self):
+        """Set up owner, member, outsider and a task."""
+        self.client = APIClient()
+        self.owner = User.objects.create_user(
+            email='owner@test.de',
+            fullname='Owner',
+            password='test1234'
+        )
+        self.member = User.objects.create_user(
+            email='member@test.de',
+            fullname='Member',
+            password='test1234'
+        )
+        self.outsider = User.objects.create_user(
+            email='outsider@test.de',
+            fullname='Outsider',
+            password='test1234'
+        )
+        self.board = Board.objects.create(
+            title='Test Board',
+            owner=self.owner
+        )
+        self.board.members.add(self.member)
+        self.task = Task.objects.create(
+            board=self.board,
+            title='Task',
+            status='to-do',
+            priority='low',
+            created_by=self.member
+        )
+
+    def test_get_task_flags(self):
+        """Test task lookup returns access flags in one query."""
+        board_ids_for(self.member)
+        with self.assertNumQueries(1):
+            task = get_task(self.task.id, self.member)
+        self.assertTrue(task.is_member)
+        self.assertFalse(task.is_owner)
+        owner_task = get_task(self.task.id, self.owner)
+        self.assertFalse(owner_task.is_member)
+        self.assertTrue(owner_task.is_owner)
+        self.assertIsNone(get_task('invalid', self.owner))
+
+    def test_task_retrieve_single_query(self):
+        """Test task retrieve authorizes and loads in one query."""
+        self.client.force_authenticate(user=self.member)
+        board_ids_for(self.member)
+        with self.assertNumQueries(1):
+            response = self.client.get(f'/api/tasks/{self.task.id}/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_task_retrieve_outsider(self):
+        """Test task retrieve denied for non-member."""
+        self.client.force_authenticate(user=self.outsider)
+        response = self.client.get(f'/api/tasks/{self.task.id}/')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_permission_classes(self):
+        """Test permission classes use lookup access flags."""
+        request = type('Request', (), {'user': self.member})()
+        comment = Comment.objects.create(
+            task=self.task,
+            author=self.member,
+            content='Hi'
+        )
+        self.assertTrue(
+            IsBoardMember().has_object_permission(request, None, self.task)
+        )
+        self.assertTrue(
+            IsBoardMember().has_object_permission(request, None, comment)
+        )
+        self.assertFalse(
+            IsBoardOwner().has_object_permission(request, None, self.board)
+        )
+        self.assertTrue(
+            IsTaskCreatorOrBoardOwner().has_object_permission(
+                request, None, self.task
+            )
+        )
+        self.assertTrue(
+            IsCommentAuthor().has_object_permission(request, None, comment)
+        )
+        request.user = self.outsider
+        self.assertFalse(
+            IsBoardMember().has_object_permission(
+                request, None, Board.objects.get(pk=self.board.pk)
+            )
+        )
+
+
+class MembershipCacheTests(TestCase):
+    """Test suite for the cross-request board membership cache."""
+
+    def setUp(self):
+        """Set up owner, member and a board."""
+        self.owner = User.objects.create_user(
+            email='owner@test.de',
+            fullname='Owner',
+            password='test1234'
+        )
+        self.member = User.objects.create_user(
+            email='member@test.de',
+            fullname='Member',
+            password='test1234'
+        )
+        self.board = Board.objects.create(
+            title='Test Board',
+            owner=self.owner
+        )
+        reset_stats()
+
+    def test_revocation_in_another_worker_expires_with_timeout(self):
+        """Test a worker whose cache missed the invalidation catches up."""
+        worker = LocMemCache('other-worker', {})
+        self.board.members.add(self.member)
+        with mock.patch('kanban_app.membership.cache', worker):
+            self.assertIn(self.board.id, board_ids_for(self.member))
+        # Invalidates this process's cache only.
+        self.board.members.remove(self.member)
+        self.assertEqual(board_ids_for(self.member), set())
+        with mock.patch('kanban_app.membership.cache', worker):
+            self.assertIn(self.board.id, board_ids_for(self.member))
+        later = time.time() + settings.KANMIND_MEMBERSHIP_CACHE_TIMEOUT + 1
+        with mock.patch('kanban_app.membership.cache', worker), \
+                mock.patch('django.core.cache.backends.locmem.time.time',
+                           return_value=later):
+            self.assertEqual(board_ids_for(self.member), set())
+
+    def test_long_timeout_requires_shared_cache(self):
+        """Test the system check rejects long timeouts on LocMemCache."""
+        with override_settings(KANMIND_MEMBERSHIP_CACHE_TIMEOUT=300):
+            self.assertEqual(
+                [error.id for error in check_membership_cache(None)],
+                ['kanban_app.E001']
+            )
+            with override_settings(CACHES={'default': {
+                'BACKEND': 'django.core.cache.backends.dummy.DummyCache'
+            }}):
+                self.assertEqual(check_membership_cache(None), [])
+        self.assertEqual(check_membership_cache(None), [])
+
+    def test_hits_and_misses(self):
+        """Test repeated lookups are served from the cache."""
+        self.assertEqual(board_ids_for(self.owner), {self.board.id})
+        with self.assertNumQueries(0):
+            self.assertEqual(board_ids_for(self.owner), {self.board.id})
+        stats = get_stats()
+        self.assertEqual(stats['misses'], 1)
+        self.assertEqual(stats['hits'], 1)
+
+    def test_membership_changes_invalidate(self):
+        """Test adding, removing and clearing members invalidates."""
+        self.assertEqual(board_ids_for(self.member), set())
+        self.board.members.add(self.member)
+        self.assertEqual(board_ids_for(self.member), {self.board.id})
+        self.board.members.remove(self.member)
+        self.assertEqual(board_ids_for(self.member), set())
+        self.member.boards.add(self.board)
+        self.assertEqual(board_ids_for(self.member), {self.board.id})
+        self.board.members.clear()
+        self.assertEqual(board_ids_for(self.member), set())
+
+    def test_board_save_and_delete_invalidate(self):
+        """Test board creation, transfer and deletion invalidate."""
+        self.assertEqual(board_ids_for(self.owner), {self.board.id})
+        self.assertEqual(board_ids_for(self.member), set())
+        board = Board.objects.get(pk=self.board.pk)
+        board.owner = self.member
+        board.save()
+        self.assertEqual(board_ids_for(self.member), {board.id})
+        self.assertEqual(board_ids_for(self.owner), set())
+        board.delete()
+        self.assertEqual(board_ids_for(self.member), set())
+
+
+class PaginationTests(TestCase):
+    """Test suite for opt-in cursor pagination."""
+
+    def setUp(self):
+        """Set up authenticated client with a board of tasks."""
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email='test@test.de',
+            fullname='Test User',
+            password='test1234'
+        )
+        self.client.force_authenticate(user=self.user)
+        self.board = Board.objects.create(
+            title='Test Board',
+            owner=self.user
+        )
+        self.tasks = [
+            Task.objects.create(
+                board=self.board, title=f'Task {index}', status='to-do',
+                priority='low', assignee=self.user, created_by=self.user
+            )
+            for index in range(5)
+        ]
+
+    def collect(self, url):
+        """Follow next links and return all result IDs."""
+        ids = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            ids.extend(item['id'] for item in response.data['results'])
+            url = response.data['next']
+        return ids
+
+    def test_unpaginated_by_default(self):
+        """Test clients that do not opt in get a plain list."""
+        response = self.client.get('/api/tasks/assigned-to-me/')
+        self.assertEqual(len(response.data), 5)
+
+    def test_task_cursor_pages(self):
+        """Test task list pages follow the -id ordering."""
+        ids = self.collect('/api/tasks/?paginate=cursor&page_size=2')
+        expected = [task.id for task in reversed(self.tasks)]
+        self.assertEqual(ids, expected)
+        ids = self.collect(
+            '/api/tasks/assigned-to-me/?paginate=cursor&page_size=2'
+        )
+        self.assertEqual(ids, expected)
+
+    def test_board_and_comment_cursor_pages(self):
+        """Test boards and comments paginate with opaque cursors."""
+        ids = self.collect('/api/boards/?paginate=cursor&page_size=1')
+        self.assertEqual(ids, [self.board.id])
+        task = self.tasks[0]
+        comments = [
+            Comment.objects.create(task=task, author=self.user, content='c')
+            for _ in range(3)
+        ]
+        ids = self.collect(
+            f'/api/tasks/{task.id}/comments/?paginate=cursor&page_size=2'
+        )
+        self.assertEqual(ids, [comment.id for comment in comments])
+
+
+class BoardChangesTests(TestCase):
+    """Test suite for the board delta-sync endpoint."""
+
+    def setUp(self):
+        """Set up authenticated member of a board."""
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email='test@test.de',
+            fullname='Test User',
+            password='test1234'
+        )
+        self.other = User.objects.create_user(
+            email='other@test.de',
+            fullname='Other',
+            password='test1234'
+        )
+        self.client.force_authenticate(user=self.user)
+        self.board = Board.objects.create(
+            title='Test Board',
+            owner=self.user
+        )
+        self.url = f'/api/boards/{self.board.id}/changes/'
+
+    def changes(self, since):
+        """Return the delta-sync payload since a version."""
+        response = self.client.get(f'{self.url}?since={since}')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def test_writes_bump_version_and_report_upserts(self):
+        """Test task, comment and member writes appear as upserts."""
+        self.board.members.add(self.other)
+        task = Task.objects.create(
+            board=self.board, title='Task', status='to-do',
+            priority='low', created_by=self.user
+        )
+        Comment.objects.create(task=task, author=self.user, content='Hi')
+        data = self.changes(0)
+        self.assertEqual(data['version'], 3)
+        self.assertEqual(
+            [t['id'] for t in data['tasks']['upserted']], [task.id]
+        )
+        self.assertEqual(
+            data['comments']['upserted'][0]['task_id'], task.id
+        )
+        self.assertEqual(
+            data['members']['upserted'][0]['id'], self.other.id
+        )
+        self.assertEqual(self.changes(data['version'])['tasks'], {
+            'upserted': [], 'deleted': []
+        })
+
+    def test_deletes_report_tombstones(self):
+        """Test deletions and member removals are reported."""
+        self.board.members.add(self.other)
+        task = Task.objects.create(
+            board=self.board, title='Task', status='to-do',
+            priority='low', created_by=self.user
+        )
+        comment = Comment.objects.create(
+            task=task, author=self.user, content='Hi'
+        )
+        version = self.changes(0)['version']
+        comment_id = comment.id
+        comment.delete()
+        task_id = task.id
+        task.delete()
+        self.board.members.remove(self.other)
+        data = self.changes(version)
+        self.assertEqual(data['tasks']['deleted'], [task_id])
+        self.assertEqual(
+            data['comments']['deleted'],
+            [{'id': comment_id, 'task_id': task_id}]
+        )
+        self.assertEqual(data['members']['deleted'], [self.other.id])
+
+    def test_stale_board_save_keeps_version(self):
+        """Test saving a stale board never moves its version back."""
+        stale = Board.objects.get(pk=self.board.pk)
+        for title in ('A', 'B', 'C'):
+            Task.objects.create(
+                board=self.board, title=title, status='to-do',
+                priority='low', created_by=self.user
+            )
+        stale.title = 'Renamed'
+        stale.save()
+        self.board.refresh_from_db()
+        self.assertEqual((self.board.title, self.board.version),
+                         ('Renamed', 4))
+
+    def test_board_delete_drops_change_log(self):
+        """Test deleting a board cascades without leaving log rows."""
+        task = Task.objects.create(
+            board=self.board, title='Task', status='to-do',
+            priority='low', created_by=self.user
+        )
+        Comment.objects.create(task=task, author=self.user, content='Hi')
+        self.board.delete()
+        self.assertFalse(BoardChange.objects.exists())
+
+    def test_invalid_since(self):
+        """Test missing or negative since is rejected."""
+        response = self.client.get(self.url)
+        self.assertEqual(
+            response.status_code, status.HTTP_400_BAD_REQUEST
+        )
+        self.client.force_authenticate(user=self.other)
+        response = self.client.get(f'{self.url}?since=0')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class ChangeLogAtomicityTests(TransactionTestCase):
+    """Test the version bump and its log rows commit together."""
+
+    def setUp(self):
+        """Set up a board with a task, outside any test transaction."""
+        self.user = User.objects.create_user(
+            email='test@test.de',
+            fullname='Test User',
+            password='test1234'
+        )
+        self.board = Board.objects.create(title='Board', owner=self.user)
+        self.task = Task.objects.create(
+            board=self.board, title='Task', status='to-do',
+            priority='low', created_by=self.user
+        )
+
+    def assert_log_matches_version(self):
+        """Assert every version up to the board's has log rows."""
+        self.board.refresh_from_db()
+        versions = set(
+            BoardChange.objects.filter(board=self.board).values_list(
+                'version', flat=True
+            )
+        )
+        self.assertEqual(versions, set(range(1, self.board.version + 1)))
+
+    def test_version_and_log_always_agree(self):
+        """Test a failed log insert also rolls back the version bump."""
+        self.assert_log_matches_version()
+        with mock.patch.object(BoardChange.objects, 'bulk_create',
+                               side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                record_changes(self.board.id, 'task', [self.task.id],
+                               UPSERT)
+        self.assert_log_matches_version()
+        self.task.delete()
+        self.assert_log_matches_version()
+
+
+class ConditionalRequestTests(TestCase):
+    """Test suite for ETag / If-None-Match support."""
+
+    def setUp(self):
+        """Set up authenticated owner of a board with a task."""
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email='test@test.de',
+            fullname='Test User',
+            password='test1234'
+        )
+        self.client.force_authenticate(user=self.user)
+        self.board = Board.objects.create(
+            title='Test Board',
+            owner=self.user
+        )
+        self.task = Task.objects.create(
+            board=self.board, title='Task', status='to-do',
+            priority='low', created_by=self.user
+        )
+
+    def assert_revalidates(self, url):
+        """Test url answers 304 until the board changes."""
+        etag = self.client.get(url)['ETag']
+        with self.assertNumQueries(1):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response['ETag'], etag)
+        Comment.objects.create(task=self.task, author=self.user, content='x')
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_board_detail_etag(self):
+        """Test board detail revalidation."""
+        self.assert_revalidates(f'/api/boards/{self.board.id}/')
+
+    def test_task_detail_etag(self):
+        """Test task detail revalidation."""
+        self.assert_revalidates(f'/api/tasks/{self.task.id}/')
+
+    def test_board_list_etag(self):
+        """Test board list revalidation and paginated variants."""
+        self.assert_revalidates('/api/boards/')
+        plain = self.client.get('/api/boards/')['ETag']
+        paged = self.client.get('/api/boards/?paginate=cursor')['ETag']
+        self.assertNotEqual(plain, paged)
+
+    def test_profile_change_invalidates_nesting_etags(self):
+        """Test a member's new name changes board and task ETags."""
+        member = User.objects.create_user(
+            email='member@test.de', fullname='Member', password='test1234'
+        )
+        self.board.members.add(member)
+        Task.objects.filter(pk=self.task.pk).update(assignee=member)
+        urls = [f'/api/boards/{self.board.id}/', f'/api/tasks/{self.task.id}/']
+        etags = [self.client.get(url)['ETag'] for url in urls]
+        member.last_login = timezone.now()
+        member.save(update_fields=['last_login'])
+        for url, etag in zip(urls, etags):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code,
+                             status.HTTP_304_NOT_MODIFIED)
+        member.fullname = 'Renamed'
+        member.save()
+        for url, etag in zip(urls, etags):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertIn('Renamed', json.dumps(response.data))
+        changes = self.client.get(
+            f'/api/boards/{self.board.id}/changes/?since=0'
+        ).data
+        self.assertEqual(changes['members']['upserted'][0]['fullname'],
+                         'Renamed')
+
+
+class RecordingBroker(InMemoryBroker):
+    """Broker collecting published events for assertions."""
+
+    events = []
+
+    def publish(self, board_id, event):
+        """Record a published event and deliver it."""
+        self.events.append((board_id, event))
+        super().publish(board_id, event)
+
+
+class InMemoryBrokerTests(SimpleTestCase):
+    """Test suite for the in-process event fan-out hub."""
+
+    def test_fan_out_and_overflow(self):
+        """Test thread-safe delivery, isolation and overflow resync."""
+        async def scenario():
+            broker = InMemoryBroker(max_queue=2)
+            first = broker.subscribe(1)
+            other = broker.subscribe(2)
+            await asyncio.to_thread(broker.publish, 1, {'n': 1})
+            self.assertEqual(await first.get(timeout=1), {'n': 1})
+            self.assertIsNone(await other.get(timeout=0.01))
+            for number in range(3):
+                broker.publish(1, {'n': number})
+            await asyncio.sleep(0)
+            self.assertEqual(await first.get(timeout=1), {'type': 'resync'})
+            broker.unsubscribe(first)
+            broker.unsubscribe(other)
+            self.assertEqual(broker.subscriber_count(), 0)
+
+        asyncio.run(scenario())
+
+
+@override_settings(KANMIND_REALTIME_BROKER='kanban_app.tests.RecordingBroker')
+class BoardEventsTests(TestCase):
+    """Test suite for live board update streams."""
+
+    def setUp(self):
+        """Set up board owner with a token."""
+        RecordingBroker.events.clear()
+        self.user = User.objects.create_user(
+            email='test@test.de',
+            fullname='Test User',
+            password='test1234'
+        )
+        self.token = Token.objects.create(user=self.user)
+        self.board = Board.objects.create(
+            title='Test Board',
+            owner=self.user
+        )
+
+    def test_changes_published_after_commit(self):
+        """Test writes publish change events once committed."""
+        with self.captureOnCommitCallbacks(execute=True):
+            task = Task.objects.create(
+                board=self.board, title='Task', status='to-do',
+                priority='low', created_by=self.user
+            )
+        board_id, event = RecordingBroker.events[-1]
+        self.assertEqual(board_id, self.board.id)
+        self.assertEqual(event['entity'], 'task')
+        self.assertEqual(event['ids'], [task.id])
+
+    def test_stream_requires_token(self):
+        """Test event stream rejects unauthenticated clients."""
+        response = self.client.get(f'/api/boards/{self.board.id}/events/')
+        self.assertEqual(response.status_code, 401)
+
+    def ticket(self, user=None, board=None):
+        """Return a stream ticket issued through the API."""
+        client = APIClient()
+        client.force_authenticate(user=user or self.user)
+        response = client.post(
+            f'/api/boards/{(board or self.board).id}/events/ticket/'
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data['ticket']
+
+    async def test_stream_sends_ready_event(self):
+        """Test event stream opens with the current board version."""
+        ticket = await sync_to_async(self.ticket)()
+        response = await self.async_client.get(
+            f'/api/boards/{self.board.id}/events/', {'ticket': ticket}
+        )
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        chunk = await anext(aiter(response.streaming_content))
+        self.assertTrue(chunk.startswith(b'event: ready'))
+
+    def test_stream_rejects_tokens_in_url_and_foreign_tickets(self):
+        """Test only valid tickets for this board open the stream."""
+        url = f'/api/boards/{self.board.id}/events/'
+        other = Board.objects.create(title='Other', owner=self.user)
+        for params in ({'token': self.token.key},
+                       {'ticket': self.ticket(board=other)},
+                       {'ticket': 'forged'}):
+            response = self.client.get(url, params)
+            self.assertEqual(response.status_code, 401, params)
+        ticket = self.ticket()
+        with override_settings(KANMIND_REALTIME_TICKET_TTL=-1):
+            response = self.client.get(url, {'ticket': ticket})
+        self.assertEqual(response.status_code, 401)
+
+    def test_ticket_requires_board_access(self):
+        """Test non-members cannot obtain a ticket."""
+        outsider = User.objects.create_user(
+            email='out@test.de', fullname='Out', password='test1234'
+        )
+        client = APIClient()
+        client.force_authenticate(user=outsider)
+        response = client.post(
+            f'/api/boards/{self.board.id}/events/ticket/'
+        )
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    async def test_stream_ends_when_member_is_removed(self):
+        """Test a removed member's subscription is dropped."""
+        member = await User.objects.acreate(
+            email='member@test.de', fullname='Member'
+        )
+        await self.board.members.aadd(member)
+        ticket = await sync_to_async(self.ticket)(member)
+        response = await self.async_client.get(
+            f'/api/boards/{self.board.id}/events/', {'ticket': ticket}
+        )
+        chunks = aiter(response.streaming_content)
+        await anext(chunks)
+        await self.board.members.aremove(member)
+        get_broker().publish(self.board.id, {
+            'type': 'change', 'entity': 'member', 'op': 'delete',
+            'ids': [member.id],
+        })
+        self.assertIn(b'"member"', await anext(chunks))
+        with self.assertRaises(StopAsyncIteration):
+            await anext(chunks)
+
+    async def test_stream_ends_when_board_is_deleted(self):
+        """Test a board-deleted event closes the stream."""
+        ticket = await sync_to_async(self.ticket)()
+        response = await self.async_client.get(
+            f'/api/boards/{self.board.id}/events/', {'ticket': ticket}
+        )
+        chunks = aiter(response.streaming_content)
+        await anext(chunks)
+        get_broker().publish(self.board.id, {
+            'type': 'board-deleted', 'board_id': self.board.id
+        })
+        self.assertTrue((await anext(chunks)).startswith(
+            b'event: board-deleted'
+        ))
+        with self.assertRaises(StopAsyncIteration):
+            await anext(chunks)
+        self.assertEqual(get_broker().subscriber_count(self.board.id), 0)
+
+    @override_settings(KANMIND_REALTIME_HEARTBEAT=0.01)
+    async def test_heartbeat_ends_stream_of_deactivated_user(self):
+        """Test the heartbeat re-checks that the user is still active."""
+        ticket = await sync_to_async(self.ticket)()
+        response = await self.async_client.get(
+            f'/api/boards/{self.board.id}/events/', {'ticket': ticket}
+        )
+        chunks = aiter(response.streaming_content)
+        await anext(chunks)
+        self.assertEqual(await anext(chunks), b': ping\n\n')
+        await User.objects.filter(pk=self.user.pk).aupdate(is_active=False)
+        with self.assertRaises(StopAsyncIteration):
+            await anext(chunks)
+        self.assertEqual(get_broker().subscriber_count(self.board.id), 0)
+
+
+class TaskBatchTests(TestCase):
+    """Test suite for the batch task endpoint."""
+
+    def setUp(self):
+        """Set up authenticated owner of a board with tasks."""
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email='test@test.de',
+            fullname='Test User',
+            password='test1234'
+        )
+        self.other = User.objects.create_user(
+            email='other@test.de',
+            fullname='Other',
+            password='test1234'
+        )
+        self.client.force_authenticate(user=self.user)
+        self.board = Board.objects.create(
+            title='Test Board',
+            owner=self.user
+        )
+        self.foreign_board = Board.objects.create(
+            title='Foreign',
+            owner=self.other
+        )
+        self.task = Task.objects.create(
+            board=self.board, title='Old', status='to-do',
+            priority='low', created_by=self.user
+        )
+        self.doomed = Task.objects.create(
+            board=self.board, title='Doomed', status='to-do',
+            priority='low', created_by=self.user
+        )
+
+    def create_op(self, title, board=None):
+        """Return a create operation."""
+        return {'op': 'create', 'data': {
+            'board': board or self.board.id, 'title': title,
+            'status': 'to-do', 'priority': 'high',
+            'assignee_id': self.user.id
+        }}
+
+    def test_mixed_batch_applied(self):
+        """Test creates, updates and deletes are applied together."""
+        version = Board.objects.get(pk=self.board.pk).version
+        response = self.client.post('/api/tasks/batch/', {'operations': [
+            self.create_op('New 1'),
+            self.create_op('New 2'),
+            {'op': 'update', 'id': self.task.id,
+             'data': {'status': 'done', 'reviewer_id': self.user.id}},
+            {'op': 'delete', 'id': self.doomed.id},
+        ]}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.data['results']
+        self.assertEqual([r['status'] for r in results], [201, 201, 200, 204])
+        self.assertEqual(results[0]['data']['assignee']['id'], self.user.id)
+        self.assertEqual(results[2]['data']['reviewer']['id'], self.user.id)
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.status, 'done')
+        self.assertFalse(Task.objects.filter(pk=self.doomed.pk).exists())
+        self.assertEqual(Task.objects.filter(board=self.board).count(), 3)
+        self.assertEqual(
+            Board.objects.get(pk=self.board.pk).version, version + 2
+        )
+
+    def test_query_count_independent_of_batch_size(self):
+        """Test batch cost does not grow with the number of items."""
+        board_ids_for(self.user)
+
+        def run(count):
+            operations = [self.create_op(f'T{i}') for i in range(count)]
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.post(
+                    '/api/tasks/batch/', operations, format='json'
+                )
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            return len(queries)
+
+        self.assertEqual(run(2), run(20))
+
+    def test_failed_item_rolls_back_batch(self):
+        """Test one invalid item rejects the whole batch."""
+        response = self.client.post('/api/tasks/batch/', {'operations': [
+            self.create_op('Fine'),
+            self.create_op('Forbidden', board=self.foreign_board.id),
+            {'op': 'delete', 'id': 9999},
+            {'op': 'update', 'id': self.task.id, 'data': {'status': 'x'}},
+        ]}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            [r['status'] for r in response.data['results']],
+            [424, 403, 404, 400]
+        )
+        self.assertEqual(Task.objects.count(), 2)
+
+
+class TaskMoveTests(TestCase):
+    """Test suite for the bulk task transition endpoint."""
+
+    def setUp(self):
+        """Set up authenticated owner of two boards with tasks."""
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email='test@test.de',
+            fullname='Test User',
+            password='test1234'
+        )
+        self.client.force_authenticate(user=self.user)
+        self.board = Board.objects.create(title='Board', owner=self.user)
+        self.other_board = Board.objects.create(title='Other', owner=self.user)
+        self.tasks = [
+            Task.objects.create(
+                board=self.board, title=f'Task {index}', status='to-do',
+                priority='low', created_by=self.user
+            )
+            for index in range(3)
+        ]
+        self.outside = Task.objects.create(
+            board=self.other_board, title='Outside', status='to-do',
+            priority='low', created_by=self.user
+        )
+        self.url = f'/api/boards/{self.board.id}/tasks/move/'
+
+    def test_move_updates_only_board_tasks(self):
+        """Test one UPDATE moves the selected tasks of the board."""
+        version = Board.objects.get(pk=self.board.pk).version
+        ids = [task.id for task in self.tasks[:2]] + [self.outside.id]
+        response = self.client.post(self.url, {
+            'task_ids': ids,
+            'status': 'in-progress',
+            'assignee_id': self.user.id
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['updated'], 2)
+        self.assertEqual(
+            {task['status'] for task in response.data['tasks']},
+            {'in-progress'}
+        )
+        self.assertEqual(
+            Task.objects.filter(status='in-progress').count(), 2
+        )
+        self.outside.refresh_from_db()
+        self.assertEqual(self.outside.status, 'to-do')
+        self.assertEqual(
+            Board.objects.get(pk=self.board.pk).version, version + 1
+        )
+
+    def test_move_validation(self):
+        """Test missing changes and invalid values are rejected."""
+        ids = [self.tasks[0].id]
+        for payload in [
+            {'task_ids': ids},
+            {'task_ids': ids, 'status': 'unknown'},
+            {'task_ids': ids, 'reviewer_id': 9999},
+            {'task_ids': [], 'status': 'done'},
+        ]:
+            response = self.client.post(self.url, payload, format='json')
+            self.assertEqual(
+                response.status_code, status.HTTP_400_BAD_REQUEST
+            )
+
+
+class RequestMetricsTests(TestCase):
+    """Test suite for request metrics middleware and endpoint."""
+
+    def setUp(self):
+        """Set up a regular and a staff user."""
+        registry.reset()
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email='test@test.de',
+            fullname='Test User',
+            password='test1234'
+        )
+        self.staff = User.objects.create_superuser(
+            email='admin@test.de',
+            fullname='Admin',
+            password='test1234'
+        )
+        Board.objects.create(title='Board', owner=self.user)
+
+    def test_server_timing_and_aggregation(self):
+        """Test only staff get Server-Timing and samples aggregate."""
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get('/api/boards/')
+        self.assertNotIn('Server-Timing', response)
+        response = self.client.get('/api/metrics/')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.client.force_authenticate(user=self.staff)
+        response = self.client.get('/api/boards/')
+        self.assertIn('queries"', response['Server-Timing'])
+        self.assertIn('ser;dur=', response['Server-Timing'])
+        response = self.client.get('/api/metrics/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['board-list']['count'], 2)
+        self.assertGreaterEqual(response.data['board-list']['max_queries'], 1)
+        self.assertIn('p99_ms', response.data['board-list'])
+
+    @override_settings(DEBUG=True)
+    def test_debug_shows_server_timing_to_everyone(self):
+        """Test DEBUG adds Server-Timing for non-staff users too."""
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get('/api/boards/')
+        self.assertIn('total;dur=', response['Server-Timing'])
+
+    async def test_asgi_requests_count_queries(self):
+        """Test the ASGI path counts queries run in worker threads."""
+        token = await Token.objects.acreate(user=self.staff)
+        response = await self.async_client.get(
+            '/api/boards/', headers={'Authorization': f'Token {token.key}'}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn('db;dur=0.00;desc="0 queries"',
+                         response['Server-Timing'])
+        self.assertGreaterEqual(
+            registry.snapshot()['board-list']['max_queries'], 1
+        )
+
+
+class QueryBudgetTests(TestCase):
+    """Test suite guarding every API route against N+1 regressions."""
+
+    def setUp(self):
+        """Set up API client."""
+        self.client = APIClient()
+
+    def test_every_route_has_a_case(self):
+        """Test the harness covers all kanban and auth routes."""
+        names = (querycount.route_names(kanban_urls.urlpatterns)
+                 | querycount.route_names(auth_urls.urlpatterns))
+        covered = {case.name for case in querycount.CASES}
+        self.assertEqual(names - covered, set())
+
+    def test_query_counts_constant_and_within_budget(self):
+        """Test query counts ignore data size and respect the budget."""
+        counts = {}
+        for size in querycount.SIZES:
+            dataset = querycount.seed_dataset(size, f's{size}')
+            for case in querycount.CASES:
+                status_code, queries = querycount.measure(
+                    self.client, case, dataset
+                )
+                self.assertEqual(status_code, case.expected_status, case.key)
+                counts.setdefault(case.key, {})[size] = queries
+
+        growing = {key: by_size for key, by_size in counts.items()
+                   if len(set(by_size.values())) > 1}
+        self.assertEqual(growing, {})
+
+        measured = {key: max(by_size.values())
+                    for key, by_size in counts.items()}
+        if querycount.should_update_budgets():
+            querycount.write_budgets(measured)
+        budgets = querycount.load_budgets()
+        over_budget = {
+            key: (queries, budgets.get(key))
+            for key, queries in measured.items()
+            if budgets.get(key) is None or queries > budgets[key]
+        }
+        self.assertEqual(over_budget, {})
+
+
+class SeedAndBenchCommandTests(TestCase):
+    """Test synthetic data generation and the API benchmark command."""
+
+    def test_seed_kanban_creates_dataset_in_chunks(self):
+        """Test seeding creates the requested volume with valid members."""
+        call_command('seed_kanban', users=6, boards=4, tasks=55,
+                     chunk_size=10, prefix='unit', stdout=StringIO())
+        self.assertEqual(
+            User.objects.filter(email__startswith='unit-').count(), 6
+        )
+        self.assertEqual(Board.objects.count(), 4)
+        self.assertEqual(Task.objects.count(), 55)
+        for board in Board.objects.prefetch_related('members', 'tasks'):
+            member_ids = {user.id for user in board.members.all()}
+            self.assertIn(board.owner_id, member_ids)
+            for task in board.tasks.all():
+                self.assertIn(task.created_by_id, member_ids)
+                if task.assignee_id:
+                    self.assertIn(task.assignee_id, member_ids)
+
+    def test_seed_kanban_refuses_existing_prefix(self):
+        """Test reseeding the same prefix requires --flush."""
+        call_command('seed_kanban', users=2, boards=1, tasks=3,
+                     prefix='unit', stdout=StringIO())
+        with self.assertRaises(CommandError):
+            call_command('seed_kanban', users=2, boards=1, tasks=3,
+                         prefix='unit', stdout=StringIO())
+        call_command('seed_kanban', users=2, boards=1, tasks=3,
+                     prefix='unit', flush=True, stdout=StringIO())
+        self.assertEqual(Task.objects.count(), 3)
+
+    def test_bench_api_reports_percentiles_and_rolls_back(self):
+        """Test bench_api prints per-route stats and leaves no data."""
+        out = StringIO()
+        call_command('bench_api', iterations=2, warmup=0, tasks=5,
+                     routes=['task-list', 'task-detail'], stdout=out)
+        results = json.loads(out.getvalue())
+        self.assertEqual(
+            set(results['routes']),
+            {'GET task-list', 'POST task-list', 'GET task-detail',
+             'PATCH task-detail', 'DELETE task-detail'}
+        )
+        for stats in results['routes'].values():
+            self.assertEqual(stats['status'], [stats['expected_status']])
+            self.assertEqual(stats['requests'], 2)
+            self.assertLessEqual(stats['p50_ms'], stats['p99_ms'])
+        self.assertEqual(User.objects.count(), 0)
+
+
+@skipUnless(connection.vendor == 'sqlite', 'EXPLAIN QUERY PLAN is SQLite')
+class IndexPlanTests(TestCase):
+    """Test the planner uses the task and comment indexes."""
+
+    def setUp(self):
+        """Create a board with assigned, reviewed and commented tasks."""
+        self.user = User.objects.create_user(
+            email='plan@test.de', fullname='Plan', password='pass'
+        )
+        self.board = Board.objects.create(title='Plan', owner=self.user)
+        self.board.members.add(self.user)
+        self.task = Task.objects.create(
+            board=self.board, title='T', status='to-do', priority='high',
+            assignee=self.user, reviewer=self.user, created_by=self.user
+        )
+        Comment.objects.create(task=self.task, author=self.user, content='C')
+        self.board_ids = board_ids_for(self.user)
+
+    def assertUsesIndex(self, queryset, index_name):
+        """Assert EXPLAIN QUERY PLAN for queryset mentions index_name."""
+        self.assertIn(index_name, queryset.explain())
+
+    def test_stale_board_recount_uses_covering_index(self):
+        """Test the counter drift recount reads the covering index."""
+        self.assertUsesIndex(
+            stats.recount_rows(self.board_ids),
+            'COVERING INDEX task_board_status_prio_idx'
+        )
+
+    def test_assigned_to_me_uses_assignee_index(self):
+        """Test assigned-to-me searches the partial assignee index."""
+        queryset = Task.objects.with_related().filter(
+            board_id__in=self.board_ids, assignee=self.user
+        )
+        self.assertUsesIndex(queryset, 'task_assignee_board_idx')
+
+    def test_reviewing_uses_reviewer_index(self):
+        """Test reviewing searches the partial reviewer index."""
+        queryset = Task.objects.with_related().filter(
+            board_id__in=self.board_ids, reviewer=self.user
+        )
+        self.assertUsesIndex(queryset, 'task_reviewer_board_idx')
+
+    def test_board_priority_filter_uses_index(self):
+        """Test filtering a board by priority uses the composite index."""
+        queryset = Task.objects.filter(board=self.board, priority='high')
+        self.assertUsesIndex(queryset, 'task_board_priority_idx')
+
+    def test_due_date_lookup_uses_partial_index(self):
+        """Test due date lookups use the partial due date index."""
+        queryset = Task.objects.filter(due_date='2030-01-01')
+        self.assertUsesIndex(queryset, 'task_due_date_idx')
+
+    def test_comment_list_is_ordered_by_index(self):
+        """Test comment list reads in index order without a sort step."""
+        plan = self.task.comments.select_related('author').explain()
+        self.assertIn('comment_task_created_idx', plan)
+        self.assertNotIn('TEMP B-TREE', plan)
+
+
+@skipUnless(connection.vendor == 'sqlite', 'FTS5 search needs SQLite')
+class SearchTests(TestCase):
+    """Test full-text search across tasks and comments."""
+
+    def setUp(self):
+        """Create a member board and a board of another user."""
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email='search@test.de', fullname='Search', password='pass'
+        )
+        self.other = User.objects.create_user(
+            email='hidden@test.de', fullname='Hidden', password='pass'
+        )
+        self.board = Board.objects.create(title='Mine', owner=self.user)
+        self.board.members.add(self.user)
+        self.hidden = Board.objects.create(title='Hidden', owner=self.other)
+        self.task = Task.objects.create(
+            board=self.board, title='Invoice export', status='to-do',
+            priority='low', description='Totals are rounded',
+            created_by=self.user
+        )
+        self.client.force_authenticate(user=self.user)
+
+    def search(self, query):
+        """Return the search response for query."""
+        return self.client.get('/api/search/', {'q': query})
+
+    def test_search_ranks_title_matches_with_snippets(self):
+        """Test title hits outrank description hits and carry snippets."""
+        Task.objects.create(
+            board=self.board, title='Other', status='to-do',
+            priority='low', description='invoice mentioned here',
+            created_by=self.user
+        )
+        Task.objects.bulk_create([
+            Task(board=self.board, title=f'Filler {index}', status='done',
+                 priority='low', created_by=self.user)
+            for index in range(8)
+        ])
+        response = self.search('invoice')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 2)
+        first = response.data[0]
+        self.assertEqual((first['type'], first['id']), ('task', self.task.id))
+        self.assertEqual(first['board_id'], self.board.id)
+        self.assertIn('[Invoice]', first['snippet'])
+        self.assertGreater(first['score'], response.data[1]['score'])
+
+    def test_search_finds_comments_and_prefixes(self):
+        """Test comment content is indexed and terms match as prefixes."""
+        comment = Comment.objects.create(
+            task=self.task, author=self.user, content='Needs a reviewer'
+        )
+        response = self.search('review')
+        self.assertEqual(
+            [(hit['type'], hit['id'], hit['task_id'])
+             for hit in response.data],
+            [('comment', comment.id, self.task.id)]
+        )
+
+    def test_search_is_restricted_to_user_boards(self):
+        """Test tasks on boards the user cannot see are not returned."""
+        Task.objects.create(
+            board=self.hidden, title='Invoice secret', status='to-do',
+            priority='low', created_by=self.other
+        )
+        response = self.search('invoice')
+        self.assertEqual([hit['id'] for hit in response.data],
+                         [self.task.id])
+
+    def test_index_follows_updates_deletes_and_bulk_writes(self):
+        """Test triggers keep the index in sync with every write path."""
+        self.task.title = 'Payroll export'
+        self.task.save()
+        self.assertEqual(self.search('invoice').data, [])
+        self.assertEqual(len(self.search('payroll').data), 1)
+        Task.objects.bulk_create([
+            Task(board=self.board, title='Bulk payroll', status='to-do',
+                 priority='low', created_by=self.user)
+        ])
+        self.assertEqual(len(self.search('payroll').data), 2)
+        Task.objects.filter(board=self.board).delete()
+        self.assertEqual(self.search('payroll').data, [])
+
+    def test_search_requires_query(self):
+        """Test a query without terms is rejected."""
+        response = self.search(' "* ')
+        self.assertEqual(response.status_code,
+                         status.HTTP_400_BAD_REQUEST)
+
+    def test_rebuild_command_restores_index(self):
+        """Test the rebuild command re-indexes existing rows."""
+        with connection.cursor() as cursor:
+            cursor.execute('DELETE FROM kanban_search')
+        self.assertEqual(self.search('invoice').data, [])
+        call_command('rebuild_search_index', stdout=StringIO())
+        self.assertEqual(len(self.search('invoice').data), 1)
+
+
+class TaskListQueryTests(TestCase):
+    """Test task list filters, ordering and sparse fieldsets."""
+
+    def setUp(self):
+        """Create a board with tasks across statuses and priorities."""
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email='filter@test.de', fullname='Filter', password='pass'
+        )
+        self.other = User.objects.create_user(
+            email='peer@test.de', fullname='Peer', password='pass'
+        )
+        self.board = Board.objects.create(title='Filters', owner=self.user)
+        self.board.members.add(self.user, self.other)
+        self.second = Board.objects.create(title='Second', owner=self.user)
+        self.low = Task.objects.create(
+            board=self.board, title='B low', status='to-do',
+            priority='low', assignee=self.user, created_by=self.user,
+            due_date='2030-01-10'
+        )
+        self.high = Task.objects.create(
+            board=self.board, title='A high', status='done',
+            priority='high', reviewer=self.user, created_by=self.user,
+            due_date='2030-02-10'
+        )
+        self.medium = Task.objects.create(
+            board=self.second, title='C medium', status='review',
+            priority='medium', assignee=self.other, created_by=self.user
+        )
+        Comment.objects.create(task=self.low, author=self.user, content='x')
+        self.client.force_authenticate(user=self.user)
+
+    def ids(self, params, path='/api/tasks/'):
+        """Return the task ids listed for params."""
+        response = self.client.get(path, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [task['id'] for task in response.data]
+
+    def test_filters(self):
+        """Test status, priority, board, user and due date filters."""
+        self.assertEqual(self.ids({'status': 'to-do,done'}),
+                         [self.high.id, self.low.id])
+        self.assertEqual(self.ids({'priority': 'medium'}), [self.medium.id])
+        self.assertEqual(self.ids({'board': self.second.id}),
+                         [self.medium.id])
+        self.assertEqual(self.ids({'assignee': 'me'}), [self.low.id])
+        self.assertEqual(self.ids({'assignee': self.other.id}),
+                         [self.medium.id])
+        self.assertEqual(self.ids({'reviewer': 'none'}),
+                         [self.medium.id, self.low.id])
+        self.assertEqual(
+            self.ids({'due_date_after': '2030-01-11',
+                      'due_date_before': '2030-12-31'}),
+            [self.high.id]
+        )
+
+    def test_ordering(self):
+        """Test ordering by priority rank, title and nullable due date."""
+        self.assertEqual(self.ids({'ordering': '-priority'}),
+                         [self.high.id, self.medium.id, self.low.id])
+        self.assertEqual(self.ids({'ordering': 'title'}),
+                         [self.high.id, self.low.id, self.medium.id])
+        self.assertEqual(self.ids({'ordering': '-due_date'}),
+                         [self.high.id, self.low.id, self.medium.id])
+
+    def test_filters_apply_to_assigned_and_reviewing(self):
+        """Test the personal lists accept the same parameters."""
+        self.assertEqual(
+            self.ids({'status': 'done'}, '/api/tasks/assigned-to-me/'), []
+        )
+        self.assertEqual(
+            self.ids({'priority': 'high'}, '/api/tasks/reviewing/'),
+            [self.high.id]
+        )
+
+    def test_invalid_parameters_are_rejected(self):
+        """Test unknown values return 400 with an error message."""
+        for params in ({'status': 'blocked'}, {'ordering': 'secret'},
+                       {'fields': 'id,password'}, {'assignee': 'x'},
+                       {'due_date_after': 'soon'}):
+            response = self.client.get('/api/tasks/', params)
+            self.assertEqual(response.status_code,
+                             status.HTTP_400_BAD_REQUEST, params)
+            self.assertIn('error', response.data)
+
+    def test_ordering_with_cursor_pagination_is_rejected(self):
+        """Test ordering is not silently dropped by cursor pages."""
+        for params in ({'ordering': 'title', 'paginate': 'cursor'},
+                       {'ordering': '-priority', 'cursor': 'abc'}):
+            response = self.client.get('/api/tasks/', params)
+            self.assertEqual(response.status_code,
+                             status.HTTP_400_BAD_REQUEST, params)
+            self.assertIn('ordering', response.data['error'])
+        response = self.client.get('/api/tasks/reviewing/',
+                                   {'paginate': 'cursor'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_sparse_fieldset_prunes_fields_and_joins(self):
+        """Test fields limits the payload and skips joins and counts."""
+        board_ids_for(self.user)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/api/tasks/',
+                                       {'fields': 'id,title,status'})
+        self.assertEqual(response.data[0],
+                         {'id': self.medium.id, 'title': 'C medium',
+                          'status': 'review'})
+        self.assertEqual(len(queries), 1)
+        sql = queries[0]['sql']
+        self.assertNotIn('JOIN', sql)
+        self.assertNotIn('COUNT', sql)
+        self.assertNotIn('description', sql)
+
+    def test_sparse_fieldset_with_related_fields(self):
+        """Test related fields and counts are still loaded in one query."""
+        board_ids_for(self.user)
+        with self.assertNumQueries(1):
+            response = self.client.get(
+                '/api/tasks/', {'fields': 'id,assignee,comments_count'}
+            )
+        low = next(t for t in response.data if t['id'] == self.low.id)
+        self.assertEqual(low, {
+            'id': self.low.id,
+            'assignee': {'id': self.user.id, 'email': 'filter@test.de',
+                         'fullname': 'Filter'},
+            'comments_count': 1,
+        })
+
+
+class ReadPathTests(TestCase):
+    """Test the values() read path renders exactly like the serializers."""
+
+    def setUp(self):
+        """Create tasks with and without users, dates and comments."""
+        self.user = User.objects.create_user(
+            email='read@test.de', fullname='Reader Ü', password='pass'
+        )
+        self.board = Board.objects.create(title='Read', owner=self.user)
+        self.board.members.add(self.user)
+        self.full = Task.objects.create(
+            board=self.board, title='Full', description='Desc',
+            status='review', priority='high', assignee=self.user,
+            reviewer=self.user, due_date='2030-05-01', created_by=self.user
+        )
+        self.bare = Task.objects.create(
+            board=self.board, title='Bare', status='to-do',
+            priority='low', created_by=self.user
+        )
+        Comment.objects.create(task=self.full, author=self.user,
+                               content='First')
+        Comment.objects.create(task=self.full, author=self.user,
+                               content='Second')
+
+    def render(self, data):
+        """Return data rendered by the default JSON renderer."""
+        return JSONRenderer().render(data)
+
+    def test_task_rows_match_task_serializer(self):
+        """Test full and sparse task output is byte-identical."""
+        for fields in (None, ['id', 'title'],
+                       ['assignee', 'due_date', 'comments_count', 'board']):
+            query = TaskListQuery(
+                {} if fields is None else {'fields': ','.join(fields)},
+                self.user
+            )
+            queryset = query.apply(Task.objects.with_related())
+            expected = [
+                {key: value for key, value in item.items()
+                 if fields is None or key in fields}
+                for item in TaskSerializer(list(queryset), many=True).data
+            ]
+            actual = task_data(task_values(queryset, fields), fields)
+            self.assertEqual(self.render(actual), self.render(expected))
+
+    def test_comment_rows_match_comment_serializer(self):
+        """Test comment output, including timestamps, is byte-identical."""
+        comments = self.full.comments.select_related('author')
+        expected = CommentSerializer(comments, many=True).data
+        actual = comment_data(comment_values(self.full.comments.all()))
+        self.assertEqual(self.render(actual), self.render(expected))
+
+    def test_board_detail_matches_board_detail_serializer(self):
+        """Test board detail output is byte-identical."""
+        board = Board.objects.with_detail().get(pk=self.board.pk)
+        expected = BoardDetailSerializer(board).data
+        tasks = Task.objects.with_related().filter(
+            board=self.board
+        ).order_by('-id')
+        actual = board_detail_data(self.board, tasks)
+        self.assertEqual(self.render(actual), self.render(expected))
+
+    def test_bench_serializers_reports_identical_output(self):
+        """Test the serializer benchmark compares equal bodies."""
+        out = StringIO()
+        call_command('bench_serializers', tasks=20, repeat=1, stdout=out)
+        results = json.loads(out.getvalue())
+        self.assertTrue(results['identical'])
+        self.assertEqual(User.objects.count(), 1)
+
+
+class FastJSONTests(TestCase):
+    """Test the fast JSON renderer and parser match DRF's."""
+
+    payload = {
+        'id': 1,
+        'title': 'Zo\u00eb \u2013 line\u2028break\u2029',
+        'when': datetime.datetime(2030, 1, 2, 3, 4, 5, 123456,
+                                  tzinfo=datetime.timezone.utc),
+        'naive': datetime.datetime(2030, 1, 2, 3, 4, 5),
+        'offset': datetime.datetime(
+            2030, 1, 2, 3, 4, tzinfo=datetime.timezone(
+                datetime.timedelta(hours=2)
+            )
+        ),
+        'day': datetime.date(2030, 1, 2),
+        'amount': Decimal('12.50'),
+        'lazy': gettext_lazy('This field is required.'),
+        'nested': [{'a': None, 'b': True, 2: 1.5}],
+        'huge': 2 ** 70,
+    }
+
+    def test_renderer_output_matches_json_renderer(self):
+        """Test rendered bytes are identical to JSONRenderer."""
+        expected = JSONRenderer().render(self.payload)
+        self.assertEqual(FastJSONRenderer().render(self.payload), expected)
+        small = {k: v for k, v in self.payload.items() if k != 'huge'}
+        self.assertEqual(FastJSONRenderer().render(small),
+                         JSONRenderer().render(small))
+
+    @skipUnless(orjson, 'orjson is not installed')
+    def test_renderer_floats_are_equivalent_json(self):
+        """Test floats keep their values, and non-finite ones are null."""
+        data = {'score': 1e-05, 'big': 1e16, 'plain': 0.25}
+        rendered = FastJSONRenderer().render(data)
+        self.assertEqual(json.loads(rendered), data)
+        self.assertEqual(rendered,
+                         b'{"score":0.00001,"big":1e16,"plain":0.25}')
+        self.assertEqual(FastJSONRenderer().render({'x': float('nan')}),
+                         b'{"x":null}')
+
+    def test_renderer_falls_back_without_orjson_and_for_indent(self):
+        """Test stdlib rendering without orjson or when indenting."""
+        with mock.patch('core.renderers.orjson', None):
+            self.assertEqual(FastJSONRenderer().render(self.payload),
+                             JSONRenderer().render(self.payload))
+        media_type = 'application/json; indent=4'
+        self.assertEqual(
+            FastJSONRenderer().render(self.payload, media_type),
+            JSONRenderer().render(self.payload, media_type)
+        )
+
+    def test_parser_matches_json_parser(self):
+        """Test parsed data and errors match JSONParser."""
+        body = json.dumps(self.payload, default=str).encode()
+        self.assertEqual(
+            FastJSONParser().parse(BytesIO(body)),
+            JSONParser().parse(BytesIO(body))
+        )
+        for bad in (b'{"a": NaN}', b'{"a": '):
+            with self.assertRaises(ParseError) as fast:
+                FastJSONParser().parse(BytesIO(bad))
+            with self.assertRaises(ParseError) as stock:
+                JSONParser().parse(BytesIO(bad))
+            self.assertEqual(str(fast.exception), str(stock.exception))
+
+    def test_bench_renderers_reports_identical_output(self):
+        """Test the renderer benchmark compares equal bodies."""
+        out = StringIO()
+        call_command('bench_renderers', tasks=5, iterations=1, stdout=out)
+        self.assertTrue(json.loads(out.getvalue())['identical'])
+
+
+class BoardExportTests(TestCase):
+    """Test the streaming NDJSON board export."""
+
+    def setUp(self):
+        """Create a board with a member, tasks and comments."""
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email='export@test.de', fullname='Exporter', password='pass'
+        )
+        self.member = User.objects.create_user(
+            email='member@test.de', fullname='Member', password='pass'
+        )
+        self.board = Board.objects.create(title='Export', owner=self.user)
+        self.board.members.add(self.user, self.member)
+        self.task = Task.objects.create(
+            board=self.board, title='T1', status='to-do', priority='low',
+            assignee=self.member, due_date='2030-03-04',
+            created_by=self.user
+        )
+        Task.objects.create(
+            board=self.board, title='T2', status='done', priority='high',
+            created_by=self.member
+        )
+        Comment.objects.create(task=self.task, author=self.member,
+                               content='Hi')
+        self.client.force_authenticate(user=self.user)
+
+    def records(self, content):
+        """Return decoded NDJSON records."""
+        return [json.loads(line) for line in content.splitlines()]
+
+    def test_export_streams_board_members_tasks_and_comments(self):
+        """Test the export streams every record as one NDJSON line."""
+        response = self.client.get(f'/api/boards/{self.board.id}/export/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        records = self.records(b''.join(response.streaming_content))
+        self.assertEqual(
+            [record['type'] for record in records],
+            ['board', 'member', 'member', 'task', 'task', 'comment']
+        )
+        self.assertEqual(records[0]['owner'], 'export@test.de')
+        self.assertEqual(records[3], {
+            'type': 'task', 'board_id': self.board.id, 'id': self.task.id,
+            'title': 'T1', 'description': '', 'status': 'to-do',
+            'priority': 'low', 'due_date': '2030-03-04',
+            'assignee': 'member@test.de', 'reviewer': None,
+            'created_by': 'export@test.de',
+        })
+        self.assertEqual(records[5]['author'], 'member@test.de')
+
+    def test_export_query_count_is_constant(self):
+        """Test the export issues one query per record type."""
+        board_ids_for(self.user)
+        for count in (0, 30):
+            Task.objects.bulk_create([
+                Task(board=self.board, title='Bulk', status='to-do',
+                     priority='low', created_by=self.user)
+                for _ in range(count)
+            ])
+            with self.assertNumQueries(5):
+                response = self.client.get(
+                    f'/api/boards/{self.board.id}/export/'
+                )
+                b''.join(response.streaming_content)
+
+    def test_export_requires_membership(self):
+        """Test non-members cannot export and missing boards are 404."""
+        outsider = User.objects.create_user(
+            email='out@test.de', fullname='Out', password='pass'
+        )
+        self.client.force_authenticate(user=outsider)
+        response = self.client.get(f'/api/boards/{self.board.id}/export/')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        response = self.client.get('/api/boards/9999/export/')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_async_batches_match_sync_batches(self):
+        """Test the ASGI iterator yields the same bytes."""
+        boards = Board.objects.filter(pk=self.board.pk)
+        sync_body = b''.join(export._batches(export.board_lines(boards)))
+
+        async def collect():
+            lines = export.board_lines(boards)
+            return b''.join([b async for b in export._async_batches(lines)])
+
+        self.assertEqual(async_to_sync(collect)(), sync_body)
+
+    def test_export_boards_command_writes_many_boards(self):
+        """Test the command exports several boards to one file."""
+        other = Board.objects.create(title='Other', owner=self.user)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'boards.ndjson')
+            call_command('export_boards', '--owner', 'export@test.de',
+                         output=path, stderr=StringIO())
+            with open(path, 'rb') as handle:
+                records = self.records(handle.read())
+        boards = [r['id'] for r in records if r['type'] == 'board']
+        self.assertEqual(boards, [self.board.id, other.id])
+        with self.assertRaises(CommandError):
+            call_command('export_boards', stderr=StringIO())
+
+
+class BoardImportTests(TestCase):
+    """Test the chunked NDJSON and CSV board import."""
+
+    def setUp(self):
+        """Create a board to export and an importing user."""
+        self.client = APIClient()
+        self.owner = User.objects.create_user(
+            email='source@test.de', fullname='Source', password='pass'
+        )
+        self.member = User.objects.create_user(
+            email='member@test.de', fullname='Member', password='pass'
+        )
+        self.importer = User.objects.create_user(
+            email='import@test.de', fullname='Importer', password='pass'
+        )
+        self.board = Board.objects.create(title='Source', owner=self.owner)
+        self.board.members.add(self.owner, self.member)
+        for index in range(5):
+            task = Task.objects.create(
+                board=self.board, title=f'T{index}', status='review',
+                priority='high', assignee=self.member,
+                due_date='2030-01-02', created_by=self.owner
+            )
+            Comment.objects.create(task=task, author=self.member,
+                                   content=f'C{index}')
+        self.client.force_authenticate(user=self.importer)
+
+    def export_body(self):
+        """Return the source board as NDJSON."""
+        boards = Board.objects.filter(pk=self.board.pk)
+        return b''.join(export.board_lines(boards))
+
+    def post(self, body, content_type):
+        """Post an import body."""
+        return self.client.post('/api/boards/import/', body,
+                                content_type=content_type)
+
+    def test_ndjson_round_trip_in_small_chunks(self):
+        """Test an export re-imports across chunk boundaries."""
+        importer = BoardImporter(self.importer, chunk_size=3,
+                                 keep_authors=True)
+        stats = importer.run(read_ndjson(self.export_body().splitlines()))
+        self.assertEqual(
+            (stats['boards'], stats['members'], stats['tasks'],
+             stats['comments'], stats['skipped']),
+            (1, 2, 5, 5, 0)
+        )
+        self.assertEqual(stats['rows'], 13)
+        self.assertGreater(stats['rows_per_second'], 0)
+        board = Board.objects.exclude(pk=self.board.pk).get()
+        self.assertEqual(board.owner, self.importer)
+        self.assertEqual(set(board.members.all()), {self.owner, self.member})
+        task = board.tasks.get(title='T3')
+        self.assertEqual(
+            (task.status, task.priority, task.assignee, task.created_by,
+             task.due_date),
+            ('review', 'high', self.member, self.owner,
+             datetime.date(2030, 1, 2))
+        )
+        comment = task.comments.get()
+        source = Comment.objects.get(task__board=self.board, content='C3')
+        self.assertEqual(
+            (comment.content, comment.author, comment.created_at),
+            ('C3', self.member, source.created_at)
+        )
+        # Only the current board's task ids are kept between chunks.
+        self.assertLessEqual(set(importer.tasks), {self.board.id})
+
+    def test_import_queries_scale_with_chunks_not_rows(self):
+        """Test each chunk costs a fixed number of queries."""
+        counts = []
+        for extra in (0, 50):
+            Task.objects.bulk_create([
+                Task(board=self.board, title='Bulk', status='to-do',
+                     priority='low', created_by=self.owner)
+                for _ in range(extra)
+            ])
+            lines = self.export_body().splitlines()
+            with CaptureQueriesContext(connection) as queries:
+                BoardImporter(self.importer, chunk_size=100).run(
+                    read_ndjson(lines)
+                )
+            counts.append(len(queries))
+        self.assertEqual(counts[0], counts[1])
+
+    def test_api_imports_ndjson_owned_by_request_user(self):
+        """Test the endpoint imports the stream and invalidates access."""
+        board_ids_for(self.member)
+        response = self.post(self.export_body(), 'application/x-ndjson')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['tasks'], 5)
+        self.assertIn('rows_per_second', response.data)
+        board = Board.objects.get(owner=self.importer)
+        self.assertIn(board.id, board_ids_for(self.member))
+
+    def test_api_attributes_tasks_and_comments_to_request_user(self):
+        """Test emails in the body cannot create content as other users."""
+        response = self.post(self.export_body(), 'application/x-ndjson')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        board = Board.objects.get(owner=self.importer)
+        self.assertEqual(
+            set(board.tasks.values_list('created_by', flat=True)),
+            {self.importer.id}
+        )
+        self.assertEqual(
+            set(Comment.objects.filter(task__board=board).values_list(
+                'author', flat=True
+            )),
+            {self.importer.id}
+        )
+        task = board.tasks.get(title='T0')
+        self.assertEqual(task.assignee, self.member)
+
+    def test_api_imports_csv_rows_and_reports_errors(self):
+        """Test CSV rows create boards by title and skip bad rows."""
+        body = (
+            'board,title,status,priority,assignee,due_date\n'
+            'Alpha,One,to-do,low,member@test.de,2030-05-06\n'
+            'Beta,Two,,,nobody@test.de,\n'
+            'Alpha,Three,bogus,low,,\n'
+            'Alpha,"Multi\nline",done,high,,\n'
+        )
+        response = self.post(body, 'text/csv')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            (response.data['boards'], response.data['tasks'],
+             response.data['skipped']),
+            (2, 3, 2)
+        )
+        self.assertEqual(
+            [error['line'] for error in response.data['errors']], [3, 4]
+        )
+        alpha = Board.objects.get(title='Alpha', owner=self.importer)
+        self.assertEqual(list(alpha.members.all()), [self.member])
+        self.assertEqual(
+            sorted(alpha.tasks.values_list('title', flat=True)),
+            ['Multi\nline', 'One']
+        )
+        two = Task.objects.get(title='Two')
+        self.assertEqual((two.status, two.priority, two.assignee),
+                         ('to-do', 'medium', None))
+
+    def test_api_accepts_uploaded_file(self):
+        """Test a multipart upload is imported by file name."""
+        upload = BytesIO(b'board,title\nGamma,Upload\n')
+        upload.name = 'tasks.csv'
+        response = self.client.post('/api/boards/import/', {'file': upload},
+                                    format='multipart')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertTrue(Task.objects.filter(title='Upload').exists())
+
+    def test_api_rejects_unsupported_and_empty_input(self):
+        """Test unknown media types are 415 and empty imports 400."""
+        response = self.client.post('/api/boards/import/', {},
+                                    format='json')
+        self.assertEqual(response.status_code,
+                         status.HTTP_415_UNSUPPORTED_MEDIA_TYPE)
+        response = self.post(b'not json\n', 'application/x-ndjson')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['errors'][0]['error'], 'Invalid JSON')
+
+    def test_api_imports_skip_unhashable_fields(self):
+        """Test list or object keys are skipped rows, not server errors."""
+        body = b'\n'.join([
+            b'{"type": ["board"], "id": 1, "title": "A"}',
+            b'{"type": "board", "id": [1], "title": "B"}',
+            b'{"type": "board", "id": 2, "title": "C"}',
+            b'{"type": "task", "board_id": 2, "title": "T", '
+            b'"status": ["a"]}',
+            b'{"type": "task", "board_id": {"id": 2}, "title": "T"}',
+            b'{"type": "comment", "task_id": [1], "content": "x"}',
+        ])
+        response = self.post(body, 'application/x-ndjson')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            (response.data['boards'], response.data['tasks'],
+             response.data['skipped']),
+            (1, 0, 5)
+        )
+        self.assertEqual(
+            [error['error'] for error in response.data['errors']],
+            ['type must be a string or number',
+             'id must be a string or number',
+             'status must be a string or number',
+             'board_id must be a string or number',
+             'task_id must be a string or number']
+        )
+
+    def test_import_boards_command_uses_record_owner(self):
+        """Test the command keeps owners by email and prints rows/s."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'boards.ndjson')
+            with open(path, 'wb') as handle:
+                handle.write(self.export_body())
+            out = StringIO()
+            call_command('import_boards', path, '--chunk-size', '4',
+                         stdout=out, stderr=StringIO())
+            self.assertIn('5 tasks', out.getvalue())
+            self.assertIn('rows/s', out.getvalue())
+            with self.assertRaises(CommandError):
+                call_command('import_boards', path, owner='no@test.de')
+        self.assertEqual(Board.objects.filter(owner=self.owner).count(), 2)
+        board = Board.objects.filter(owner=self.owner).latest('id')
+        self.assertEqual(
+            set(Comment.objects.filter(task__board=board).values_list(
+                'author', flat=True
+            )),
+            {self.member.id}
+        )
+
+
+class DashboardTests(TestCase):
+    """Test the personal dashboard counters."""
+
+    def setUp(self):
+        """Create boards with tasks in several states."""
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email='dash@test.de', fullname='Dash', password='pass'
+        )
+        self.other = User.objects.create_user(
+            email='other@test.de', fullname='Other', password='pass'
+        )
+        self.today = datetime.date(2030, 6, 10)
+        board = Board.objects.create(title='Mine', owner=self.user)
+        shared = Board.objects.create(title='Shared', owner=self.other)
+        shared.members.add(self.user)
+        hidden = Board.objects.create(title='Hidden', owner=self.other)
+        day = datetime.timedelta(days=1)
+        specs = [
+            (board, 'to-do', 'high', self.user, None, self.today - day),
+            (board, 'in-progress', 'low', self.user, None, self.today),
+            (board, 'done', 'high', self.user, None, self.today - day),
+            (shared, 'review', 'medium', self.other, self.user, None),
+            (shared, 'review', 'high', self.user, self.user,
+             self.today + 30 * day),
+            (shared, 'to-do', 'low', None, None, None),
+            (hidden, 'to-do', 'high', self.user, self.user,
+             self.today - day),
+        ]
+        Task.objects.bulk_create([
+            Task(board=b, title='T', status=s, priority=p, assignee=a,
+                 reviewer=r, due_date=d, created_by=self.other)
+            for b, s, p, a, r, d in specs
+        ])
+        self.client.force_authenticate(user=self.user)
+
+    def test_dashboard_counts_visible_tasks(self):
+        """Test counts cover only the user's boards."""
+        with mock.patch('django.utils.timezone.localdate',
+                        return_value=self.today):
+            response = self.client.get('/api/dashboard/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {
+            'board_count': 2,
+            'task_count': 6,
+            'assigned_to_me': {
+                'total': 4,
+                'by_status': {'to-do': 1, 'in-progress': 1,
+                              'review': 1, 'done': 1},
+                'high_priority': 2,
+            },
+            'awaiting_my_review': 2,
+            'overdue': 1,
+            'due_soon': 1,
+        })
+
+    def test_dashboard_is_one_aggregate_query(self):
+        """Test the counters take one query once access is cached."""
+        board_ids_for(self.user)
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/dashboard/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_dashboard_without_boards_skips_the_query(self):
+        """Test a user without boards gets zeros."""
+        loner = User.objects.create_user(
+            email='loner@test.de', fullname='Loner', password='pass'
+        )
+        self.client.force_authenticate(user=loner)
+        board_ids_for(loner)
+        with self.assertNumQueries(0):
+            response = self.client.get('/api/dashboard/')
+        self.assertEqual(response.data['task_count'], 0)
+        self.assertEqual(response.data['assigned_to_me']['by_status'],
+                         {'to-do': 0, 'in-progress': 0, 'review': 0,
+                          'done': 0})
+
+
+class BoardCounterTests(TestCase):
+    """Test the denormalized board counters stay exact."""
+
+    def setUp(self):
+        """Create a board with two members."""
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email='count@test.de', fullname='Count', password='pass'
+        )
+        self.member = User.objects.create_user(
+            email='counted@test.de', fullname='Counted', password='pass'
+        )
+        self.board = Board.objects.create(title='Count', owner=self.user)
+        self.board.members.add(self.user, self.member)
+        self.client.force_authenticate(user=self.user)
+
+    def counters(self, board=None):
+        """Return the board's counters and assert they match a recount."""
+        board = Board.objects.with_counts().get(pk=(board or self.board).pk)
+        for field in stats.FIELDS:
+            self.assertEqual(getattr(board, field),
+                             getattr(board, f'counted_{field}'), field)
+        return {field: getattr(board, field) for field in stats.FIELDS
+                if getattr(board, field)}
+
+    def create_task(self, **data):
+        """Create a task through the API and return its id."""
+        payload = {'board': self.board.id, 'title': 'T', 'status': 'to-do',
+                   'priority': 'low', **data}
+        response = self.client.post('/api/tasks/', payload, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return response.data['id']
+
+    def test_stale_board_save_keeps_counters_and_version(self):
+        """Test a full save of a stale board keeps counters and version."""
+        stale = Board.objects.get(pk=self.board.pk)
+        for _ in range(3):
+            self.create_task()
+        version = Board.objects.get(pk=self.board.pk).version
+        stale.title = 'Renamed'
+        stale.save()
+        self.assertEqual(self.counters(), {
+            'member_count': 2, 'ticket_count': 3, 'tasks_to_do_count': 3,
+            'tasks_low_prio_count': 3,
+        })
+        self.assertEqual(Board.objects.get(pk=self.board.pk).version,
+                         version + 1)
+
+    def test_deleting_member_user_recounts_and_logs(self):
+        """Test a deleted user leaves their boards counted and synced."""
+        other = Board.objects.create(title='Owned', owner=self.member)
+        other.members.add(self.member)
+        version = Board.objects.get(pk=self.board.pk).version
+        member_id = self.member.id
+        self.member.delete()
+        self.assertEqual(self.counters(), {'member_count': 1})
+        self.assertEqual(stats.stale_board_ids([self.board.id]), [])
+        response = self.client.get(
+            f'/api/boards/{self.board.id}/changes/?since={version}'
+        )
+        self.assertEqual(response.data['version'], version + 1)
+        self.assertEqual(response.data['members']['deleted'], [member_id])
+
+    def test_task_create_update_move_and_delete(self):
+        """Test counters follow single task writes."""
+        task_id = self.create_task(status='review', priority='high')
+        self.create_task()
+        self.assertEqual(self.counters(), {
+            'member_count': 2, 'ticket_count': 2, 'tasks_review_count': 1,
+            'tasks_to_do_count': 1, 'tasks_high_prio_count': 1,
+            'tasks_low_prio_count': 1,
+        })
+        self.client.patch(f'/api/tasks/{task_id}/',
+                          {'status': 'done', 'priority': 'medium'},
+                          format='json')
+        self.assertEqual(self.counters()['tasks_done_count'], 1)
+        other = Board.objects.create(title='Other', owner=self.user)
+        task = Task.objects.get(pk=task_id)
+        task.board = other
+        task.save()
+        self.assertEqual(self.counters()['ticket_count'], 1)
+        self.assertEqual(self.counters(other)['tasks_done_count'], 1)
+        response = self.client.delete(f'/api/tasks/{task_id}/')
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(self.counters(other), {})
+
+    def test_deferred_task_save_recounts(self):
+        """Test saving a task loaded without status still recounts."""
+        task_id = self.create_task()
+        task = Task.objects.only('id', 'board_id').get(pk=task_id)
+        task.status = 'done'
+        task.save()
+        self.assertEqual(self.counters()['tasks_done_count'], 1)
+
+    def test_bulk_paths_and_membership_changes(self):
+        """Test batch, move, member and cascade paths keep counts."""
+        ids = [self.create_task() for _ in range(3)]
+        response = self.client.post('/api/tasks/batch/', [
+            {'op': 'create', 'data': {'board': self.board.id, 'title': 'N',
+                                      'status': 'review',
+                                      'priority': 'medium'}},
+            {'op': 'update', 'id': ids[0], 'data': {'priority': 'high'}},
+            {'op': 'delete', 'id': ids[1]},
+        ], format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.counters()
+        self.client.post(f'/api/boards/{self.board.id}/tasks/move/',
+                         {'task_ids': ids, 'status': 'in-progress'},
+                         format='json')
+        self.assertEqual(self.counters()['tasks_in_progress_count'], 2)
+        self.board.members.remove(self.member, self.outsider())
+        self.assertEqual(self.counters()['member_count'], 1)
+        self.user.boards.clear()
+        self.assertNotIn('member_count', self.counters())
+        self.user.created_tasks.filter(pk=ids[0]).delete()
+        self.assertEqual(self.counters()['ticket_count'], 2)
+
+    def outsider(self):
+        """Return a user who is not a member of the board."""
+        return User.objects.create_user(
+            email='never@test.de', fullname='Never', password='pass'
+        )
+
+    def test_board_list_reads_counter_columns(self):
+        """Test the list serves the stored counters."""
+        self.create_task(priority='high')
+        Board.objects.filter(pk=self.board.pk).update(ticket_count=42)
+        board_ids_for(self.user)
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/boards/')
+        self.assertEqual(response.data[0]['ticket_count'], 42)
+        self.assertEqual(response.data[0]['tasks_high_prio_count'], 1)
+
+    def test_recompute_board_stats_repairs_drift(self):
+        """Test the command reports and repairs drifted counters."""
+        self.create_task()
+        Board.objects.filter(pk=self.board.pk).update(
+            ticket_count=7, member_count=0
+        )
+        with self.assertRaises(CommandError):
+            call_command('recompute_board_stats', '--check',
+                         stdout=StringIO())
+        out = StringIO()
+        call_command('recompute_board_stats', str(self.board.id),
+                     stdout=out)
+        self.assertIn('Repaired 1', out.getvalue())
+        self.assertEqual(self.counters()['ticket_count'], 1)
+        call_command('recompute_board_stats', '--check', stdout=StringIO())
+
+    def test_import_and_seed_set_counters(self):
+        """Test bulk inserts from import and seeding are counted."""
+        body = (
+            'board,title,status,assignee\n'
+            'Imported,A,done,counted@test.de\n'
+            'Imported,B,review,\n'
+        )
+        response = self.client.post('/api/boards/import/', body,
+                                    content_type='text/csv')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        imported = Board.objects.get(title='Imported')
+        self.assertEqual(self.counters(imported)['ticket_count'], 2)
+        call_command('seed_kanban', users=5, boards=3, tasks=40,
+                     prefix='counted', stdout=StringIO())
+        for board in Board.objects.filter(
+            owner__email__startswith='counted-'
+        ):
+            self.counters(board)
+
+
+class CommentCountTests(TestCase):
+    """Test the denormalized Task.comments_count column."""
+
+    def setUp(self):
+        """Create a task on a board with two members."""
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email='cc@test.de', fullname='CC', password='pass'
+        )
+        self.author = User.objects.create_user(
+            email='author@test.de', fullname='Author', password='pass'
+        )
+        self.board = Board.objects.create(title='CC', owner=self.user)
+        self.board.members.add(self.user, self.author)
+        self.task = Task.objects.create(
+            board=self.board, title='T', status='to-do', priority='low',
+            created_by=self.user
+        )
+        self.client.force_authenticate(user=self.user)
+
+    def count(self):
+        """Return the stored count, asserting it matches the rows."""
+        self.task.refresh_from_db(fields=['comments_count'])
+        self.assertEqual(self.task.comments_count,
+                         self.task.comments.count())
+        return self.task.comments_count
+
+    def test_comment_views_keep_the_count(self):
+        """Test posting and deleting comments adjusts the column."""
+        url = f'/api/tasks/{self.task.id}/comments/'
+        ids = [self.client.post(url, {'content': str(index)},
+                                format='json').data['id']
+               for index in range(3)]
+        self.assertEqual(self.count(), 3)
+        response = self.client.delete(f'{url}{ids[0]}/')
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(self.count(), 2)
+        response = self.client.get(f'/api/tasks/{self.task.id}/')
+        self.assertEqual(response.data['comments_count'], 2)
+
+    def test_cascades_and_task_saves_keep_the_count(self):
+        """Test author deletion decrements and task saves don't clobber."""
+        stale = Task.objects.get(pk=self.task.pk)
+        Comment.objects.create(task=self.task, author=self.author,
+                               content='A')
+        Comment.objects.create(task=self.task, author=self.user,
+                               content='B')
+        stale.title = 'Renamed'
+        stale.save()
+        self.assertEqual(self.count(), 2)
+        self.author.delete()
+        self.assertEqual(self.count(), 1)
+        self.board.delete()
+        self.assertFalse(Task.objects.filter(pk=self.task.pk).exists())
+
+    def test_task_lists_read_the_column(self):
+        """Test list queries no longer join or count comments."""
+        Comment.objects.create(task=self.task, author=self.user,
+                               content='A')
+        board_ids_for(self.user)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/api/tasks/',
+                                       {'fields': 'id,comments_count'})
+        self.assertEqual(response.data[0]['comments_count'], 1)
+        sql = ' '.join(query['sql'] for query in queries)
+        self.assertNotIn('kanban_app_comment', sql)
+        self.assertNotIn('COUNT(', sql)
+
+    def test_recompute_comment_counts_repairs_drift(self):
+        """Test the consistency check reports and fixes drift."""
+        Comment.objects.create(task=self.task, author=self.user,
+                               content='A')
+        Task.objects.filter(pk=self.task.pk).update(comments_count=5)
+        with self.assertRaises(CommandError):
+            call_command('recompute_comment_counts', '--check',
+                         stdout=StringIO())
+        out = StringIO()
+        call_command('recompute_comment_counts', board=[self.board.id],
+                     stdout=out)
+        self.assertIn('Repaired 1', out.getvalue())
+        self.assertEqual(self.count(), 1)
+
+    def test_import_counts_imported_comments(self):
+        """Test bulk-imported comments are counted on their tasks."""
+        Comment.objects.create(task=self.task, author=self.author,
+                               content='A')
+        lines = b''.join(export.board_lines(
+            Board.objects.filter(pk=self.board.pk)
+        )).splitlines()
+        BoardImporter(self.user).run(read_ndjson(lines))
+        copy = Task.objects.exclude(pk=self.task.pk).get()
+        self.assertEqual(copy.comments_count, 1)
+
+
+class CommentPaginationTests(TestCase):
+    """Test suite for keyset comment pagination and the latest mode."""
+
+    def setUp(self):
+        """Set up a task with comments sharing timestamps."""
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email='test@test.de',
+            fullname='Test User',
+            password='test1234'
+        )
+        self.other = User.objects.create_user(
+            email='other@test.de',
+            fullname='Other',
+            password='test1234'
+        )
+        self.client.force_authenticate(user=self.user)
+        board = Board.objects.create(title='Board', owner=self.user)
+        self.task = Task.objects.create(
+            board=board, title='Task', status='to-do', priority='low',
+            created_by=self.user
+        )
+        comments = [
+            Comment.objects.create(
+                task=self.task, author=(self.user, self.other)[index % 2],
+                content=f'Comment {index}'
+            )
+            for index in range(7)
+        ]
+        # Pairs of equal timestamps must be ordered by id.
+        start = timezone.now() - datetime.timedelta(hours=1)
+        for index, comment in enumerate(comments):
+            comment.created_at = start + datetime.timedelta(
+                minutes=index // 2
+            )
+        Comment.objects.bulk_update(comments, ['created_at'])
+        self.ids = [comment.id for comment in comments]
+        self.url = f'/api/tasks/{self.task.id}/comments/'
+
+    def get(self, url):
+        """Return the data of a successful GET."""
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def test_pages_forward_and_back(self):
+        """Test next and previous links walk the same keyset order."""
+        page = self.get(f'{self.url}?paginate=cursor&page_size=3')
+        self.assertIsNone(page['previous'])
+        ids = []
+        pages = []
+        while True:
+            pages.append(page)
+            ids.extend(item['id'] for item in page['results'])
+            if not page['next']:
+                break
+            page = self.get(page['next'])
+        self.assertEqual(ids, self.ids)
+        self.assertEqual(len(pages), 3)
+        back = self.get(pages[-1]['previous'])
+        self.assertEqual([item['id'] for item in back['results']],
+                         self.ids[3:6])
+        self.assertEqual(back['next'], pages[1]['next'])
+        first = self.get(back['previous'])
+        self.assertEqual([item['id'] for item in first['results']],
+                         self.ids[:3])
+        self.assertIsNone(first['previous'])
+
+    def test_latest_mode(self):
+        """Test latest returns the newest comments oldest first."""
+        page = self.get(f'{self.url}?latest=2')
+        self.assertEqual([item['id'] for item in page['results']],
+                         self.ids[-2:])
+        self.assertEqual(page['results'][0]['author'], 'Other')
+        self.assertIsNone(page['next'])
+        older = self.get(f'{page["previous"]}&page_size=5')
+        self.assertEqual([item['id'] for item in older['results']],
+                         self.ids[:5])
+        self.assertIsNone(older['previous'])
+        self.assertIsNotNone(older['next'])
+
+    def test_invalid_cursor_and_latest(self):
+        """Test bad cursors are 404 and non-positive latest is ignored."""
+        response = self.client.get(f'{self.url}?cursor=bogus')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        page = self.get(f'{self.url}?latest=0&paginate=cursor&page_size=7')
+        self.assertEqual([item['id'] for item in page['results']],
+                         self.ids)
+        self.assertEqual(len(self.get(f'{self.url}?latest=x')), 7)
+
+    def test_page_queries_do_not_grow(self):
+        """Test a page costs the same queries however deep it is."""
+        with CaptureQueriesContext(connection) as first:
+            page = self.get(f'{self.url}?paginate=cursor&page_size=2')
+        deep_url = self.get(page['next'])['next']
+        with CaptureQueriesContext(connection) as deep:
+            self.get(deep_url)
+        self.assertEqual(len(deep), len(first))
+        sql = deep.captured_queries[-1]['sql']
+        self.assertIn('JOIN "auth_app_user"', sql)
+        self.assertNotIn('OFFSET', sql)
+
+    def test_str_does_not_query_author(self):
+        """Test Comment.__str__ only names a loaded author."""
+        comment = Comment.objects.get(pk=self.ids[0])
+        with self.assertNumQueries(0):
+            self.assertEqual(str(comment), f'Comment by user {self.user.id}')
+        comment = Comment.objects.select_related('author').get(
+            pk=self.ids[0]
+        )
+        self.assertEqual(str(comment), 'Comment by Test User')